@@ -0,0 +1,207 @@
+"""
+Runs the benchmarks against a local :class:`FakeEmmaServer`, optionally
+storing the results and comparing them with an earlier run (Python 3.7+)
+
+Usage::
+
+    $ python -m benchmarks.run --members 20000 --latency 0.02 --save v0.3
+    $ python -m benchmarks.run --members 20000 --latency 0.02 --compare v0.3
+"""
+
+import argparse
+from datetime import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.server import FakeEmmaServer, make_member
+from emma import get_report
+from emma.adapter.codec import default_codec
+from emma.adapter.requests_adapter import RequestsAdapter
+from emma.adapter.scheduler import RequestScheduler
+from emma.enumerations import Report
+from emma.model.account import Account
+from emma.model.member import Member, MemberRecord
+
+
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def account_for(server, max_workers=None, compress_threshold=None):
+    """An account whose adapter talks to the fake server, unthrottled"""
+    account = Account(FakeEmmaServer.ACCOUNT_ID, "xxx", "yyy")
+    account.adapter.close()
+    account.adapter = RequestsAdapter(
+        {"account_id": FakeEmmaServer.ACCOUNT_ID,
+         "public_key": "xxx",
+         "private_key": "yyy"},
+        max_workers=max_workers,
+        scheduler=RequestScheduler(rate=0, max_retries=0),
+        compress_threshold=compress_threshold)
+    account.adapter.url = server.url
+    return account
+
+
+def bench_fetch_all(server, options):
+    # A fresh account each run, as fetch_all keeps what it fetched
+    return lambda: len(account_for(server, options.workers).members.fetch_all())
+
+
+def bench_paginated_get(server, options):
+    account = account_for(server, options.workers)
+    return lambda: len(account.adapter.paginated_get('/groups/1/members'))
+
+
+def bench_members_save(server, options):
+    account = account_for(server, options.workers, options.compress)
+    raw = [make_member(x) for x in range(1, options.members + 1)]
+
+    def run():
+        members = [account.members.factory(
+            {'email': x['email'], 'fields': dict(x['fields'])}) for x in raw]
+        return len(account.members.bulk_save(members))
+    return run
+
+
+def bench_get_report(server, options):
+    account = account_for(server, options.workers)
+    return lambda: len(get_report(account, Report.OpenList, 1))
+
+
+def bench_member_hydration(server, options):
+    account = account_for(server)
+    raw = [make_member(x) for x in range(1, options.members + 1)]
+    return lambda: len([Member(account, dict(x, fields=dict(x['fields'])))
+                        for x in raw])
+
+
+def bench_record_hydration(server, options):
+    account = account_for(server)
+    raw = [make_member(x) for x in range(1, options.members + 1)]
+    return lambda: len([MemberRecord(account, dict(x, fields=dict(x['fields'])))
+                        for x in raw])
+
+
+def bench_codec(server, options):
+    codec = default_codec()
+    page = codec.dumps([make_member(x) for x in range(1, 501)])
+    body = {'members': [make_member(x)['fields'] for x in range(1, options.members + 1)]}
+    return lambda: (len(codec.loads(page)), len(codec.dumps(body)))
+
+
+BENCHMARKS = (
+    ('fetch_all', bench_fetch_all),
+    ('paginated_get', bench_paginated_get),
+    ('members_save', bench_members_save),
+    ('get_report', bench_get_report),
+    ('member_hydration', bench_member_hydration),
+    ('record_hydration', bench_record_hydration),
+    ('codec', bench_codec)
+)
+
+
+def measure(func, repeat):
+    """Time a function, once to warm up and then `repeat` times"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'runs': repeat
+    }
+
+
+def revision():
+    """The git revision being measured, if known"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(RESULTS),
+            stderr=subprocess.DEVNULL).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(options):
+    """Run the selected benchmarks, producing a result document"""
+    results = {}
+    with FakeEmmaServer(options.members, latency=options.latency) as server:
+        for name, setup in BENCHMARKS:
+            if options.only and name not in options.only:
+                continue
+            before = server.requests
+            timing = measure(setup(server, options), options.repeat)
+            timing['requests'] = (server.requests - before) // (options.repeat + 1)
+            results[name] = timing
+            print("%-18s %9.4fs median %9.4fs min %6d requests" % (
+                name, timing['median'], timing['min'], timing['requests']))
+    return {
+        'created': datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        'revision': revision(),
+        'python': platform.python_version(),
+        'options': {
+            'members': options.members,
+            'latency': options.latency,
+            'workers': options.workers,
+            'compress': options.compress,
+            'repeat': options.repeat
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline):
+    """Print the change in median time of each benchmark"""
+    if current['options'] != baseline['options']:
+        print("Warning: the baseline was run with %s" % baseline['options'])
+    for name, timing in sorted(current['results'].items()):
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        print("%-18s %9.4fs -> %9.4fs  %+6.1f%%" % (
+            name, before['median'], timing['median'],
+            100.0 * (timing['median'] - before['median']) / before['median']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--members', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="seconds the fake server waits per request")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="the adapter's number of concurrent requests")
+    parser.add_argument('--compress', type=int, default=None, metavar='BYTES',
+                        help="gzip request bodies of at least this size")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='*', choices=[x[0] for x in BENCHMARKS])
+    parser.add_argument('--save', metavar='NAME',
+                        help="store the results in benchmarks/results/NAME.json")
+    parser.add_argument('--compare', metavar='NAME',
+                        help="compare with benchmarks/results/NAME.json")
+    options = parser.parse_args(argv)
+
+    current = run(options)
+    if options.compare:
+        with open(os.path.join(RESULTS, options.compare + '.json')) as stored:
+            compare(current, json.load(stored))
+    if options.save:
+        if not os.path.isdir(RESULTS):
+            os.makedirs(RESULTS)
+        with open(os.path.join(RESULTS, options.save + '.json'), 'w') as stored:
+            json.dump(current, stored, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+A local stand-in for the Emma API, serving generated accounts over HTTP so
+the client can be measured without the network or rate limits
+"""
+
+from datetime import datetime, timedelta
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+
+REPORTS = ('sends', 'in_progress', 'deliveries', 'opens', 'links', 'clicks',
+           'forwards', 'optouts', 'signups', 'shares', 'customer_shares',
+           'customer_share_clicks')
+EPOCH = datetime(2013, 1, 1)
+
+
+def serialized(moment):
+    """An Emma serialized datetime"""
+    return moment.strftime("@D:%Y-%m-%dT%H:%M:%S")
+
+
+def make_member(member_id):
+    """A member shaped (and sized) like those the API returns"""
+    joined = EPOCH + timedelta(minutes=member_id * 7)
+    return {
+        'member_id': member_id,
+        'account_id': 100,
+        'email': "member%s@example.com" % member_id,
+        'status': "active",
+        'member_status_id': "a",
+        'plaintext_preferred': False,
+        'email_error': None,
+        'member_since': serialized(joined),
+        'last_modified_at': serialized(joined + timedelta(days=3)),
+        'deleted_at': None,
+        'fields': {
+            'first_name': "First%s" % member_id,
+            'last_name': "Last%s" % member_id,
+            'city': "Nashville",
+            'postal_code': "%05d" % (member_id % 100000),
+            'birthday': "@D:1980-%02d-%02dT00:00:00" % (
+                member_id % 12 + 1, member_id % 28 + 1),
+            'interests': ["music", "food"][:member_id % 3]
+        }
+    }
+
+
+def make_response(member_id, mailing_id):
+    """A row of a response report"""
+    return {
+        'member_id': member_id,
+        'mailing_id': mailing_id,
+        'email': "member%s@example.com" % member_id,
+        'timestamp': serialized(EPOCH + timedelta(seconds=member_id * 13)),
+        'delivery_type': "d",
+        'fields': {'first_name': "First%s" % member_id}
+    }
+
+
+class FakeEmmaServer(object):
+    """
+    Serves a generated account on a local port in a background thread.
+    Every response is delayed by `latency` seconds, to stand in for the
+    round trip to the real API.
+
+    Implements paged `/members`, `/groups/{id}/members` and
+    `/response/{id}/{report}` listings (honoring `start`, `end` and `count`),
+    `/members/{id}`, `/fields`, `/response/{id}` summaries and member
+    imports (`POST /members`). Responses of at least :attr:`GZIP_MIN_SIZE`
+    bytes are gzipped for clients which accept it, and gzipped request
+    bodies are accepted.
+
+    :param members: The number of members in the account
+    :type members: :class:`int`
+    :param groups: The number of groups, each holding every nth member
+    :type groups: :class:`int`
+    :param latency: Seconds to wait before each response
+    :type latency: :class:`float`
+    :param port: The port to listen on (any free port by default)
+    :type port: :class:`int`
+
+    Usage::
+
+        >>> from benchmarks.server import FakeEmmaServer
+        >>> with FakeEmmaServer(members=5000, latency=0.02) as server:
+        ...     adptr.url = server.url
+    """
+    ACCOUNT_ID = 100
+    PAGE_SIZE = 500
+    GZIP_MIN_SIZE = 1024
+
+    def __init__(self, members=10000, groups=10, latency=0.0, port=0):
+        self.members = [make_member(x) for x in range(1, members + 1)]
+        self.groups = groups
+        self.latency = latency
+        self.imports = []
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self.server.daemon_threads = True
+        self.server.fake = self
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+
+    @property
+    def url(self):
+        """The adapter URL of the fake account"""
+        return "http://127.0.0.1:%s/%s" % (
+            self.server.server_address[1], self.__class__.ACCOUNT_ID)
+
+    def start(self):
+        """Starts serving"""
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and releases the port"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def handle(self, method, path, params, body):
+        """
+        Produces the status and content of a request
+
+        :rtype: :class:`tuple` of (status, content)
+        """
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if method == 'GET' and path == '/members':
+            return self._listing(self.members, params)
+        if method == 'POST' and path == '/members':
+            return self._import(body)
+        if method == 'GET' and path == '/fields':
+            return 200, [
+                {'field_id': x + 1, 'shortcut_name': name,
+                 'display_name': name.replace('_', ' ').title(),
+                 'field_type': "text", 'widget_type': "text"}
+                for x, name in enumerate(sorted(self.members[0]['fields']))
+            ] if self.members else []
+
+        match = re.match(r"^/members/(\d+)$", path)
+        if method == 'GET' and match:
+            member_id = int(match.group(1))
+            if not 0 < member_id <= len(self.members):
+                return 404, None
+            return 200, self.members[member_id - 1]
+
+        match = re.match(r"^/groups/(\d+)/members$", path)
+        if method == 'GET' and match:
+            group_id = int(match.group(1))
+            if not 0 < group_id <= self.groups:
+                return 404, None
+            return self._listing(self.members[group_id - 1::self.groups], params)
+
+        match = re.match(r"^/response/(\d+)(?:/(\w+))?$", path)
+        if method == 'GET' and match:
+            mailing_id = int(match.group(1))
+            report = match.group(2)
+            if report is None:
+                return 200, {'sent': len(self.members),
+                             'opened': len(self.members) // 3,
+                             'clicked': len(self.members) // 10}
+            if report not in REPORTS:
+                return 404, None
+            return self._listing(
+                [make_response(x['member_id'], mailing_id)
+                 for x in self.members[::REPORTS.index(report) + 1]],
+                params)
+
+        return 404, None
+
+    def _listing(self, rows, params):
+        """A page (or the count) of a listing"""
+        if params.get('count'):
+            return 200, len(rows)
+        start = int(params.get('start', 0))
+        end = int(params.get('end', self.__class__.PAGE_SIZE))
+        return 200, rows[start:min(end, start + self.__class__.PAGE_SIZE)]
+
+    def _import(self, body):
+        """Accept an import, as the API does, before processing it"""
+        data = json.loads(body or "null") or {}
+        if not isinstance(data.get('members'), list):
+            return 400, {'error': "members is required"}
+        with self._lock:
+            self.imports.append(len(data['members']))
+            import_id = len(self.imports)
+        return 200, {'import_id': import_id, 'status': "o"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the :class:`FakeEmmaServer`"""
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, method):
+        url = urlparse(self.path)
+        prefix = "/%s" % FakeEmmaServer.ACCOUNT_ID
+        path = url.path[len(prefix):] if url.path.startswith(prefix) else None
+        params = dict((x[0], x[1][-1]) for x in parse_qs(url.query).items())
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        if body and self.headers.get('Content-Encoding') == "gzip":
+            body = gzip.decompress(body)
+        body = body.decode('utf-8') if body else None
+
+        if path is None:
+            status, content = 404, None
+        else:
+            status, content = self.server.fake.handle(method, path, params, body)
+
+        payload = json.dumps(content).encode('utf-8')
+        gzipped = (len(payload) >= FakeEmmaServer.GZIP_MIN_SIZE and
+                   "gzip" in (self.headers.get('Accept-Encoding') or ""))
+        if gzipped:
+            payload = gzip.compress(payload, 6)
+        self.send_response(status)
+        self.send_header('Content-Type', "application/json")
+        if gzipped:
+            self.send_header('Content-Encoding', "gzip")
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def do_POST(self):
+        self._respond('POST')
+
+    def do_PUT(self):
+        self._respond('PUT')
+
+    def do_DELETE(self):
+        self._respond('DELETE')
+
+    def log_message(self, format, *args):
+        pass
@@ -1,6 +1,11 @@
 """Emma API Wrapper for Python"""
 from .enumerations import Report as r
 
+PAGINATED_REPORTS = (r.SentList, r.InProgressList, r.DeliveredList, r.OpenList,
+                     r.LinkList, r.ClickList, r.ForwardList, r.OptOutList,
+                     r.SignUpList, r.SharesList, r.CustomerSharesList,
+                     r.CustomerShareClicksList)
+
 
 def get_report(account, report, id=None, params=None):
     """
@@ -31,13 +36,56 @@ def get_report(account, report, id=None, params=None):
         >>> get_report(acct, Report.SentList, 123)
         [...]
     """
-    needs_pagination = report in (r.SentList, r.InProgressList, r.DeliveredList,
-                                  r.OpenList, r.LinkList, r.ClickList,
-                                  r.ForwardList, r.OptOutList, r.SignUpList,
-                                  r.SharesList, r.CustomerSharesList,
-                                  r.CustomerShareClicksList)
     params = params if params else {}
-    path = {
+    path = report_path(report, id)
+    return (account.adapter.paginated_get(path, params)
+            if report in PAGINATED_REPORTS
+            else account.adapter.get(path, params))
+
+
+def get_reports(account, reports, max_workers=None):
+    """
+    Gets several reports at once, on a bounded pool of workers sharing the
+    account's adapter (and so its pooled connections)
+
+    :param account: The account for which these reports apply
+    :type account: :class:`Account`
+    :param reports: The reports to get, each as a `(report, id)` or
+                    `(report, id, params)` tuple
+    :type reports: :class:`list` of :class:`tuple`
+    :param max_workers: The number of reports fetched at once (defaults to
+                        the adapter's number of workers)
+    :type max_workers: :class:`int`
+    :rtype: :class:`list` of reports, in the order requested
+
+    Usage::
+
+        >>> from emma import get_reports
+        >>> from emma.model.account import Account
+        >>> from emma.enumerations import Report
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> sent, opens, unique_clicks = get_reports(acct, [
+        ...     (Report.SentList, 123),
+        ...     (Report.OpenList, 123),
+        ...     (Report.ClickList, 123, {'unique': True})
+        ... ], max_workers=6)
+    """
+    return account.adapter.map(
+        lambda x: get_report(account, *x), [tuple(x) for x in reports],
+        max_workers)
+
+
+def report_path(report, id=None):
+    """
+    The API path of the given report
+
+    :param report: The report (from enumerations.Report)
+    :type report: :class:`int`
+    :param id: An id such as mailing_id or share_id, if the report needs one
+    :type id: :class:`int`
+    :rtype: :class:`str`
+    """
+    return {
         r.ResponseSummary: "/response",
         r.MailingSummary: "/response/%s" % id,
         r.SentList: "/response/%s/sends" % id,
@@ -55,6 +103,3 @@ def get_report(account, report, id=None, params=None):
         r.CustomerShare: "/response/%s/customer_share" % id,
         r.SharesOverview: "/response/%s/shares/overview" % id,
     }[report]
-    return (account.adapter.paginated_get(path, params)
-            if needs_pagination
-            else account.adapter.get(path, params))
\ No newline at end of file
@@ -3,16 +3,36 @@ Provides a place to put any layer of abstraction between this wrapper and a
 needed HTTP client library
 """
 
+import collections
+import contextlib
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from emma.adapter.instrumentation import RequestEvent, Span
+
 
 class AbstractAdapter(object):
     """
     Abstract Adapter
+
+    :param max_workers: The number of concurrent requests allowed when
+                        fetching pages or batches (defaults to sequential)
+    :type max_workers: :class:`int`
+
+    Hooks are callables kept in three lists: :attr:`before_request` and
+    :attr:`after_request` hooks take a :class:`RequestEvent`, and
+    :attr:`after_span` hooks take a :class:`Span`.
     """
     MAX_PAGE_SIZE = 500
+    MAX_WORKERS = 1
 
-    def __init__(self):
-        self.count_only = False
-        self.reset_pagination()
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or self.__class__.MAX_WORKERS
+        self.before_request = []
+        self.after_request = []
+        self.after_span = []
+        self._local = threading.local()
 
     def post(self, path, params=None):
         """HTTP POST"""
@@ -30,34 +50,239 @@ class AbstractAdapter(object):
         """HTTP DELETE"""
         pass
 
-    def reset_pagination(self):
-        self.start = 0
-        self.end = self.__class__.MAX_PAGE_SIZE
+    def close(self):
+        """Release any resources (such as open connections) held"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def current_span(self):
+        """
+        The innermost span open on this thread
+
+        :rtype: :class:`Span` or :class:`None`
+        """
+        return getattr(self._local, 'span', None)
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """
+        Groups the requests made within a block under a name, reporting the
+        block to the :attr:`after_span` hooks once it ends. Spans nest, and
+        are carried into the workers of :meth:`map` and concurrent
+        pagination.
+
+        :param name: The name of the span
+        :type name: :class:`str`
+        :rtype: context manager producing a :class:`Span`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> with acct.adapter.span("nightly export") as spn:
+            ...     acct.members.fetch_all()
+            >>> spn.requests
+            3
+        """
+        span = Span(name, self.current_span())
+        self._local.span = span
+        try:
+            yield span
+        except Exception as exception:
+            span.error = exception
+            raise
+        finally:
+            self._local.span = span.parent
+            span.duration = time.time() - span.started
+            for hook in self.after_span:
+                hook(span)
+
+    def _in_current_span(self, func):
+        """Wraps a function to run inside this thread's span on any thread"""
+        span = self.current_span()
+        if span is None:
+            return func
+
+        def run(*args):
+            outer = self.current_span()
+            self._local.span = span
+            try:
+                return func(*args)
+            finally:
+                self._local.span = outer
+        return run
+
+    def instrument(self, method, path, send):
+        """
+        Runs a request between the request hooks. Adapters call this around
+        each request they make; `send` performs the request and fills in the
+        outcome on the event it is given.
+
+        :param method: The HTTP method
+        :type method: :class:`str`
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param send: Performs the request, given its :class:`RequestEvent`
+        :type send: :class:`callable`
+        :rtype: The value returned by `send`
+        """
+        if not (self.before_request or self.after_request
+                or self.current_span()):
+            return send(RequestEvent(method, path))
 
-    def pagination_add_ons(self):
-        if self.count_only:
+        span = self.current_span()
+        event = RequestEvent(method, path, span.path if span else ())
+        while span is not None:
+            span.requests += 1
+            span = span.parent
+        for hook in self.before_request:
+            hook(event)
+        try:
+            return send(event)
+        except Exception as exception:
+            event.error = exception
+            raise
+        finally:
+            event.latency = time.time() - event.started
+            for hook in self.after_request:
+                hook(event)
+
+    @classmethod
+    def pagination_add_ons(cls, start=0, end=None, count_only=False):
+        """
+        Produces the HTTP parameters that select a page window (or just the
+        count) of a listing. Pagination is requested per call through these
+        parameters so one adapter can safely be shared between threads.
+
+        :param start: The offset of the first item
+        :type start: :class:`int`
+        :param end: The offset past the last item
+        :type end: :class:`int`
+        :param count_only: Whether to request only the number of items
+        :type count_only: :class:`bool`
+        :rtype: :class:`dict`
+        """
+        if count_only:
             return {'count': True}
 
-        if self.start != 0 or self.end != self.__class__.MAX_PAGE_SIZE:
+        end = cls.MAX_PAGE_SIZE if end is None else end
+        if start != 0 or end != cls.MAX_PAGE_SIZE:
             return {
-                'start': self.start,
-                'end': self.end
+                'start': start,
+                'end': end
             }
 
         return {}
 
-    def paginated_get(self, path, params=None):
-        def get_next():
-            items = self.get(path, params)
-            self.start = self.end
-            self.end = self.start + self.MAX_PAGE_SIZE
-            return items
-
-        items = []
-        the_next = get_next()
-        while the_next:
-            items += the_next
-            the_next = get_next() if len(items) == self.start else None
-
-        self.reset_pagination()
-        return items
+    def count(self, path, params=None):
+        """
+        Gets the number of items in a listing
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :rtype: :class:`int`
+        """
+        return self.get(
+            path, dict(params or {}, **self.pagination_add_ons(count_only=True)))
+
+    def map(self, func, items, max_workers=None):
+        """
+        Applies a function to each item on a bounded pool of workers
+
+        :param func: The function to apply
+        :type func: :class:`callable`
+        :param items: The items to apply the function to
+        :type items: iterable
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`list` of results, in the same order as `items`
+        """
+        items = list(items)
+        workers = min(max_workers or self.max_workers, len(items))
+        if workers <= 1:
+            return [func(x) for x in items]
+
+        with ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(self._in_current_span(func), items))
+
+    def paginated_get(self, path, params=None, max_workers=None):
+        """
+        Gets every page of a listing, concatenated in order
+
+        When more than one worker is allowed, the total is requested up
+        front and the pages are fetched concurrently.
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`list`
+        """
+        return list(self.iter_paginated(path, params, max_workers))
+
+    def iter_paginated(self, path, params=None, max_workers=None):
+        """
+        Yields every item of a listing in order, holding only the pages in
+        flight in memory
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: generator
+        """
+        params = params or {}
+        workers = max_workers or self.max_workers
+        pages = (self._iter_pages_concurrently(path, params, workers)
+                 if workers > 1
+                 else self._iter_pages(path, params))
+        for page in pages:
+            for item in page:
+                yield item
+
+    def _page_params(self, params, start):
+        """Copies the parameters, adding the window of the page at `start`"""
+        end = start + self.__class__.MAX_PAGE_SIZE
+        return dict(params, **self.pagination_add_ons(start, end))
+
+    def _iter_pages(self, path, params):
+        """Fetch one page after another until a short page comes back"""
+        size = self.__class__.MAX_PAGE_SIZE
+        start = 0
+        while True:
+            page = self.get(path, self._page_params(params, start))
+            if not page:
+                return
+            yield page
+            if len(page) < size:
+                return
+            start += size
+
+    def _iter_pages_concurrently(self, path, params, workers):
+        """Count the listing, then fetch a bounded window of pages ahead"""
+        total = self.count(path, params)
+        if not total:
+            return
+
+        get_page = self._in_current_span(lambda start: self.get(
+            path, self._page_params(params, start)) or [])
+        starts = iter(range(0, total, self.__class__.MAX_PAGE_SIZE))
+        with ThreadPoolExecutor(workers) as pool:
+            pending = collections.deque(
+                pool.submit(get_page, x) for x in itertools.islice(starts, workers))
+            while pending:
+                page = pending.popleft().result()
+                for start in itertools.islice(starts, 1):
+                    pending.append(pool.submit(get_page, start))
+                yield page
@@ -0,0 +1,160 @@
+"""
+Adapter for :mod:`asyncio` event loops (Python 3.7+ only, so never imported
+by the rest of the package)
+"""
+
+import asyncio
+import collections
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from emma.adapter import AbstractAdapter
+
+
+class AsyncAdapter(AbstractAdapter):
+    """
+    Emma API Adapter with awaitable methods. Each request is handed to a
+    blocking adapter on a bounded pool of threads, so the event loop is never
+    stalled and many requests can be in flight from a single process.
+
+    :param adapter: The adapter which performs the requests
+    :type adapter: :class:`AbstractAdapter`
+    :param max_workers: The number of requests allowed in flight at once
+    :type max_workers: :class:`int`
+
+    Usage::
+
+        >>> from emma.adapter.requests_adapter import RequestsAdapter
+        >>> from emma.adapter.async_adapter import AsyncAdapter
+        >>> adptr = AsyncAdapter(RequestsAdapter({
+        ...     "account_id": "1234",
+        ...     "public_key": "08192a3b4c5d6e7f",
+        ...     "private_key": "f7e6d5c4b3a29180"}))
+        >>> await adptr.get('/members/123')
+        {'member_id': 123, ...}
+    """
+    MAX_WORKERS = 10
+
+    def __init__(self, adapter, max_workers=None):
+        super(AsyncAdapter, self).__init__(max_workers)
+        self.adapter = adapter
+        self.executor = ThreadPoolExecutor(self.max_workers)
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking callable on the worker pool
+
+        :param func: The callable to run
+        :type func: :class:`callable`
+        :rtype: The value returned by `func`
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs))
+
+    async def post(self, path, data=None):
+        """HTTP POST"""
+        return await self.run(self.adapter.post, path, data)
+
+    async def get(self, path, params=None):
+        """HTTP GET"""
+        return await self.run(self.adapter.get, path, params)
+
+    async def put(self, path, data=None):
+        """HTTP PUT"""
+        return await self.run(self.adapter.put, path, data)
+
+    async def delete(self, path, params=None):
+        """HTTP DELETE"""
+        return await self.run(self.adapter.delete, path, params)
+
+    async def count(self, path, params=None):
+        """
+        Gets the number of items in a listing
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :rtype: :class:`int`
+        """
+        return await self.get(
+            path, dict(params or {}, **self.pagination_add_ons(count_only=True)))
+
+    async def paginated_get(self, path, params=None, max_workers=None):
+        """
+        Gets every page of a listing, concatenated in order
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :param max_workers: Overrides the number of pages fetched at once
+        :type max_workers: :class:`int`
+        :rtype: :class:`list`
+        """
+        return [x async for x in self.iter_paginated(path, params, max_workers)]
+
+    async def iter_paginated(self, path, params=None, max_workers=None):
+        """
+        Yields every item of a listing in order, holding only the pages in
+        flight in memory
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters to encode
+        :type params: :class:`dict`
+        :param max_workers: Overrides the number of pages fetched at once
+        :type max_workers: :class:`int`
+        :rtype: async generator
+        """
+        params = params or {}
+        workers = max_workers or self.max_workers
+        pages = (self._iter_pages_concurrently(path, params, workers)
+                 if workers > 1
+                 else self._iter_pages(path, params))
+        async for page in pages:
+            for item in page:
+                yield item
+
+    async def _iter_pages(self, path, params):
+        """Fetch one page after another until a short page comes back"""
+        size = self.__class__.MAX_PAGE_SIZE
+        start = 0
+        while True:
+            page = await self.get(path, self._page_params(params, start))
+            if not page:
+                return
+            yield page
+            if len(page) < size:
+                return
+            start += size
+
+    async def _iter_pages_concurrently(self, path, params, workers):
+        """Count the listing, then fetch a bounded window of pages ahead"""
+        total = await self.count(path, params)
+        if not total:
+            return
+
+        get_page = lambda start: asyncio.ensure_future(
+            self.get(path, self._page_params(params, start)))
+        starts = iter(range(0, total, self.__class__.MAX_PAGE_SIZE))
+        pending = collections.deque(
+            get_page(x) for x in itertools.islice(starts, workers))
+        while pending:
+            page = await pending.popleft()
+            for start in itertools.islice(starts, 1):
+                pending.append(get_page(start))
+            yield page or []
+
+    def close(self):
+        """Stops the worker pool and closes the underlying adapter"""
+        self.executor.shutdown()
+        self.adapter.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Waiting for the workers to finish would stall the event loop
+        await asyncio.get_event_loop().run_in_executor(None, self.close)
@@ -0,0 +1,158 @@
+"""Response cache for adapters"""
+
+import collections
+import copy
+import json
+import threading
+import time
+
+
+class ResponseCache(object):
+    """
+    Least-recently-used cache of GET responses, each kept for the time to
+    live of the longest endpoint prefix of its path. Any POST, PUT or DELETE
+    invalidates every cached response under the same top-level resource
+    (`/members/123/groups` invalidates everything under `/members`), and
+    under the resources :attr:`RELATED` to it: memberships are reachable
+    from both sides, so a write under `/groups` also invalidates `/members`
+    and the other way around. Other cross-resource views (such as
+    `/searches/123/members` or `/mailings/123/groups`) are only refreshed
+    when their own TTL expires.
+
+    One cache may be shared by the adapters of several accounts; responses
+    are kept apart by the scope each adapter passes (its account's URL).
+    Responses are copied in and out, as models parse them in place.
+
+    :param ttls: Seconds to keep responses, by path prefix (a TTL of `0`
+                 disables caching under that prefix)
+    :type ttls: :class:`dict`
+    :param default_ttl: Seconds to keep responses no prefix matches
+    :type default_ttl: :class:`int`
+    :param max_entries: The number of responses kept before the least
+                        recently used are evicted
+    :type max_entries: :class:`int`
+
+    Usage::
+
+        >>> from emma.adapter.cache import ResponseCache
+        >>> from emma.adapter.requests_adapter import RequestsAdapter
+        >>> from emma.model.account import Account
+        >>> RequestsAdapter.CACHE = ResponseCache({'/members': 10})
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> acct.fields.fetch_all() # Requested
+        {...}
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> acct.fields.fetch_all() # Served from the cache for an hour
+        {...}
+    """
+    DEFAULT_TTL = 60
+    MAX_ENTRIES = 1024
+    TTLS = {
+        '/fields': 3600,
+        '/webhooks/events': 86400,
+        '/members': 30,
+        '/members/imports': 5
+    }
+    RELATED = {
+        '/groups': ('/members',),
+        '/members': ('/groups',)
+    }
+
+    def __init__(self, ttls=None, default_ttl=None, max_entries=None):
+        self.ttls = dict(self.__class__.TTLS, **(ttls or {}))
+        self.default_ttl = (self.__class__.DEFAULT_TTL
+                            if default_ttl is None else default_ttl)
+        self.max_entries = max_entries or self.__class__.MAX_ENTRIES
+        self._entries = collections.OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl(self, path):
+        """
+        Seconds to keep a response for the given path
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :rtype: :class:`int`
+        """
+        matches = [x for x in self.ttls
+                   if path == x or path.startswith(x.rstrip('/') + '/')]
+        return self.ttls[max(matches, key=len)] if matches else self.default_ttl
+
+    @staticmethod
+    def resource(path):
+        """
+        The top-level resource of a path, such as `/members`
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :rtype: :class:`str`
+        """
+        return '/' + path.lstrip('/').split('/', 1)[0]
+
+    def fetch(self, path, params, load, scope=None):
+        """
+        Gets a cached response, or loads and caches it
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param params: The dictionary of HTTP parameters
+        :type params: :class:`dict`
+        :param load: Requests the response when it is not cached
+        :type load: :class:`callable`
+        :param scope: Keeps responses of different accounts apart
+        :type scope: :class:`str`
+        :rtype: The (copied) response
+        """
+        ttl = self.ttl(path)
+        if not ttl:
+            return load()
+
+        key = (scope, path, json.dumps(params or {}, sort_keys=True))
+        resource = (scope, self.resource(path))
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[0] > now:
+                self._entries[key] = entry
+                return copy.deepcopy(entry[2])
+            generation = self._generations.get(resource, 0)
+
+        value = load()
+        with self._lock:
+            # Skip storing a response which a write may have overtaken
+            if self._generations.get(resource, 0) == generation:
+                self._entries[key] = (now + ttl, resource, copy.deepcopy(value))
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path, scope=None):
+        """
+        Drops every cached response under the top-level resource of a path,
+        and under the resources :attr:`RELATED` to it
+
+        :param path: The path portion of a URL
+        :type path: :class:`str`
+        :param scope: Limits invalidation to the responses of one account
+        :type scope: :class:`str`
+        :rtype: :class:`None`
+        """
+        resource = self.resource(path)
+        resources = set((scope, x) for x in
+                        (resource,) + self.__class__.RELATED.get(resource, ()))
+        with self._lock:
+            for x in resources:
+                self._generations[x] = self._generations.get(x, 0) + 1
+            for key in [x[0] for x in self._entries.items()
+                        if x[1][1] in resources]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drops every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
@@ -0,0 +1,76 @@
+"""JSON codecs for request and response bodies"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    """Encodes and decodes with the standard library's :mod:`json`"""
+    name = "json"
+
+    @staticmethod
+    def dumps(data):
+        """
+        Encodes a request body
+
+        :param data: The content to encode
+        :type data: :class:`object`
+        :rtype: :class:`str`
+        """
+        return json.dumps(data)
+
+    @staticmethod
+    def loads(content):
+        """
+        Decodes a response body
+
+        :param content: The body
+        :type content: :class:`bytes` or :class:`str`
+        :rtype: :class:`object`
+        """
+        return json.loads(content)
+
+
+class OrjsonCodec(object):
+    """
+    Encodes and decodes with `orjson <https://github.com/ijl/orjson>`_,
+    several times faster than :mod:`json` on member pages and import bodies.
+    Non-string keys are encoded as strings, as :mod:`json` does.
+    """
+    name = "orjson"
+
+    @staticmethod
+    def dumps(data):
+        """
+        Encodes a request body
+
+        :param data: The content to encode
+        :type data: :class:`object`
+        :rtype: :class:`bytes`
+        """
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def loads(content):
+        """
+        Decodes a response body
+
+        :param content: The body
+        :type content: :class:`bytes` or :class:`str`
+        :rtype: :class:`object`
+        """
+        return orjson.loads(content)
+
+
+def default_codec():
+    """
+    The fastest codec installed: :class:`OrjsonCodec` when orjson is
+    available, and :class:`JsonCodec` otherwise
+
+    :rtype: :class:`JsonCodec` or :class:`OrjsonCodec`
+    """
+    return OrjsonCodec() if orjson is not None else JsonCodec()
@@ -0,0 +1,363 @@
+"""Request hooks, spans and metrics for adapters"""
+
+import bisect
+import re
+import socket
+import threading
+import time
+
+
+TEMPLATE_SEGMENTS = (
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[^@/]+@[^@/]+$"), "{email}")
+)
+
+
+def path_template(path):
+    """
+    The template of a path, with identifiers replaced by placeholders, so
+    requests for different members are aggregated together
+
+    :param path: The path portion of a URL
+    :type path: :class:`str`
+    :rtype: :class:`str`
+
+    Usage::
+
+        >>> from emma.adapter.instrumentation import path_template
+        >>> path_template('/members/123/groups')
+        '/members/{id}/groups'
+    """
+    segments = path.split('/')
+    for index, segment in enumerate(segments):
+        for pattern, placeholder in TEMPLATE_SEGMENTS:
+            if pattern.match(segment):
+                segments[index] = placeholder
+                break
+    return '/'.join(segments)
+
+
+class RequestEvent(object):
+    """
+    Describes one request, as passed to request hooks. Hooks run before the
+    request see only its method, path and spans; hooks run after it see the
+    outcome as well.
+    """
+    def __init__(self, method, path, spans=()):
+        self.method = method
+        self.path = path
+        self.template = path_template(path)
+        self.spans = spans
+        self.status = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.attempts = 0
+        self.cached = False
+        self.coalesced = False
+        self.error = None
+        self.started = time.time()
+        self.latency = None
+
+    @property
+    def retries(self):
+        """The number of times the request was resent"""
+        return max(self.attempts - 1, 0)
+
+    @property
+    def outcome(self):
+        """
+        The status of the response, or how the request was answered without
+        one: `cached`, `coalesced` (by an identical request in flight) or
+        `error`
+        """
+        if self.status is not None:
+            return self.status
+        if self.cached:
+            return 'cached'
+        return 'coalesced' if self.coalesced and self.error is None else 'error'
+
+
+class Span(object):
+    """
+    A named stretch of work, such as a collection's `fetch_all`, which
+    counts the requests made within it
+
+    :param name: The name of the span
+    :type name: :class:`str`
+    :param parent: The span this one is nested in
+    :type parent: :class:`Span`
+    """
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.requests = 0
+        self.error = None
+        self.started = time.time()
+        self.duration = None
+
+    @property
+    def path(self):
+        """The names of this span and those it is nested in, outermost first"""
+        names = []
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+        return tuple(reversed(names))
+
+
+class Histogram(object):
+    """
+    Counts observations into cumulative buckets
+
+    :param buckets: The upper bounds of the buckets
+    :type buckets: :class:`tuple`
+    """
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+        Records one observation
+
+        :param value: The observed value
+        :type value: :class:`float`
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        The number of observations at or below each bound, ending with
+        `+Inf`
+
+        :rtype: :class:`list` of (bound, count) :class:`tuple`
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+def _labels(**labels):
+    """Prometheus label syntax"""
+    return '{%s}' % ','.join(
+        '%s="%s"' % (x, str(labels[x]).replace('\\', '\\\\').replace('"', '\\"'))
+        for x in sorted(labels))
+
+
+def _bound(value):
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+class Metrics(object):
+    """
+    Aggregates request events and spans: request counts by status, latency
+    and span duration histograms, bytes in and out and retries, all by
+    method and path template. Exports as Prometheus text.
+
+    :param buckets: The upper bounds of the latency buckets, in seconds
+    :type buckets: :class:`tuple`
+
+    Usage::
+
+        >>> from emma.adapter.instrumentation import Metrics
+        >>> from emma.model.account import Account
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> metrics = Metrics().install(acct.adapter)
+        >>> acct.members.fetch_all()
+        {...}
+        >>> print(metrics.to_prometheus())
+        emma_requests_total{method="GET",path="/members",status="200"} 1
+        ...
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=None):
+        self.buckets = buckets or self.__class__.BUCKETS
+        self.requests = {}
+        self.latency = {}
+        self.bytes_out = {}
+        self.bytes_in = {}
+        self.retries = {}
+        self.spans = {}
+        self._lock = threading.Lock()
+
+    def install(self, adapter):
+        """
+        Observes every request and span of an adapter
+
+        :param adapter: The adapter
+        :type adapter: :class:`AbstractAdapter`
+        :rtype: :class:`Metrics`
+        """
+        adapter.after_request.append(self.observe_request)
+        adapter.after_span.append(self.observe_span)
+        return self
+
+    def observe_request(self, event):
+        """
+        Records a finished request
+
+        :param event: The request
+        :type event: :class:`RequestEvent`
+        """
+        key = (event.method, event.template)
+        status = event.outcome
+        with self._lock:
+            count_key = key + (status,)
+            self.requests[count_key] = self.requests.get(count_key, 0) + 1
+            self._histogram(self.latency, key).observe(event.latency)
+            self.bytes_out[key] = self.bytes_out.get(key, 0) + event.bytes_out
+            self.bytes_in[key] = self.bytes_in.get(key, 0) + event.bytes_in
+            self.retries[key] = self.retries.get(key, 0) + event.retries
+
+    def observe_span(self, span):
+        """
+        Records a finished span
+
+        :param span: The span
+        :type span: :class:`Span`
+        """
+        with self._lock:
+            self._histogram(self.spans, span.name).observe(span.duration)
+
+    def to_prometheus(self):
+        """
+        The metrics in the Prometheus text exposition format
+
+        :rtype: :class:`str`
+        """
+        lines = []
+        with self._lock:
+            self._counter(lines, 'emma_requests_total', "Requests sent",
+                          self.requests, ('method', 'path', 'status'))
+            self._histograms(lines, 'emma_request_duration_seconds',
+                             "Request latency", self.latency, ('method', 'path'))
+            self._counter(lines, 'emma_request_bytes_total', "Bytes sent",
+                          self.bytes_out, ('method', 'path'))
+            self._counter(lines, 'emma_response_bytes_total', "Bytes received",
+                          self.bytes_in, ('method', 'path'))
+            self._counter(lines, 'emma_request_retries_total', "Requests resent",
+                          self.retries, ('method', 'path'))
+            self._histograms(lines, 'emma_span_duration_seconds',
+                             "Span duration",
+                             dict(((x[0],), x[1]) for x in self.spans.items()),
+                             ('span',))
+        return '\n'.join(lines) + '\n'
+
+    def _histogram(self, histograms, key):
+        """Get (or create) the histogram for a key"""
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    @staticmethod
+    def _counter(lines, name, help, values, label_names):
+        lines.append('# HELP %s %s' % (name, help))
+        lines.append('# TYPE %s counter' % name)
+        for key in sorted(values, key=str):
+            lines.append('%s%s %s' % (
+                name, _labels(**dict(zip(label_names, key))), values[key]))
+
+    @staticmethod
+    def _histograms(lines, name, help, histograms, label_names):
+        lines.append('# HELP %s %s' % (name, help))
+        lines.append('# TYPE %s histogram' % name)
+        for key in sorted(histograms, key=str):
+            labels = dict(zip(label_names, key))
+            histogram = histograms[key]
+            for bound, count in histogram.cumulative():
+                lines.append('%s_bucket%s %s' % (
+                    name, _labels(le=_bound(bound), **labels), count))
+            lines.append('%s_sum%s %r' % (name, _labels(**labels), histogram.sum))
+            lines.append('%s_count%s %s' % (
+                name, _labels(**labels), histogram.count))
+
+
+class StatsdSink(object):
+    """
+    Sends each request and span to a statsd daemon over UDP as it finishes:
+    a timer and a status counter per request, plus byte and retry counters
+
+    :param host: The statsd host
+    :type host: :class:`str`
+    :param port: The statsd port
+    :type port: :class:`int`
+    :param prefix: Prepended to every metric name
+    :type prefix: :class:`str`
+
+    Usage::
+
+        >>> from emma.adapter.instrumentation import StatsdSink
+        >>> from emma.model.account import Account
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> sink = StatsdSink("localhost", 8125).install(acct.adapter)
+    """
+    PREFIX = "emma"
+
+    def __init__(self, host="localhost", port=8125, prefix=None):
+        self.address = (host, port)
+        self.prefix = prefix or self.__class__.PREFIX
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def install(self, adapter):
+        """
+        Sends every request and span of an adapter
+
+        :param adapter: The adapter
+        :type adapter: :class:`AbstractAdapter`
+        :rtype: :class:`StatsdSink`
+        """
+        adapter.after_request.append(self.send_request)
+        adapter.after_span.append(self.send_span)
+        return self
+
+    def close(self):
+        """Closes the socket"""
+        self.socket.close()
+
+    def send_request(self, event):
+        """
+        Sends a finished request
+
+        :param event: The request
+        :type event: :class:`RequestEvent`
+        """
+        name = '%s.request.%s.%s' % (
+            self.prefix, event.method.lower(), self._name(event.template))
+        status = event.outcome
+        self._send([
+            '%s:%d|ms' % (name, round(event.latency * 1000)),
+            '%s.status.%s:1|c' % (name, status),
+            '%s.bytes_out:%d|c' % (name, event.bytes_out),
+            '%s.bytes_in:%d|c' % (name, event.bytes_in),
+            '%s.retries:%d|c' % (name, event.retries)])
+
+    def send_span(self, span):
+        """
+        Sends a finished span
+
+        :param span: The span
+        :type span: :class:`Span`
+        """
+        self._send(['%s.span.%s:%d|ms' % (
+            self.prefix, self._name(span.name), round(span.duration * 1000))])
+
+    @staticmethod
+    def _name(value):
+        """A statsd-safe metric name"""
+        return re.sub(r"[^A-Za-z0-9_.]+", "_", value.strip('/').replace('/', '.'))
+
+    def _send(self, lines):
+        try:
+            self.socket.sendto('\n'.join(lines).encode('utf-8'), self.address)
+        except (OSError, socket.error):
+            pass
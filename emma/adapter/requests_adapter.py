@@ -1,22 +1,41 @@
 """Adapter for the Requests Library"""
 
+import gzip
+import io
 import json
 import requests
+import requests.adapters
 import requests.auth
 from emma import exceptions as ex
 from emma.adapter import AbstractAdapter
+from emma.adapter.codec import default_codec
+from emma.adapter.scheduler import RequestScheduler
+from emma.adapter.singleflight import SingleFlight
 
 
-def process_response(response):
-    """Takes a :class:`Response` and produces python built-ins"""
+def process_response(response, codec=None):
+    """
+    Takes a :class:`Response` and produces python built-ins, decoded with
+    `codec` (or by :meth:`Response.json` without one)
+    """
     if response.status_code == 400:
         raise ex.ApiRequest400(response)
     elif response.status_code == 404:
         return None
+    elif response.status_code == 429:
+        raise ex.ApiRequest429(response)
     elif response.status_code > 200:
         raise ex.ApiRequestFailed(response)
 
-    return response.json()
+    return response.json() if codec is None else codec.loads(response.content)
+
+
+def compress(body, level):
+    """Gzips a request body (as :func:`gzip.compress`, which Python 2 lacks)"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=level) as out:
+        out.write(body)
+    return buffer.getvalue()
 
 
 class RequestsAdapter(AbstractAdapter):
@@ -27,6 +46,46 @@ class RequestsAdapter(AbstractAdapter):
     :param auth: A dictionary with keys for your account id and public/private
                  keys
     :type auth: :class:`dict`
+    :param pool_connections: The number of host connection pools to cache
+    :type pool_connections: :class:`int`
+    :param pool_maxsize: The maximum number of connections kept per host
+                         (raised to `max_workers` when that is larger)
+    :type pool_maxsize: :class:`int`
+    :param pool_block: Whether to wait for a free connection once
+                       `pool_maxsize` connections to a host are in use
+    :type pool_block: :class:`bool`
+    :param keep_alive: Whether to keep connections open between requests
+    :type keep_alive: :class:`bool`
+    :param max_workers: The number of concurrent requests allowed when
+                        fetching pages or batches (defaults to sequential)
+    :type max_workers: :class:`int`
+    :param cache: Caches GET responses (defaults to :attr:`CACHE`, which is
+                  shared by every adapter)
+    :type cache: :class:`ResponseCache`
+    :param scheduler: Paces and retries requests (defaults to
+                      :attr:`SCHEDULER`, or else a scheduler of this adapter's
+                      own)
+    :type scheduler: :class:`RequestScheduler`
+    :param codec: Encodes and decodes bodies (defaults to :attr:`CODEC`, or
+                  else the fastest codec installed)
+    :type codec: :class:`JsonCodec` or :class:`OrjsonCodec`
+    :param compress_threshold: Gzips POST and PUT bodies of at least this
+                               many bytes (defaults to
+                               :attr:`COMPRESS_THRESHOLD`; `None` never
+                               compresses)
+    :type compress_threshold: :class:`int`
+    :param coalesce: Whether concurrent identical GETs (same path and
+                     parameters) share one request and its result (defaults
+                     to :attr:`COALESCE`)
+    :type coalesce: :class:`bool`
+
+    Responses are negotiated as gzip or deflate by the session's default
+    `Accept-Encoding` header, and decompressed transparently.
+
+    The connection pool grows to keep a connection per worker whenever
+    :attr:`max_workers` is raised, so concurrent requests keep their
+    connections alive. A larger `max_workers` passed to a single call is not
+    accounted for; connections beyond the pool's size are closed after use.
 
     Usage::
 
@@ -37,19 +96,173 @@ class RequestsAdapter(AbstractAdapter):
         ...     "private_key": "f7e6d5c4b3a29180"})
         >>> adptr
         <RequestsAdapter>
+        >>> adptr.close()
 
     """
-    def __init__(self, auth):
-        super(RequestsAdapter, self).__init__()
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    CACHE = None
+    SCHEDULER = None
+    CODEC = None
+    COMPRESS_THRESHOLD = None
+    COMPRESS_LEVEL = 6
+    COALESCE = True
+    TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, auth, pool_connections=None, pool_maxsize=None,
+                 pool_block=False, keep_alive=True, max_workers=None,
+                 cache=None, scheduler=None, codec=None,
+                 compress_threshold=None, coalesce=None):
+        super(RequestsAdapter, self).__init__(max_workers)
+        self.cache = self.__class__.CACHE if cache is None else cache
+        self.scheduler = (scheduler or self.__class__.SCHEDULER
+                          or RequestScheduler())
+        self.codec = codec or self.__class__.CODEC or default_codec()
+        self.compress_threshold = (
+            self.__class__.COMPRESS_THRESHOLD
+            if compress_threshold is None else compress_threshold)
+        self.coalesce = self.__class__.COALESCE if coalesce is None else coalesce
+        self.flights = SingleFlight()
         self.auth = requests.auth.HTTPBasicAuth(
             auth['public_key'],
             auth['private_key'])
         self.url = "https://api.e2ma.net/%s" % auth['account_id']
+        self.pool_maxsize = max(
+            pool_maxsize or self.__class__.POOL_MAXSIZE, self.max_workers)
+        self.session = self._build_session(
+            pool_connections or self.__class__.POOL_CONNECTIONS,
+            self.pool_maxsize,
+            pool_block,
+            keep_alive)
+
+    @property
+    def max_workers(self):
+        """The number of concurrent requests allowed"""
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        self._max_workers = value
+        self._fit_pool()
+
+    def _build_session(self, pool_connections, pool_maxsize, pool_block,
+                       keep_alive):
+        """Produces a :class:`requests.Session` backed by a connection pool"""
+        session = requests.Session()
+        session.auth = self.auth
+        self.pool = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+        session.mount('https://', self.pool)
+        session.mount('http://', self.pool)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _fit_pool(self):
+        """Grows the connection pool to keep a connection per worker"""
+        pool = getattr(self, 'pool', None)
+        if pool is None or self.max_workers <= self.pool_maxsize:
+            return
+        self.pool_maxsize = self.max_workers
+        pool.poolmanager.clear()
+        pool.init_poolmanager(
+            pool._pool_connections, self.pool_maxsize, block=pool._pool_block)
+
+    def _request(self, method, path, **kwargs):
+        """Sends a request between the request hooks"""
+        return self.instrument(
+            method, path, lambda event: self._fetch(method, path, event, kwargs))
+
+    def _fetch(self, method, path, event, kwargs):
+        """
+        Sends a request, joining an identical GET already in flight when
+        coalescing
+        """
+        if method == 'GET' and self.coalesce:
+            event.coalesced = True
+            key = (path, json.dumps(kwargs.get('params') or {}, sort_keys=True))
+            return self.flights.do(
+                key, lambda: self._load(method, path, event, kwargs))
+        try:
+            return self._load(method, path, event, kwargs)
+        finally:
+            if method != 'GET':
+                # GETs in flight may have been answered before the write
+                self.flights.forget()
+
+    def _load(self, method, path, event, kwargs):
+        """Sends a request, through the response cache if there is one"""
+        event.coalesced = False
+        if self.cache is None:
+            return self._send(method, path, event, kwargs)
+        if method == 'GET':
+            event.cached = True
+            return self.cache.fetch(
+                path, kwargs.get('params'),
+                lambda: self._send(method, path, event, kwargs),
+                self.url)
+        try:
+            return self._send(method, path, event, kwargs)
+        finally:
+            self.cache.invalidate(path, self.url)
+
+    def _send(self, method, path, event, kwargs):
+        """Sends a request over the pooled session, paced and retried"""
+        event.cached = False
+        data = kwargs.get('data')
+        event.bytes_out = len(data) if data else 0
+
+        def attempt():
+            event.attempts += 1
+            return self.session.request(
+                method, self.url + "%s" % path, **kwargs)
+
+        response = self.scheduler.send(
+            method, attempt, self.__class__.TRANSIENT_ERRORS)
+        event.status = response.status_code
+        content = getattr(response, 'content', None)
+        length = (getattr(response, 'headers', None) or {}).get('Content-Length')
+        event.bytes_in = (int(length) if length else len(content)
+                          if isinstance(content, (bytes, str)) else 0)
+        return process_response(response, self.codec)
+
+    def _body(self, data):
+        """Encodes a request body, gzipped when it reaches the threshold"""
+        body = self.codec.dumps(data)
+        threshold = self.compress_threshold
+        if threshold is None or len(body) < threshold:
+            return {'data': body}
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        return {
+            'data': compress(body, self.__class__.COMPRESS_LEVEL),
+            'headers': {'Content-Encoding': "gzip"}
+        }
+
+    def close(self):
+        """
+        Closes the pooled session and any connections it holds open
+
+        :rtype: :class:`None`
+
+        Usage::
+
+            >>> from emma.adapter.requests_adapter import RequestsAdapter
+            >>> adptr = RequestsAdapter({
+            ...     "account_id": "1234",
+            ...     "public_key": "08192a3b4c5d6e7f",
+            ...     "private_key": "f7e6d5c4b3a29180"})
+            >>> adptr.close()
+            None
+        """
+        self.session.close()
 
     def post(self, path, data=None):
         """
         Takes an effective path (portion after https://api.e2ma.net/:account_id)
-        and a parameter dictionary, then passes these to :func:`requests.post`
+        and a parameter dictionary, then passes these to :meth:`requests.Session.post`
 
         :param path: The path portion of a URL
         :type path: :class:`str`
@@ -67,16 +280,12 @@ class RequestsAdapter(AbstractAdapter):
             >>> adptr.post('/members', {...})
             {'import_id': 2001}
         """
-        return process_response(
-            requests.post(
-                self.url + "%s" % path,
-                data=json.dumps(data),
-                auth=self.auth))
+        return self._request('POST', path, **self._body(data))
 
     def get(self, path, params=None):
         """
         Takes an effective path (portion after https://api.e2ma.net/:account_id)
-        and a parameter dictionary, then passes these to :func:`requests.get`
+        and a parameter dictionary, then passes these to :meth:`requests.Session.get`
 
         :param path: The path portion of a URL
         :type path: :class:`str`
@@ -93,28 +302,17 @@ class RequestsAdapter(AbstractAdapter):
             ...     "private_key": "f7e6d5c4b3a29180"})
             >>> adptr.get('/members', {...})
             [{...}, {...}, ...] # first 500 only
-            >>> adptr.count_only = True
-            >>> adptr.get('/members', {...})
+            >>> adptr.get('/members', {'count': True})
             999
-            >>> adptr.start = 500
-            >>> adptr.end = 1000
-            >>> adptr.get('/members', {...})
+            >>> adptr.get('/members', {'start': 500, 'end': 1000})
             [{...}, {...}, ...] # 500-999
         """
-
-        params = params or {}
-        params.update(self.pagination_add_ons())
-
-        return process_response(
-            requests.get(
-                self.url + "%s" % path,
-                params=params,
-                auth=self.auth))
+        return self._request('GET', path, params=params)
 
     def put(self, path, data=None):
         """
         Takes an effective path (portion after https://api.e2ma.net/:account_id)
-        and a parameter dictionary, then passes these to :func:`requests.put`
+        and a parameter dictionary, then passes these to :meth:`requests.Session.put`
 
         :param path: The path portion of a URL
         :type path: :class:`str`
@@ -132,16 +330,12 @@ class RequestsAdapter(AbstractAdapter):
             >>> adptr.put('/members/email/optout/test@example.com')
             True
         """
-        return process_response(
-            requests.put(
-                self.url + "%s" % path,
-                data=json.dumps(data),
-                auth=self.auth))
+        return self._request('PUT', path, **self._body(data))
 
     def delete(self, path, params=None):
         """
         Takes an effective path (portion after https://api.e2ma.net/:account_id)
-        and a parameter dictionary, then passes these to :func:`requests.delete`
+        and a parameter dictionary, then passes these to :meth:`requests.Session.delete`
 
         :param path: The path portion of a URL
         :type path: :class:`str`
@@ -159,8 +353,4 @@ class RequestsAdapter(AbstractAdapter):
             >>> adptr.delete('/members/123')
             True
         """
-        return process_response(
-            requests.delete(
-                self.url + "%s" % path,
-                params=params,
-                auth=self.auth))
+        return self._request('DELETE', path, params=params)
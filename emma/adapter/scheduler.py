@@ -0,0 +1,186 @@
+"""Rate limiting and retries for adapters"""
+
+from email.utils import mktime_tz, parsedate_tz
+import random
+import threading
+import time
+
+
+# A clock which never runs backwards, where the interpreter has one
+clock = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """
+    Allows a steady rate of requests with bursts of up to `capacity`,
+    blocking callers until a token is free
+
+    :param rate: Tokens added per second
+    :type rate: :class:`float`
+    :param capacity: The most tokens which may be saved up
+    :type capacity: :class:`int`
+    """
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes a token, waiting for one if none are left
+
+        :rtype: :class:`float` the seconds spent waiting
+        """
+        with self._lock:
+            now = clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """
+        Holds back every caller for a while, as when the API asks to slow down
+
+        :param seconds: How long to hold back
+        :type seconds: :class:`float`
+        """
+        with self._lock:
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class RequestScheduler(object):
+    """
+    Paces requests through a token bucket matched to Emma's API limits and
+    retries those which fail transiently, with jittered exponential backoff.
+    A `Retry-After` header from the API takes precedence over the backoff
+    and also holds back other requests sharing the scheduler.
+
+    GET, PUT and DELETE are idempotent, so they are retried after throttling
+    (429), unavailability (502, 503, 504) and connection errors. Other
+    methods are retried only after throttling, which the API rejects before
+    acting on the request. Share one scheduler between the adapters of an
+    account to keep them all within its limits.
+
+    :param rate: Requests allowed per second on average (`0` disables rate
+                 limiting)
+    :type rate: :class:`float`
+    :param burst: Requests allowed at once after a quiet period
+    :type burst: :class:`int`
+    :param max_retries: Retries allowed per request
+    :type max_retries: :class:`int`
+    :param backoff: Seconds to back off before the first retry
+    :type backoff: :class:`float`
+    :param max_backoff: The longest back off between retries, in seconds
+    :type max_backoff: :class:`float`
+
+    Usage::
+
+        >>> from emma.adapter.requests_adapter import RequestsAdapter
+        >>> from emma.adapter.scheduler import RequestScheduler
+        >>> RequestsAdapter.SCHEDULER = RequestScheduler(rate=2, max_retries=8)
+    """
+    RATE = 3.0
+    BURST = 30
+    MAX_RETRIES = 5
+    BACKOFF = 0.5
+    MAX_BACKOFF = 60.0
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+    THROTTLED_STATUSES = frozenset([429])
+    UNAVAILABLE_STATUSES = frozenset([502, 503, 504])
+
+    def __init__(self, rate=None, burst=None, max_retries=None, backoff=None,
+                 max_backoff=None):
+        rate = self.__class__.RATE if rate is None else rate
+        self.bucket = (TokenBucket(rate, burst or self.__class__.BURST)
+                       if rate else None)
+        self.max_retries = (self.__class__.MAX_RETRIES
+                            if max_retries is None else max_retries)
+        self.backoff = self.__class__.BACKOFF if backoff is None else backoff
+        self.max_backoff = (self.__class__.MAX_BACKOFF
+                            if max_backoff is None else max_backoff)
+
+    def send(self, method, request, errors=()):
+        """
+        Sends a request when the rate limit allows, retrying as needed
+
+        :param method: The HTTP method
+        :type method: :class:`str`
+        :param request: Sends the request and produces its response
+        :type request: :class:`callable`
+        :param errors: The exceptions which denote a transient connection
+                       failure
+        :type errors: :class:`tuple`
+        :rtype: The last response
+        """
+        attempt = 0
+        while True:
+            if self.bucket is not None:
+                self.bucket.acquire()
+            try:
+                response = request()
+            except errors:
+                if not self._retryable(method, None, attempt):
+                    raise
+                time.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+
+            status = response.status_code
+            if not self._retryable(method, status, attempt):
+                return response
+            retry_after = self.retry_after(response)
+            if retry_after is not None and self.bucket is not None:
+                self.bucket.pause(retry_after)
+            time.sleep(self.delay(attempt) if retry_after is None
+                       else retry_after)
+            attempt += 1
+
+    def delay(self, attempt):
+        """
+        Seconds to back off before a retry, with full jitter
+
+        :param attempt: The number of retries made so far
+        :type attempt: :class:`int`
+        :rtype: :class:`float`
+        """
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def retry_after(self, response):
+        """
+        Seconds the API asked to wait before retrying, if it did
+
+        :param response: The response
+        :type response: :class:`requests.Response`
+        :rtype: :class:`float` or :class:`None`
+        """
+        value = (getattr(response, 'headers', None) or {}).get('Retry-After')
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            moment = parsedate_tz(value)
+            if moment is None:
+                return None
+            if moment[9] is None:
+                moment = moment[:9] + (0,)
+            seconds = mktime_tz(moment) - time.time()
+        return min(max(seconds, 0.0), self.max_backoff)
+
+    def _retryable(self, method, status, attempt):
+        """Whether a failure (a status, or `None` when unsent) is retried"""
+        if attempt >= self.max_retries:
+            return False
+        if status in self.THROTTLED_STATUSES:
+            return True
+        if method not in self.IDEMPOTENT_METHODS:
+            return False
+        return status is None or status in self.UNAVAILABLE_STATUSES
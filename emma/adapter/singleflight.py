@@ -0,0 +1,102 @@
+"""Coalescing of identical concurrent requests"""
+
+import copy
+import threading
+
+
+class _Flight(object):
+    """A call in progress, and its outcome once it lands"""
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Lets concurrent callers with the same key share one call: the first
+    caller makes it, and those arriving while it is in flight wait for its
+    outcome instead of making their own. Each waiter receives a deep copy
+    of the value, as models parse what they are given in place; errors are
+    raised to every caller.
+
+    Usage::
+
+        >>> from emma.adapter.singleflight import SingleFlight
+        >>> flights = SingleFlight()
+        >>> flights.do(('GET', '/members/123'), lambda: adptr.get('/members/123'))
+        {'member_id': 123, ...}
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._flights)
+
+    def do(self, key, call):
+        """
+        Makes a call, or joins the identical one already in flight
+
+        :param key: Identifies identical calls
+        :type key: hashable
+        :param call: Makes the call
+        :type call: :class:`callable`
+        :rtype: The value returned by `call`
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            value = call()
+        except Exception as exception:
+            flight.error = exception
+            raise
+        else:
+            flight.value = value
+        finally:
+            # No one joins once the flight is forgotten, so `waiters` is final
+            self.forget(key, flight)
+            flight.done.set()
+        # The value is left untouched for the waiters to copy
+        return copy.deepcopy(value) if flight.waiters else value
+
+    def joined(self, key):
+        """
+        The number of callers waiting on the call in flight for a key
+
+        :param key: Identifies identical calls
+        :type key: hashable
+        :rtype: :class:`int`
+        """
+        flight = self._flights.get(key)
+        return flight.waiters if flight is not None else 0
+
+    def forget(self, key=None, flight=None):
+        """
+        Stops later callers from joining calls in flight, which still land
+        for those already waiting (used once a write may have made them stale)
+
+        :param key: The key to forget (every key by default)
+        :type key: hashable
+        :rtype: :class:`None`
+        """
+        with self._lock:
+            if key is None:
+                self._flights.clear()
+            elif flight is None or self._flights.get(key) is flight:
+                self._flights.pop(key, None)
@@ -0,0 +1,303 @@
+"""
+Columnar export of members and reports, for vectorized analysis
+
+Listings are streamed page by page straight into one buffer per field,
+without building a model per record. Integers, floats and booleans are kept
+in typed :class:`array.array` buffers, datetimes as int64 seconds since the
+epoch (with :data:`NAT` marking missing values), and anything else in a
+:class:`list`. NumPy is optional; when it is installed the buffers can be
+handed over as NumPy arrays.
+"""
+
+import array
+import calendar
+from datetime import datetime, timedelta
+from emma import PAGINATED_REPORTS, report_path
+from emma.model import parse_datetime
+from emma.query.evaluator import TEXT_TYPES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+try:
+    INT64 = array.array('q').typecode
+except ValueError:
+    # Python 2 lacks 'q', though 'l' is 64 bits on LP64 platforms
+    INT64 = 'l'
+
+INTEGER_TYPES = (int, type(2 ** 63))
+
+NAT = -2 ** 63
+"""Missing datetime value, which is also NumPy's ``NaT`` bit pattern"""
+
+EPOCH = datetime(1970, 1, 1)
+NAN = float('nan')
+
+
+class Column(object):
+    """
+    A single growing column, which picks the narrowest buffer for the values
+    it has seen and widens it when a value no longer fits
+
+    :param length: The number of missing values to begin with
+    :type length: :class:`int`
+    """
+    def __init__(self, length=0):
+        self.kind = None
+        self.buffer = [None] * length
+        self._epochs = {}
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def append(self, value):
+        """
+        Adds a value to the end of this column
+
+        :param value: A raw API value
+        :type value: :class:`bool`, :class:`int`, :class:`float`,
+                     :class:`str` or any other value
+        """
+        if value is None:
+            return self.append_missing()
+        kind = self._kind_of(value)
+        if kind != self.kind:
+            self._widen(kind)
+        if self.kind == 'datetime':
+            value = self._epoch(value)
+        elif self.kind == 'float':
+            value = float(value)
+        self.buffer.append(value)
+
+    def append_missing(self):
+        """Adds a missing value to the end of this column"""
+        if self.kind in ('int', 'bool'):
+            self._widen('float' if self.kind == 'int' else 'object')
+        self.buffer.append({
+            'float': NAN,
+            'datetime': NAT
+        }.get(self.kind))
+
+    def to_numpy(self):
+        """
+        This column as a NumPy array (int64 for datetimes)
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        if numpy is None:
+            raise ImportError("NumPy is required for NumPy export")
+        dtype = {
+            'bool': numpy.bool_,
+            'int': numpy.int64,
+            'float': numpy.float64,
+            'datetime': numpy.int64
+        }.get(self.kind)
+        if dtype is None:
+            column = numpy.empty(len(self.buffer), dtype=object)
+            column[:] = self.buffer
+            return column
+        return numpy.frombuffer(self.buffer, dtype=dtype)
+
+    @staticmethod
+    def _kind_of(value):
+        """The narrowest kind of buffer which can hold a value"""
+        if isinstance(value, bool):
+            return 'bool'
+        if isinstance(value, INTEGER_TYPES):
+            return 'int'
+        if isinstance(value, float):
+            return 'float'
+        if isinstance(value, TEXT_TYPES) and value.startswith("@D:"):
+            return 'datetime'
+        return 'object'
+
+    def _widen(self, kind):
+        """Convert the buffer to one which can also hold values of `kind`"""
+        current = self.kind
+        if current is None:
+            target = kind
+        elif (current, kind) in (('int', 'float'), ('float', 'int')):
+            target = 'float'
+        else:
+            target = 'object'
+        if target == current:
+            return
+
+        missing = self.buffer.count(None) if current is None else 0
+        if target in ('int', 'bool') and missing:
+            target = 'float' if target == 'int' else 'object'
+
+        if target == 'object' and current == 'datetime':
+            self.buffer = [None if x == NAT else EPOCH + timedelta(seconds=x)
+                           for x in self.buffer]
+        elif target == 'object' and current == 'bool':
+            self.buffer = [bool(x) for x in self.buffer]
+        elif target == 'object':
+            self.buffer = list(self.buffer)
+        elif target == 'float':
+            self.buffer = array.array('d', (
+                NAN if x is None else float(x) for x in self.buffer))
+        else:
+            self.buffer = array.array(
+                {'bool': 'b', 'int': INT64, 'datetime': INT64}[target],
+                (NAT for x in self.buffer))
+        self.kind = target
+
+    def _epoch(self, value):
+        """Seconds since the epoch of a serialized datetime"""
+        epoch = self._epochs.get(value)
+        if epoch is None:
+            epoch = self._epochs[value] = calendar.timegm(
+                parse_datetime(value).timetuple())
+        return epoch
+
+
+class Columns(object):
+    """
+    Builds a set of equal-length columns from dictionaries, one row at a
+    time. Fields which first appear part way through are back-filled with
+    missing values, as are fields which a row lacks.
+
+    Usage::
+
+        >>> from emma.columnar import Columns
+        >>> cols = Columns()
+        >>> cols.append({'member_id': 123, 'member_since': "@D:2013-01-01T00:00:00"})
+        >>> cols.append({'member_id': 321})
+        >>> cols.to_arrays()
+        {'member_id': array('q', [123, 321]),
+         'member_since': array('q', [1356998400, -9223372036854775808])}
+    """
+    def __init__(self):
+        self.columns = {}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def append(self, row):
+        """
+        Adds a row
+
+        :param row: The values of the row, by field
+        :type row: :class:`dict`
+        """
+        for key, value in row.items():
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = Column(self.length)
+            column.append(value)
+        self.length += 1
+        if len(row) < len(self.columns):
+            for column in self.columns.values():
+                if len(column) < self.length:
+                    column.append_missing()
+
+    def extend(self, rows):
+        """
+        Adds each of several rows
+
+        :param rows: The rows
+        :type rows: iterable of :class:`dict`
+        :rtype: :class:`Columns`
+        """
+        for row in rows:
+            self.append(row)
+        return self
+
+    def to_arrays(self):
+        """
+        The columns as :class:`array.array` (or :class:`list`) buffers
+
+        :rtype: :class:`dict`
+        """
+        return dict((x[0], x[1].buffer) for x in self.columns.items())
+
+    def to_numpy(self):
+        """
+        The columns as NumPy arrays
+
+        :rtype: :class:`dict` of :class:`numpy.ndarray`
+        """
+        return dict((x[0], x[1].to_numpy()) for x in self.columns.items())
+
+
+def _flatten_member(raw):
+    """Raises custom fields to the top level, as :class:`Member` does"""
+    if 'fields' in raw:
+        raw.update(raw.pop('fields'))
+    return raw
+
+
+def _export(rows, as_numpy):
+    """Stream rows into columns"""
+    columns = Columns().extend(rows)
+    return columns.to_numpy() if as_numpy else columns.to_arrays()
+
+
+def export_members(account, deleted=False, as_numpy=False, max_workers=None):
+    """
+    Streams every member of an account into columns, one per field
+    (custom fields included)
+
+    :param account: The account whose members to export
+    :type account: :class:`Account`
+    :param deleted: Whether to include deleted members
+    :type deleted: :class:`bool`
+    :param as_numpy: Whether to return NumPy arrays
+    :type as_numpy: :class:`bool`
+    :param max_workers: Overrides the number of pages fetched at once
+    :type max_workers: :class:`int`
+    :rtype: :class:`dict` of columns
+
+    Usage::
+
+        >>> from emma.columnar import export_members
+        >>> from emma.model.account import Account
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> cols = export_members(acct, as_numpy=True)
+        >>> cols['member_since'].view('datetime64[s]')
+        array(['2013-01-01T00:00:00', ...], dtype='datetime64[s]')
+    """
+    params = {"deleted": True} if deleted else {}
+    rows = account.adapter.iter_paginated('/members', params, max_workers)
+    return _export((_flatten_member(x) for x in rows), as_numpy)
+
+
+def export_report(account, report, id=None, params=None, as_numpy=False,
+                  max_workers=None):
+    """
+    Streams a list report into columns, one per field
+
+    :param account: The account for which this report applies
+    :type account: :class:`Account`
+    :param report: The report (from enumerations.Report)
+    :type report: :class:`int`
+    :param id: An id such as mailing_id or share_id, if the report needs one
+    :type id: :class:`int`
+    :param params: Optional parameters to pass
+    :type params: :class:`dict`
+    :param as_numpy: Whether to return NumPy arrays
+    :type as_numpy: :class:`bool`
+    :param max_workers: Overrides the number of pages fetched at once
+    :type max_workers: :class:`int`
+    :rtype: :class:`dict` of columns
+
+    Usage::
+
+        >>> from emma.columnar import export_report
+        >>> from emma.model.account import Account
+        >>> from emma.enumerations import Report
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> cols = export_report(acct, Report.OpenList, 123)
+        >>> cols['member_id']
+        array('q', [1024, 1025, ...])
+    """
+    if report not in PAGINATED_REPORTS:
+        raise ValueError("Only list reports can be exported to columns")
+    rows = account.adapter.iter_paginated(
+        report_path(report, id), params or {}, max_workers)
+    return _export(rows, as_numpy)
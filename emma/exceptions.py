@@ -12,6 +12,13 @@ class ApiRequest400(ApiRequestFailed):
     """
     pass
 
+class ApiRequest429(ApiRequestFailed):
+    """
+    Denotes a HTTP 429 error (rate limit exceeded) which persisted through
+    every retry
+    """
+    pass
+
 
 class ImportDeleteError(ApiRequestFailed):
     """
@@ -20,6 +27,13 @@ class ImportDeleteError(ApiRequestFailed):
     pass
 
 
+class ImportTimeoutError(ApiRequestFailed):
+    """
+    Imports being waited for did not finish within the time allowed
+    """
+    pass
+
+
 class MemberChangeStatusError(ApiRequestFailed):
     """
     The API call to change a member's status did not complete correctly
@@ -48,6 +62,13 @@ class MemberDropGroupError(ApiRequestFailed):
     pass
 
 
+class MemberImportError(ApiRequestFailed):
+    """
+    The API call to import members did not complete correctly
+    """
+    pass
+
+
 class MemberUpdateError(ApiRequestFailed):
     """
     The API call to update a member's information did not complete correctly
@@ -0,0 +1,465 @@
+"""Local SQLite mirror of an account, for answering reads without the API"""
+
+from datetime import datetime
+import itertools
+import json
+import sqlite3
+import threading
+from emma.enumerations import GroupType
+from emma.query.evaluator import TEXT_TYPES, Evaluator
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    member_id INTEGER PRIMARY KEY,
+    email TEXT,
+    member_status_id TEXT,
+    last_modified_at TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS members_email ON members (email COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS member_fields (
+    member_id INTEGER NOT NULL,
+    shortcut_name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (member_id, shortcut_name)
+);
+CREATE INDEX IF NOT EXISTS member_fields_value
+    ON member_fields (shortcut_name, value);
+CREATE TABLE IF NOT EXISTS groups (
+    member_group_id INTEGER PRIMARY KEY,
+    group_name TEXT,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS memberships (
+    member_group_id INTEGER NOT NULL,
+    member_id INTEGER NOT NULL,
+    PRIMARY KEY (member_group_id, member_id)
+);
+CREATE INDEX IF NOT EXISTS memberships_member
+    ON memberships (member_id, member_group_id);
+CREATE TABLE IF NOT EXISTS fields (
+    field_id INTEGER PRIMARY KEY,
+    shortcut_name TEXT,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mailings (
+    mailing_id INTEGER PRIMARY KEY,
+    name TEXT,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS searches (
+    search_id INTEGER PRIMARY KEY,
+    name TEXT,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+WATERMARK_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _encode(value):
+    """Serializes a model for storage, datetimes included"""
+    return json.dumps(
+        dict(value),
+        default=lambda x: x.strftime(WATERMARK_FORMAT)
+        if isinstance(x, datetime) else str(x))
+
+
+def _field_value(value):
+    """A custom field value as SQLite can store (and compare) it"""
+    if value is None or isinstance(value, (int, float) + TEXT_TYPES):
+        return value
+    return json.dumps(value)
+
+
+class Mirror(object):
+    """
+    Keeps an indexed SQLite copy of an account's members, groups (with their
+    memberships), fields, mailings and searches. Members are synced
+    incrementally after the first time; the watermark is stored alongside
+    them, so later processes pick up where the last sync stopped.
+    Reads are answered from the copy alone, and stay answerable during a
+    sync, which writes a page at a time.
+
+    :param account: The account to mirror
+    :type account: :class:`Account`
+    :param path: The SQLite database file (kept in memory by default)
+    :type path: :class:`str`
+
+    Usage::
+
+        >>> from emma.mirror import Mirror
+        >>> from emma.model.account import Account
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> mirror = Mirror(acct, "account.db")
+        >>> mirror.sync()
+        >>> mirror.members_of_group(1024)
+        [123, 321]
+        >>> mirror.members_with_field('first_name', u"Emma")
+        [123]
+    """
+    PAGE_SIZE = 500
+
+    def __init__(self, account, path=":memory:"):
+        self.account = account
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Closes the database"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def sync(self, full=False, max_workers=None):
+        """
+        Brings every mirrored collection up to date. After the first sync,
+        only the members modified since the last one are fetched, along with
+        their group memberships.
+
+        :param full: Whether to reload every member and every group's
+                     memberships rather than only the modified members'
+        :type full: :class:`bool`
+        :param max_workers: The number of memberships fetched at once
+        :type max_workers: :class:`int`
+        :rtype: :class:`None`
+        """
+        self.sync_fields()
+        member_ids, reloaded = self._sync_members(full)
+        self.sync_groups(reloaded, max_workers, member_ids)
+        self.sync_mailings()
+        self.sync_searches()
+
+    def sync_members(self, full=False):
+        """
+        Copies the members modified since the last sync, or every member the
+        first time (or when `full`)
+
+        Modified members are found through
+        :meth:`AccountMemberCollection.fetch_modified_since`, which cannot
+        see deletions: when the account holds fewer members than the copy
+        afterwards, every member is reloaded (so deletions offset by as many
+        additions wait for a full sync).
+
+        :param full: Whether to reload every member
+        :type full: :class:`bool`
+        :rtype: :class:`int` the number of members copied
+        """
+        return len(self._sync_members(full)[0])
+
+    def sync_groups(self, full=False, max_workers=None, member_ids=None):
+        """
+        Replaces the copy of every group. The memberships of every group are
+        reloaded the first time (or when `full`); otherwise only those of
+        `member_ids`, as members are modified, are refreshed.
+
+        :param full: Whether to reload the memberships of every group
+        :type full: :class:`bool`
+        :param max_workers: The number of memberships fetched at once
+        :type max_workers: :class:`int`
+        :param member_ids: The members whose memberships to refresh
+        :type member_ids: :class:`list` of :class:`int`
+        :rtype: :class:`None`
+        """
+        adapter = self.account.adapter
+        groups = list(self.account.groups.iter_all(
+            [GroupType.RegularGroup, GroupType.TestGroup, GroupType.HiddenGroup]))
+        full = full or self._watermark('memberships') is None
+        if full:
+            keys = groups
+            memberships = adapter.map(
+                lambda x: [y['member_id'] for y in adapter.iter_paginated(
+                    '/groups/%s/members' % x['member_group_id'])],
+                groups,
+                max_workers)
+        else:
+            keys = list(member_ids or [])
+            memberships = adapter.map(
+                lambda x: [y['member_group_id'] for y in adapter.iter_paginated(
+                    '/members/%s/groups' % x)],
+                keys,
+                max_workers)
+
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM groups")
+            self.connection.executemany(
+                "INSERT INTO groups VALUES (?, ?, ?)",
+                [(x['member_group_id'], x.get('group_name'), _encode(x))
+                 for x in groups])
+            if full:
+                self.connection.execute("DELETE FROM memberships")
+                rows = [(x[0]['member_group_id'], y)
+                        for x in zip(keys, memberships) for y in x[1]]
+            else:
+                self.connection.executemany(
+                    "DELETE FROM memberships WHERE member_id = ?",
+                    [(x,) for x in keys])
+                self.connection.execute(
+                    "DELETE FROM memberships WHERE member_group_id NOT IN "
+                    "(SELECT member_group_id FROM groups)")
+                rows = [(y, x[0]) for x in zip(keys, memberships) for y in x[1]]
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO memberships VALUES (?, ?)", rows)
+            self._set_watermark('memberships', datetime.utcnow())
+
+    def sync_fields(self):
+        """Replaces the copy of every field"""
+        self._replace('fields', 'field_id', 'shortcut_name',
+                      self.account.fields.iter_all())
+
+    def sync_mailings(self):
+        """Replaces the copy of every mailing"""
+        self._replace('mailings', 'mailing_id', 'name',
+                      self.account.mailings.iter_all())
+
+    def sync_searches(self):
+        """Replaces the copy of every search"""
+        self._replace('searches', 'search_id', 'name',
+                      self.account.searches.iter_all())
+
+    def member(self, member_id):
+        """
+        A mirrored member
+
+        :param member_id: The member identifier
+        :type member_id: :class:`int`
+        :rtype: :class:`dict` (datetimes as strings) or :class:`None`
+        """
+        return self._one_raw(
+            "SELECT raw FROM members WHERE member_id = ?", (member_id,))
+
+    def member_by_email(self, email):
+        """
+        A mirrored member, by case-insensitive email
+
+        :param email: The member's email address
+        :type email: :class:`str`
+        :rtype: :class:`dict` (datetimes as strings) or :class:`None`
+        """
+        return self._one_raw(
+            "SELECT raw FROM members WHERE email = ? COLLATE NOCASE", (email,))
+
+    def members_of_group(self, group_id):
+        """
+        The mirrored members of a group
+
+        :param group_id: The group identifier
+        :type group_id: :class:`int`
+        :rtype: :class:`list` of member identifiers
+        """
+        return self._column(
+            "SELECT member_id FROM memberships WHERE member_group_id = ? "
+            "ORDER BY member_id", (group_id,))
+
+    def groups_of_member(self, member_id):
+        """
+        The mirrored groups of a member
+
+        :param member_id: The member identifier
+        :type member_id: :class:`int`
+        :rtype: :class:`list` of group identifiers
+        """
+        return self._column(
+            "SELECT member_group_id FROM memberships WHERE member_id = ? "
+            "ORDER BY member_group_id", (member_id,))
+
+    def members_with_field(self, shortcut_name, value):
+        """
+        The mirrored members with a custom field value
+
+        :param shortcut_name: The field's shortcut name
+        :type shortcut_name: :class:`str`
+        :param value: The value to match
+        :type value: :class:`str`, :class:`int` or :class:`float`
+        :rtype: :class:`list` of member identifiers
+        """
+        return self._column(
+            "SELECT member_id FROM member_fields "
+            "WHERE shortcut_name = ? AND value = ? ORDER BY member_id",
+            (shortcut_name, _field_value(value)))
+
+    def field_value(self, member_id, shortcut_name):
+        """
+        A mirrored member's custom field value
+
+        :param member_id: The member identifier
+        :type member_id: :class:`int`
+        :param shortcut_name: The field's shortcut name
+        :type shortcut_name: :class:`str`
+        :rtype: The value, or :class:`None`
+        """
+        values = self._column(
+            "SELECT value FROM member_fields "
+            "WHERE member_id = ? AND shortcut_name = ?",
+            (member_id, shortcut_name))
+        return values[0] if values else None
+
+    def find(self, query, now=None):
+        """
+        The mirrored members which match a search query, evaluated locally
+
+        :param query: The query
+        :type query: :class:`CompositeQuery`
+        :param now: The moment relative dates are measured from (defaults to
+                    the current UTC time)
+        :type now: :class:`datetime`
+        :rtype: :class:`list` of member identifiers
+        """
+        evaluator = Evaluator(query, now)
+        members = (json.loads(x[0]) for x in self.query(
+            "SELECT raw FROM members ORDER BY member_id"))
+        return [x['member_id'] for x in evaluator.filter(members)]
+
+    def query(self, sql, params=()):
+        """
+        Runs any query against the mirror
+
+        :param sql: The SQL statement
+        :type sql: :class:`str`
+        :param params: The statement's parameters
+        :type params: :class:`tuple`
+        :rtype: :class:`list` of :class:`tuple` rows
+        """
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def _sync_members(self, full):
+        """
+        Copies the modified (or every) member a page at a time
+
+        :rtype: :class:`tuple` of the IDs copied, and whether every member
+                was reloaded
+        """
+        since = None if full else self._watermark('members')
+        shortcuts = self.account.fields.shortcut_names()
+        if since is None:
+            return self._reload_members(shortcuts), True
+
+        members = list(
+            self.account.members.fetch_modified_since(since).values())
+        latest = since
+        for page in self._pages(members):
+            with self._lock, self.connection:
+                for member in page:
+                    if member.get('deleted_at'):
+                        self._delete_member(member['member_id'])
+                    else:
+                        self._store_member(member, shortcuts)
+            latest = max([latest] + [
+                x['last_modified_at'] for x in page
+                if x.get('last_modified_at') is not None])
+
+        stored = self.query("SELECT COUNT(*) FROM members")[0][0]
+        if self.account.adapter.count('/members') < stored:
+            return self._reload_members(shortcuts), True
+        with self._lock, self.connection:
+            self._set_watermark('members', latest)
+        return [x['member_id'] for x in members if not x.get('deleted_at')], False
+
+    def _reload_members(self, shortcuts):
+        """
+        Copies every member, a page per transaction, then drops those no
+        longer in the account
+
+        :rtype: :class:`list` of the IDs copied
+        """
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS synced_members "
+                "(member_id INTEGER PRIMARY KEY)")
+            self.connection.execute("DELETE FROM synced_members")
+
+        member_ids = []
+        latest = None
+        for page in self._pages(self.account.members.iter_records()):
+            with self._lock, self.connection:
+                for member in page:
+                    self._store_member(member, shortcuts)
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO synced_members VALUES (?)",
+                    [(x['member_id'],) for x in page])
+            member_ids.extend(x['member_id'] for x in page)
+            stamps = [x['last_modified_at'] for x in page
+                      if x.get('last_modified_at') is not None]
+            if stamps:
+                latest = max(stamps + ([latest] if latest else []))
+
+        with self._lock, self.connection:
+            for table in ('members', 'member_fields', 'memberships'):
+                self.connection.execute(
+                    "DELETE FROM %s WHERE member_id NOT IN "
+                    "(SELECT member_id FROM synced_members)" % table)
+            if latest is not None:
+                self._set_watermark('members', latest)
+        return member_ids
+
+    def _pages(self, items):
+        """Buffers items a page at a time, so none is written mid-request"""
+        items = iter(items)
+        while True:
+            page = list(itertools.islice(items, self.__class__.PAGE_SIZE))
+            if not page:
+                return
+            yield page
+
+    def _set_watermark(self, name, moment):
+        """Store the watermark of a collection (within a transaction)"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+            (name, moment.strftime(WATERMARK_FORMAT)))
+
+    def _delete_member(self, member_id):
+        """Drop a single member, its custom field values and memberships"""
+        for table in ('members', 'member_fields', 'memberships'):
+            self.connection.execute(
+                "DELETE FROM %s WHERE member_id = ?" % table, (member_id,))
+
+    def _watermark(self, name):
+        """The stored watermark of a collection"""
+        rows = self.query("SELECT value FROM sync_state WHERE name = ?", (name,))
+        return (datetime.strptime(rows[0][0], WATERMARK_FORMAT)
+                if rows else None)
+
+    def _store_member(self, member, shortcuts):
+        """Upsert a single member and its custom field values"""
+        member_id = member['member_id']
+        modified = member.get('last_modified_at')
+        self.connection.execute(
+            "INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?)",
+            (member_id, member.get('email'), member.get('member_status_id'),
+             modified.strftime(WATERMARK_FORMAT) if modified else None,
+             _encode(member)))
+        self.connection.execute(
+            "DELETE FROM member_fields WHERE member_id = ?", (member_id,))
+        self.connection.executemany(
+            "INSERT INTO member_fields VALUES (?, ?, ?)",
+            [(member_id, x, _field_value(member[x]))
+             for x in member if x in shortcuts])
+
+    def _replace(self, table, key, name, items):
+        """Replace every row of a simple table"""
+        items = list(items)
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM %s" % table)
+            self.connection.executemany(
+                "INSERT INTO %s VALUES (?, ?, ?)" % table,
+                [(x[key], x.get(name), _encode(x)) for x in items])
+
+    def _one_raw(self, sql, params):
+        """Decode the stored model of a single row"""
+        rows = self.query(sql, params)
+        return json.loads(rows[0][0]) if rows else None
+
+    def _column(self, sql, params):
+        """The first column of every row"""
+        return [x[0] for x in self.query(sql, params)]
@@ -2,27 +2,119 @@
 
 import collections
 from datetime import datetime
+import functools
 
 
 SERIALIZED_DATETIME_FORMAT = "@D:%Y-%m-%dT%H:%M:%S"
 SERIALIZED_DATETIME_ALT_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+DATETIME_MEMO_SIZE = 4096
+
+
+def _memoize(parse):
+    """Remembers up to :data:`DATETIME_MEMO_SIZE` values parsed by `parse`"""
+    memo = {}
+
+    def parse_memoized(value):
+        try:
+            return memo[value]
+        except KeyError:
+            if len(memo) >= DATETIME_MEMO_SIZE:
+                memo.clear()
+            parsed = memo[value] = parse(value)
+            return parsed
+    parse_memoized.memo = memo
+    return parse_memoized
+
+
+def _parse_serialized(value):
+    """Slices apart a :data:`SERIALIZED_DATETIME_FORMAT` value"""
+    digits = value[3:7] + value[8:10] + value[11:13] \
+        + value[14:16] + value[17:19] + value[20:22]
+    if (len(value) != 22 or value[:3] != "@D:" or value[7] != "-"
+            or value[10] != "-" or value[13] != "T" or value[16] != ":"
+            or value[19] != ":" or not digits.isdigit()):
+        return datetime.strptime(value, SERIALIZED_DATETIME_FORMAT)
+    return datetime(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]), int(digits[12:14]))
+
+
+def _parse_serialized_alt(value):
+    """Slices apart a :data:`SERIALIZED_DATETIME_ALT_FORMAT` value"""
+    digits = value[0:4] + value[5:7] + value[8:10] \
+        + value[11:13] + value[14:16] + value[17:19] + value[20:]
+    if (not 21 <= len(value) <= 26 or value[4] != "-" or value[7] != "-"
+            or value[10] != " " or value[13] != ":" or value[16] != ":"
+            or value[19] != "." or not digits.isdigit()):
+        return datetime.strptime(value, SERIALIZED_DATETIME_ALT_FORMAT)
+    return datetime(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]), int(digits[12:14]),
+                    int(digits[14:].ljust(6, "0")))
+
+
+parse_datetime = _memoize(_parse_serialized)
+parse_datetime.__doc__ = \
+    """Parses a :data:`SERIALIZED_DATETIME_FORMAT` value to :class:`datetime`"""
+
+parse_datetime_alt = _memoize(_parse_serialized_alt)
+parse_datetime_alt.__doc__ = \
+    """Parses a :data:`SERIALIZED_DATETIME_ALT_FORMAT` value to :class:`datetime`"""
 
 
 def str_fields_to_datetime(fields, raw):
     """Parses Emma date fields to :class:`datetime` objects"""
-    return dict((x[0], datetime.strptime(x[1], SERIALIZED_DATETIME_FORMAT))
+    return dict((x[0], parse_datetime(x[1]))
         for x in list(raw.items()) if x[0] in fields and x[1] is not None)
 
 
 def str_fields_to_datetime_alt(fields, raw):
     """Parses Emma date fields to :class:`datetime` objects"""
-    return dict((x[0], datetime.strptime(x[1], SERIALIZED_DATETIME_ALT_FORMAT))
+    return dict((x[0], parse_datetime_alt(x[1]))
                 for x in list(raw.items()) if x[0] in fields and x[1] is not None)
 
 
+def traced(method):
+    """
+    Runs a collection method inside a span of its account's adapter, named
+    after the collection and the method (`AccountMemberCollection.save`)
+    """
+    @functools.wraps(method)
+    def run_traced(self, *args, **kwargs):
+        with self.account.adapter.span(
+                "%s.%s" % (self.__class__.__name__, method.__name__)):
+            return method(self, *args, **kwargs)
+    return run_traced
+
+
+class lazy_property(object):
+    """
+    Computes an attribute the first time it is read, then stores it on the
+    instance so later reads are plain attribute lookups
+    """
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.__name__] = self.func(instance)
+        return value
+
+
 class BaseApiModel(collections.MutableMapping):
-    """Creates a model with dictionary access"""
+    """
+    Creates a model with dictionary access. Keys assigned or deleted through
+    dictionary access are tracked as dirty until the model is saved.
+
+    Date fields are parsed as the model is created, or, when
+    :attr:`lazy_datetimes` is set, the first time each one is read.
+    """
+    lazy_datetimes = False
+
     def __init__(self, raw=None):
+        self._dirty = set()
+        self._unparsed = {}
         self._dict = self._parse_raw(raw) if raw else {}
 
     def __len__(self):
@@ -31,13 +123,21 @@ class BaseApiModel(collections.MutableMapping):
     def __getitem__(self, key):
         if key not in self._dict:
             raise KeyError(key)
+        if self._unparsed:
+            parse = self._unparsed.pop(key, None)
+            if parse is not None:
+                self._dict[key] = parse(self._dict[key])
         return self._dict.__getitem__(key)
 
     def __setitem__(self, key, value):
         self._dict.__setitem__(key, value)
+        self._unparsed.pop(key, None)
+        self._dirty.add(key)
 
     def __delitem__(self, key):
         self._dict.__delitem__(key)
+        self._unparsed.pop(key, None)
+        self._dirty.add(key)
 
     def __iter__(self):
         return self._dict.__iter__()
@@ -51,6 +151,26 @@ class BaseApiModel(collections.MutableMapping):
     def clear(self):
         self._dict = {}
 
+    def is_dirty(self):
+        """
+        Whether any key has been modified since this model was loaded or saved
+
+        :rtype: :class:`bool`
+        """
+        return bool(self._dirty)
+
+    def dirty_keys(self):
+        """
+        The keys modified since this model was loaded or saved
+
+        :rtype: :class:`frozenset`
+        """
+        return frozenset(self._dirty)
+
+    def _mark_clean(self):
+        """Forget modifications once they have been saved"""
+        self._dirty = set()
+
     def _replace_all(self, items):
         """Update the internal :class:`dict` with matching items provided"""
         is_new = lambda x: x[0] not in self._dict
@@ -64,6 +184,26 @@ class BaseApiModel(collections.MutableMapping):
                 + [x for x in list(items.items()) if is_new(x)]
             )
 
+    def _parse_datetimes(self, fields, raw, parse=parse_datetime):
+        """
+        Parses date fields of a raw API value in place, or marks them to be
+        parsed on first access when :attr:`lazy_datetimes` is set
+
+        :param fields: The names of the date fields
+        :type fields: :class:`list` of :class:`str`
+        :param raw: The raw API value to parse
+        :type raw: :class:`dict`
+        :param parse: Parses a single date string
+        :type parse: :class:`callable`
+        :rtype: :class:`dict`
+        """
+        present = [x for x in fields if raw.get(x) is not None]
+        if self.__class__.lazy_datetimes:
+            self._unparsed.update((x, parse) for x in present)
+        else:
+            raw.update((x, parse(raw[x])) for x in present)
+        return raw
+
     def _parse_raw(self, raw):
         """
         Placeholder, will normally be overridden
@@ -1,11 +1,15 @@
 """The aggregate root (Account) and collections owned by the root"""
 
+import collections
+from datetime import datetime
+import time
 from emma import exceptions as ex
 from emma.adapter.requests_adapter import RequestsAdapter
-from emma.model import BaseApiModel
+from emma.model import BaseApiModel, traced
 from emma.enumerations import MemberStatus
+from emma.query.factory import QueryFactory
 import emma.model.mailing
-from emma.model.member import Member
+from emma.model.member import Member, MemberRecord
 import emma.model.member_import
 import emma.model.field
 import emma.model.group
@@ -15,6 +19,35 @@ import emma.model.webhook
 import emma.model.automation
 
 
+def _find_many(collection, keys, find_one, cached=None, max_workers=None,
+               normalize=None):
+    """
+    Looks up several items of an account collection at once: duplicates
+    (after `normalize`) are looked up once, items already loaded are served
+    from the collection (or by `cached`) and the rest are found concurrently
+    on the account adapter's workers
+
+    :rtype: :class:`dict` of every key to its item, or `None` if missing
+    """
+    cached = cached or collection._dict.get
+    normalize = normalize or (lambda x: x)
+    given = collections.OrderedDict()
+    found = {}
+    for key in keys:
+        if key in given:
+            continue
+        given[key] = True
+        if normalize(key) not in found:
+            found[normalize(key)] = (key, cached(key))
+
+    misses = [x[0] for x in found.values() if x[1] is None]
+    for key, item in zip(misses, collection.account.adapter.map(
+            find_one, misses, max_workers)):
+        found[normalize(key)] = (key, item)
+    return collections.OrderedDict(
+        (x, found[normalize(x)][1]) for x in given)
+
+
 class Account(object):
     """
     Aggregate root for the API context
@@ -68,6 +101,7 @@ class AccountFieldCollection(BaseApiModel):
     """
     def __init__(self, account):
         self.account = account
+        self._shortcuts = None
         super(AccountFieldCollection, self).__init__()
 
     def __getitem__(self, key):
@@ -79,6 +113,10 @@ class AccountFieldCollection(BaseApiModel):
     def __delitem__(self, key):
         self._dict[key].delete()
 
+    def clear(self):
+        super(AccountFieldCollection, self).clear()
+        self.invalidate_shortcuts()
+
     def factory(self, raw=None):
         """
         New :class:`Field` factory
@@ -98,6 +136,7 @@ class AccountFieldCollection(BaseApiModel):
         """
         return emma.model.field.Field(self.account, raw)
 
+    @traced
     def fetch_all(self, deleted=False):
         """
         Lazy-loads the full set of :class:`Field` objects
@@ -113,14 +152,32 @@ class AccountFieldCollection(BaseApiModel):
             >>> acct.fields.fetch_all()
             {123: <Field>, 321: <Field>, ...}
         """
-        path = '/fields'
-        params = {"deleted":True} if deleted else {}
         if not self._dict:
-            self._dict = dict(
-                (x['field_id'], emma.model.field.Field(self.account, x))
-                    for x in self.account.adapter.paginated_get(path, params))
+            self._dict = dict((x['field_id'], x) for x in self.iter_all(deleted))
+            self.invalidate_shortcuts()
         return self._dict
 
+    def iter_all(self, deleted=False):
+        """
+        Streams the full set of :class:`Field` objects page by page.
+        *Does not lazy-load*
+
+        :param deleted: Whether to include deleted fields
+        :type deleted: :class:`bool`
+        :rtype: generator of :class:`Field` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for fld in acct.fields.iter_all():
+            ...     print(fld['shortcut_name'])
+        """
+        path = '/fields'
+        params = {"deleted":True} if deleted else {}
+        return (emma.model.field.Field(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
+
     def find_one_by_field_id(self, field_id, deleted=False):
         """
         Lazy-loads a single :class:`Field` by ID
@@ -150,6 +207,7 @@ class AccountFieldCollection(BaseApiModel):
             raw = self.account.adapter.get(path, params)
             if raw:
                 self._dict[field_id] = field.Field(self.account, raw)
+                self.invalidate_shortcuts()
         return (field_id in self._dict) and self._dict[field_id] or None
 
     def export_shortcuts(self):
@@ -167,6 +225,34 @@ class AccountFieldCollection(BaseApiModel):
         """
         return [x['shortcut_name'] for x in list(self.fetch_all().values())]
 
+    def shortcut_names(self):
+        """
+        Get the shortcut names for this account as a cached
+        :class:`frozenset`, for fast membership tests. The cache is refreshed
+        whenever the fields are reloaded, or a :class:`Field` is added,
+        updated or deleted. An account without fields is never cached, so
+        they are looked up again next time.
+
+        :rtype: :class:`frozenset` of :class:`str`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.fields.shortcut_names()
+            frozenset(["first_name", "last_name", ...])
+        """
+        if self._shortcuts is None:
+            shortcuts = frozenset(self.export_shortcuts())
+            if not shortcuts:
+                return shortcuts
+            self._shortcuts = shortcuts
+        return self._shortcuts
+
+    def invalidate_shortcuts(self):
+        """Forget the cached shortcut names"""
+        self._shortcuts = None
+
 
 class AccountGroupCollection(BaseApiModel):
     """
@@ -208,6 +294,7 @@ class AccountGroupCollection(BaseApiModel):
         """
         return emma.model.group.Group(self.account, raw)
 
+    @traced
     def fetch_all(self, group_types=None):
         """
         Lazy-loads the full set of :class:`Group` objects
@@ -224,14 +311,30 @@ class AccountGroupCollection(BaseApiModel):
             >>> acct.groups.fetch_all([GroupType.TestGroup])
             {007: <Group>}
         """
-        path = '/groups'
-        params = {'group_types': group_types} if group_types else {}
         if not self._dict:
             self._dict = dict(
-                (x['member_group_id'], emma.model.group.Group(self.account, x))
-                    for x in self.account.adapter.paginated_get(path, params))
+                (x['member_group_id'], x) for x in self.iter_all(group_types))
         return self._dict
 
+    def iter_all(self, group_types=None):
+        """
+        Streams the full set of :class:`Group` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Group` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for grp in acct.groups.iter_all():
+            ...     print(grp['group_name'])
+        """
+        path = '/groups'
+        params = {'group_types': group_types} if group_types else {}
+        return (emma.model.group.Group(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
+
     def find_one_by_group_id(self, group_id):
         """
         Lazy-loads a single :class:`Group` by ID
@@ -261,6 +364,30 @@ class AccountGroupCollection(BaseApiModel):
 
         return (group_id in self._dict) and self._dict[group_id] or None
 
+    @traced
+    def find_many_by_group_ids(self, group_ids, max_workers=None):
+        """
+        Lazy-loads several :class:`Group` objects by ID, fetching those not
+        yet loaded concurrently
+
+        :param group_ids: The group identifiers (duplicates are fetched once)
+        :type group_ids: :class:`list` of :class:`int` or :class:`str`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`dict` of each ID to its :class:`Group` or :class:`None`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.groups.find_many_by_group_ids([123, 0, 123])
+            {123: <Group>, 0: None}
+        """
+        return _find_many(
+            self, [int(x) for x in group_ids], self.find_one_by_group_id,
+            max_workers=max_workers)
+
+    @traced
     def save(self, groups=None):
         """
         :param groups: List of :class:`Group` objects to save
@@ -299,6 +426,8 @@ class AccountImportCollection(BaseApiModel):
     :param account: The Account which owns this collection
     :type account: :class:`Account`
     """
+    WAIT_TIMEOUT = 3600
+
     def __init__(self, account):
         self.account = account
         super(AccountImportCollection, self).__init__()
@@ -312,6 +441,7 @@ class AccountImportCollection(BaseApiModel):
     def __delitem__(self, key):
         self.delete([key])
 
+    @traced
     def fetch_all(self):
         """
         Lazy-loads the full set of :class:`Import` objects
@@ -326,14 +456,29 @@ class AccountImportCollection(BaseApiModel):
             {123: <Import>, 321: <Import>, ...}
 
         """
-        path = '/members/imports'
         if not self._dict:
-            import_ = emma.model.member_import
-            self._dict = dict(
-                (x['import_id'], import_.MemberImport(self.account, x))
-                    for x in self.account.adapter.paginated_get(path, {}))
+            self._dict = dict((x['import_id'], x) for x in self.iter_all())
         return self._dict
 
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Import` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Import` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for imprt in acct.imports.iter_all():
+            ...     print(imprt['import_id'])
+        """
+        path = '/members/imports'
+        import_ = emma.model.member_import
+        return (import_.MemberImport(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, {}))
+
     def find_one_by_import_id(self, import_id):
         """
         Lazy-loads a single :class:`Import` by ID
@@ -363,6 +508,52 @@ class AccountImportCollection(BaseApiModel):
 
         return (import_id in self._dict) and self._dict[import_id] or None
 
+    def wait(self, import_ids, poll_interval=5, max_workers=None,
+             timeout=None):
+        """
+        Polls the given imports until every one of them has finished
+
+        :param import_ids: Set of import identifiers to wait for
+        :type import_ids: :class:`list` of :class:`int`
+        :param poll_interval: Seconds between polls
+        :type poll_interval: :class:`int`
+        :param max_workers: The number of imports polled at once (defaults to
+                            the adapter's number of workers)
+        :type max_workers: :class:`int`
+        :param timeout: Seconds to wait before raising
+                        :class:`ImportTimeoutError` (defaults to
+                        :attr:`WAIT_TIMEOUT`)
+        :type timeout: :class:`int`
+        :rtype: :class:`dict` of :class:`Import` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.imports.wait([2001, 2002])
+            {2001: <Import>, 2002: <Import>}
+        """
+        import_ = emma.model.member_import
+        fetch = lambda x: self.account.adapter.get('/members/imports/%s' % x)
+        deadline = time.time() + (
+            self.__class__.WAIT_TIMEOUT if timeout is None else timeout)
+        pending = [int(x) for x in import_ids]
+        while pending:
+            for raw in self.account.adapter.map(fetch, pending, max_workers):
+                if raw:
+                    self._dict[raw['import_id']] = \
+                        import_.MemberImport(self.account, raw)
+            pending = [x for x in pending
+                       if x in self._dict and not self._dict[x].is_finished()]
+            if pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise ex.ImportTimeoutError(
+                        "Imports still running: %s" % pending)
+                time.sleep(min(poll_interval, remaining))
+
+        return dict((x, self._dict.get(int(x))) for x in import_ids)
+
     def delete(self, import_ids=None):
         """
         :param import_ids: Set of import identifiers to delete
@@ -397,8 +588,13 @@ class AccountMemberCollection(BaseApiModel):
     :param account: The Account which owns this collection
     :type account: :class:`Account`
     """
+    IMPORT_CHUNK_SIZE = 5000
+
     def __init__(self, account):
         self.account = account
+        self.synced_at = None
+        self._emails = {}
+        self._indexed = None
         super(AccountMemberCollection, self).__init__()
 
     def __getitem__(self, key):
@@ -410,10 +606,51 @@ class AccountMemberCollection(BaseApiModel):
             raise KeyError(key)
         return item
 
+    def __setitem__(self, key, value):
+        super(AccountMemberCollection, self).__setitem__(key, value)
+        self._index_email(value)
+
     def __delitem__(self, key):
         self._dict[key].delete()
+        self._unindex_email(self._dict[key])
         super(AccountMemberCollection, self).__delitem__(key)
 
+    def _email_index(self):
+        """
+        The case-normalized email to member identifier index, rebuilt
+        whenever the internal :class:`dict` is replaced (as by
+        :meth:`fetch_all`, :meth:`_replace_all` or :meth:`delete`)
+        """
+        if self._indexed is not self._dict:
+            self._emails = dict(
+                (x[1]['email'].lower(), x[0]) for x in list(self._dict.items())
+                    if x[1].get('email'))
+            self._indexed = self._dict
+        return self._emails
+
+    def _index_email(self, member):
+        """Add a single member to the email index"""
+        if member.get('email') and 'member_id' in member:
+            self._email_index()[member['email'].lower()] = member['member_id']
+
+    def _unindex_email(self, member):
+        """Remove a single member from the email index"""
+        if member.get('email'):
+            self._email_index().pop(member['email'].lower(), None)
+
+    def _reindex_email(self, member, email):
+        """Keep the email index in step with a cached member's new email"""
+        if self._dict.get(member.get('member_id')) is member:
+            self._unindex_email(member)
+            self._email_index()[email.lower()] = member['member_id']
+
+    def _cached_by_email(self, email):
+        """Look up a cached member through the email index"""
+        member = self._dict.get(self._email_index().get(email.lower()))
+        if member is not None and member.get('email', '').lower() == email.lower():
+            return member
+        return None
+
     def factory(self, raw=None):
         """
         New :class:`Member` factory
@@ -433,6 +670,7 @@ class AccountMemberCollection(BaseApiModel):
         """
         return Member(self.account, raw)
 
+    @traced
     def fetch_all(self, deleted=False):
         """
         Lazy-loads the full set of :class:`Member` objects
@@ -448,14 +686,141 @@ class AccountMemberCollection(BaseApiModel):
             >>> acct.members.fetch_all()
             {123: <Member>, 321: <Member>, ...}
         """
-        path = '/members'
-        params = {"deleted": True} if deleted else {}
         if not self._dict:
-            self._dict = dict(
-                (x['member_id'], Member(self.account, x)) for x in
-                    self.account.adapter.paginated_get(path, params))
+            self._dict = dict((x['member_id'], x) for x in self.iter_all(deleted))
         return self._dict
 
+    def iter_all(self, deleted=False):
+        """
+        Streams the full set of :class:`Member` objects page by page, so an
+        audience of any size can be exported in constant memory.
+        *Does not lazy-load*
+
+        :param deleted: Whether to include deleted members
+        :type deleted: :class:`bool`
+        :rtype: generator of :class:`Member` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for mbr in acct.members.iter_all():
+            ...     print(mbr['email'])
+        """
+        path = '/members'
+        params = {"deleted": True} if deleted else {}
+        return (Member(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
+
+    def iter_records(self, deleted=False):
+        """
+        Streams the full set of members as compact, read-only
+        :class:`MemberRecord` objects, for bulk reads of large audiences.
+        *Does not lazy-load*
+
+        :param deleted: Whether to include deleted members
+        :type deleted: :class:`bool`
+        :rtype: generator of :class:`MemberRecord` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> emails = [x['email'] for x in acct.members.iter_records()]
+        """
+        path = '/members'
+        params = {"deleted": True} if deleted else {}
+        return (MemberRecord(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
+
+    def sync(self, since=None):
+        """
+        Brings the collection up to date by fetching only the members
+        modified since the last sync (or since `since`), through a temporary
+        search on `last_modified_at`. The first sync of an empty collection
+        loads every member. Cached members with unsaved changes are kept.
+
+        The API only finds members who still match a search, so members
+        deleted since the last sync stay in the collection, and members who
+        opted out are only updated if the search still returns them;
+        :meth:`fetch_all` on a cleared collection picks up both. Each sync
+        creates (and deletes) one account search.
+
+        :param since: Overrides the watermark of the last sync
+        :type since: :class:`datetime`
+        :rtype: :class:`dict` of the :class:`Member` objects fetched
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.members.sync() # everyone, the first time
+            {123: <Member>, 321: <Member>, ...}
+            >>> acct.members.synced_at
+            datetime.datetime(2013, 1, 1, 12, 0)
+            >>> acct.members.sync() # an hour later
+            {321: <Member>}
+        """
+        if since is None and self._dict:
+            since = self.synced_at or self._last_modified(
+                list(self._dict.values()))
+
+        fetched = (self.fetch_modified_since(since)
+                   if since is not None
+                   else dict((x['member_id'], x) for x in self.iter_all()))
+        for member_id, member in list(fetched.items()):
+            cached = self._dict.get(member_id)
+            if cached is None or not cached.is_dirty():
+                self._dict[member_id] = member
+                self._index_email(member)
+
+        latest = self._last_modified(list(fetched.values()))
+        if latest is not None and (since is None or latest > since):
+            self.synced_at = latest
+        elif self.synced_at is None:
+            self.synced_at = since
+        return fetched
+
+    def fetch_modified_since(self, since):
+        """
+        Fetches the members modified since a moment, through a temporary
+        search on `last_modified_at` (created and then deleted, so each call
+        makes four requests or more). Deleted members are not found.
+        *Does not lazy-load*
+
+        :param since: The moment, in UTC as the API's timestamps are
+        :type since: :class:`datetime`
+        :rtype: :class:`dict` of :class:`Member` objects
+
+        Usage::
+
+            >>> from datetime import datetime
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.members.fetch_modified_since(datetime(2013, 1, 1))
+            {321: <Member>}
+        """
+        days = (datetime.utcnow() - since).days + 2
+        search = emma.model.search.Search(self.account, {
+            'name': "Members modified since %s" % since.isoformat(),
+            'criteria': list(QueryFactory.in_last(
+                'last_modified_at', {'day': days}).to_tuple())
+        })
+        search.save()
+        try:
+            return dict((x['member_id'], x) for x in search.members.iter_all()
+                        if x.get('last_modified_at') is None
+                        or x['last_modified_at'] >= since)
+        finally:
+            search.delete()
+
+    @staticmethod
+    def _last_modified(members):
+        """The latest `last_modified_at` of some members, if any have one"""
+        stamps = [x['last_modified_at'] for x in members
+                  if x.get('last_modified_at') is not None]
+        return max(stamps) if stamps else None
+
     def fetch_all_by_import_id(self, import_id):
         """
         Updates the collection with a dictionary of all members from a given
@@ -506,10 +871,40 @@ class AccountMemberCollection(BaseApiModel):
         if member_id not in self._dict:
             raw = self.account.adapter.get(path, params)
             if raw:
-                self._dict[member_id] = Member(self.account, raw)
+                # Concurrent callers keep the first member stored, not their own
+                member = self._dict.setdefault(
+                    member_id, Member(self.account, raw))
+                self._index_email(member)
 
         return (member_id in self._dict) and self._dict[member_id] or None
 
+    @traced
+    def find_many_by_member_ids(self, member_ids, deleted=False,
+                                max_workers=None):
+        """
+        Lazy-loads several :class:`Member` objects by ID, fetching those not
+        yet loaded concurrently
+
+        :param member_ids: The member identifiers (duplicates are fetched once)
+        :type member_ids: :class:`list` of :class:`int`
+        :param deleted: Whether to include deleted members
+        :type deleted: :class:`bool`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`dict` of each ID to its :class:`Member` or :class:`None`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.members.find_many_by_member_ids([123, 0, 123])
+            {123: <Member{'member_id': 123, ...}>, 0: None}
+        """
+        return _find_many(
+            self, [int(x) for x in member_ids],
+            lambda x: self.find_one_by_member_id(x, deleted),
+            max_workers=max_workers)
+
     def find_one_by_email(self, email, deleted=False):
         """
         Lazy-loads a single :class:`Member` by email address
@@ -533,17 +928,45 @@ class AccountMemberCollection(BaseApiModel):
         """
         path = '/members/email/%s' % email
         params = {"deleted":True} if deleted else {}
-        members = [x for x in list(self._dict.values()) if x['email'] == email]
-        if not members:
+        member = self._cached_by_email(email)
+        if member is None:
             member = self.account.adapter.get(path, params)
             if member is not None:
                 self._dict[member['member_id']] = \
                     Member(self.account, member)
+                self._index_email(self._dict[member['member_id']])
                 return self._dict[member['member_id']]
-        else:
-            member = members[0]
         return member
 
+    @traced
+    def find_many_by_emails(self, emails, deleted=False, max_workers=None):
+        """
+        Lazy-loads several :class:`Member` objects by email address, fetching
+        those not yet loaded concurrently
+
+        :param emails: The email addresses (duplicates, in any case, are
+                       fetched once)
+        :type emails: :class:`list` of :class:`str`
+        :param deleted: Whether to include deleted members
+        :type deleted: :class:`bool`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`dict` of each address to its :class:`Member` or
+                :class:`None`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.members.find_many_by_emails(
+            ...     ["test@example.com", "null@example.com"])
+            {'test@example.com': <Member{...}>, 'null@example.com': None}
+        """
+        return _find_many(
+            self, emails, lambda x: self.find_one_by_email(x, deleted),
+            self._cached_by_email, max_workers, lambda x: x.lower())
+
+    @traced
     def save(self, members=None, filename=None, add_only=False,
              group_ids=None):
         """
@@ -573,23 +996,103 @@ class AccountMemberCollection(BaseApiModel):
             ... ])
             2002
         """
-        if not members and (not self._dict or add_only) :
+        pending = self._pending_members(members, add_only)
+        if not pending:
             return None
 
+        return self._import(pending, filename, add_only, group_ids)
+
+    @traced
+    def bulk_save(self, members=None, filename=None, add_only=False,
+                  group_ids=None, chunk_size=None, max_workers=None,
+                  wait=False, poll_interval=5, timeout=None):
+        """
+        Like :meth:`save`, but splits the members into several imports which
+        are posted concurrently, so audiences of any size can be updated
+
+        :param members: List of :class:`Member` objects to save
+        :type members: :class:`list` of :class:`Member` objects
+        :param filename: An arbitrary string to associate with these imports
+        :type filename: :class:`str`
+        :param add_only: Only add new members, ignore existing members
+        :type add_only: :class:`bool`
+        :param group_ids: Add imported members to this list of groups
+        :type group_ids: :class:`list`
+        :param chunk_size: The number of members in each import
+        :type chunk_size: :class:`int`
+        :param max_workers: The number of imports posted at once (defaults to
+                            the adapter's number of workers)
+        :type max_workers: :class:`int`
+        :param wait: Whether to poll until every import has finished
+        :type wait: :class:`bool`
+        :param poll_interval: Seconds between polls while waiting
+        :type poll_interval: :class:`int`
+        :param timeout: Seconds to wait before raising
+                        :class:`ImportTimeoutError` (defaults to
+                        :attr:`AccountImportCollection.WAIT_TIMEOUT`)
+        :type timeout: :class:`int`
+        :rtype: :class:`list` of :class:`int` representing import identifiers
+
+        Should the API not accept some of the imports,
+        :class:`MemberImportError` is raised once every chunk has been posted;
+        the members of the rejected chunks are left modified.
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.members.bulk_save([
+            ...     acct.members.factory({'email': u"new%s@example.com" % x})
+            ...     for x in range(12000)
+            ... ], chunk_size=5000, max_workers=3)
+            [2001, 2002, 2003]
+            >>> acct.members.bulk_save(new_members, wait=True)
+            [2004, 2005, 2006]
+        """
+        pending = self._pending_members(members, add_only)
+        if not pending:
+            return []
+
+        size = chunk_size or self.__class__.IMPORT_CHUNK_SIZE
+        chunks = [pending[x:x + size] for x in range(0, len(pending), size)]
+        outcomes = self.account.adapter.map(
+            lambda chunk: self._import(chunk, filename, add_only, group_ids),
+            chunks,
+            max_workers)
+        import_ids = [x['import_id'] for x in outcomes if x]
+        if len(import_ids) < len(chunks):
+            raise ex.MemberImportError(
+                "%s of %s imports failed; accepted: %s" % (
+                    len(chunks) - len(import_ids), len(chunks), import_ids))
+        if wait:
+            self.account.imports.wait(
+                import_ids, poll_interval, max_workers, timeout)
+        return import_ids
+
+    def _pending_members(self, members, add_only):
+        """The given members, and unless adding only, modified cached ones"""
+        members = list(members or [])
+        if add_only:
+            return members
+        given = set(id(x) for x in members)
+        return members + [x for x in list(self._dict.values())
+                          if x.is_dirty() and id(x) not in given]
+
+    def _import(self, members, filename, add_only, group_ids):
+        """Post a single import of members, which are then considered saved"""
         path = '/members'
-        data = {
-            'members': (
-                ([] if not members else [x.extract() for x in members])
-                + ([] if add_only
-                   else [x.extract() for x in list(self._dict.values())]))
-        }
+        data = {'members': [x.extract(changes_only=True) for x in members]}
         if add_only:
             data['add_only'] = add_only
         if filename:
             data['filename'] = filename
         if group_ids:
             data['group_ids'] = group_ids
-        return self.account.adapter.post(path, data)
+        outcome = self.account.adapter.post(path, data)
+        if outcome:
+            for member in members:
+                member._mark_clean()
+        return outcome
 
     def delete_by_status(self, status):
         """
@@ -741,6 +1244,7 @@ class AccountMailingCollection(BaseApiModel):
             raise KeyError(key)
         return item
 
+    @traced
     def fetch_all(self, include_archived=False, mailing_types=None,
                   mailing_statuses=None, is_scheduled=False,
                   with_html_body=False, with_plaintext=False):
@@ -757,6 +1261,29 @@ class AccountMailingCollection(BaseApiModel):
             {123: <Mailing>, 321: <Mailing>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict(
+                (x['mailing_id'], x) for x in self.iter_all(
+                    include_archived, mailing_types, mailing_statuses,
+                    is_scheduled, with_html_body, with_plaintext))
+        return self._dict
+
+    def iter_all(self, include_archived=False, mailing_types=None,
+                 mailing_statuses=None, is_scheduled=False,
+                 with_html_body=False, with_plaintext=False):
+        """
+        Streams the full set of :class:`Mailing` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Mailing` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for mlng in acct.mailings.iter_all():
+            ...     print(mlng['name'])
+        """
         path = '/mailings'
         params = {}
         if include_archived:
@@ -771,12 +1298,9 @@ class AccountMailingCollection(BaseApiModel):
             params['with_html_body'] = True
         if with_plaintext:
             params['with_plaintext'] = True
-        if not self._dict:
-            mailing = emma.model.mailing
-            self._dict = dict(
-                (x['mailing_id'], mailing.Mailing(self.account, x))
-                    for x in self.account.adapter.paginated_get(path, params))
-        return self._dict
+        mailing = emma.model.mailing
+        return (mailing.Mailing(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
 
     def find_one_by_mailing_id(self, mailing_id):
         """
@@ -807,6 +1331,31 @@ class AccountMailingCollection(BaseApiModel):
 
         return (mailing_id in self._dict) and self._dict[mailing_id] or None
 
+    @traced
+    def find_many_by_mailing_ids(self, mailing_ids, max_workers=None):
+        """
+        Lazy-loads several :class:`Mailing` objects by ID, fetching those not
+        yet loaded concurrently
+
+        :param mailing_ids: The mailing identifiers (duplicates are fetched
+                            once)
+        :type mailing_ids: :class:`list` of :class:`int` or :class:`str`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`dict` of each ID to its :class:`Mailing` or
+                :class:`None`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.mailings.find_many_by_mailing_ids([123, 0])
+            {123: <Mailing>, 0: None}
+        """
+        return _find_many(
+            self, [int(x) for x in mailing_ids], self.find_one_by_mailing_id,
+            max_workers=max_workers)
+
     def validate(self, html_body=None, plaintext=None, subject=None):
         """
         Validate that a mailing has valid personalization-tag syntax.
@@ -863,6 +1412,7 @@ class AccountSearchCollection(BaseApiModel):
     def __delitem__(self, key):
         self._dict[key].delete()
 
+    @traced
     def fetch_all(self, deleted=False):
         """
         Lazy-loads the full set of :class:`Search` objects
@@ -878,14 +1428,31 @@ class AccountSearchCollection(BaseApiModel):
             >>> acct.searches.fetch_all()
             {123: <Search>, 321: <Search>, ...}
         """
+        if not self._dict:
+            self._dict = dict((x['search_id'], x) for x in self.iter_all(deleted))
+        return self._dict
+
+    def iter_all(self, deleted=False):
+        """
+        Streams the full set of :class:`Search` objects page by page.
+        *Does not lazy-load*
+
+        :param deleted: Whether to include deleted searches
+        :type deleted: :class:`bool`
+        :rtype: generator of :class:`Search` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for srch in acct.searches.iter_all():
+            ...     print(srch['name'])
+        """
         search = emma.model.search
         path = '/searches'
         params = {"deleted":True} if deleted else {}
-        if not self._dict:
-            self._dict = dict(
-                (x['search_id'], search.Search(self.account, x))
-                    for x in self.account.adapter.paginated_get(path, params))
-        return self._dict
+        return (search.Search(self.account, x)
+                for x in self.account.adapter.iter_paginated(path, params))
 
     def find_one_by_search_id(self, search_id, deleted=False):
         """
@@ -919,6 +1486,33 @@ class AccountSearchCollection(BaseApiModel):
 
         return (search_id in self._dict) and self._dict[search_id] or None
 
+    @traced
+    def find_many_by_search_ids(self, search_ids, deleted=False,
+                                max_workers=None):
+        """
+        Lazy-loads several :class:`Search` objects by ID, fetching those not
+        yet loaded concurrently
+
+        :param search_ids: The search identifiers (duplicates are fetched once)
+        :type search_ids: :class:`list` of :class:`int`
+        :param deleted: Whether to find deleted searches
+        :type deleted: :class:`bool`
+        :param max_workers: Overrides the adapter's number of workers
+        :type max_workers: :class:`int`
+        :rtype: :class:`dict` of each ID to its :class:`Search` or :class:`None`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> acct.searches.find_many_by_search_ids([123, 0])
+            {123: <Search>, 0: None}
+        """
+        return _find_many(
+            self, [int(x) for x in search_ids],
+            lambda x: self.find_one_by_search_id(x, deleted),
+            max_workers=max_workers)
+
 
 class AccountTriggerCollection(BaseApiModel):
     """
@@ -960,6 +1554,7 @@ class AccountTriggerCollection(BaseApiModel):
         """
         return emma.model.trigger.Trigger(self.account, raw)
 
+    @traced
     def fetch_all(self):
         """
         Lazy-loads the full set of :class:`Trigger` objects
@@ -973,14 +1568,29 @@ class AccountTriggerCollection(BaseApiModel):
             >>> acct.triggers.fetch_all()
             {123: <Trigger>, 321: <Trigger>, ...}
         """
-        trigger = emma.model.trigger
-        path = '/triggers'
         if not self._dict:
-            self._dict = dict(
-                (x['trigger_id'], trigger.Trigger(self.account, x))
-                    for x in self.account.adapter.paginated_get(path))
+            self._dict = dict((x['trigger_id'], x) for x in self.iter_all())
         return self._dict
 
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Trigger` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Trigger` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for trggr in acct.triggers.iter_all():
+            ...     print(trggr['name'])
+        """
+        trigger = emma.model.trigger
+        path = '/triggers'
+        return (trigger.Trigger(self.account, x)
+                for x in self.account.adapter.iter_paginated(path))
+
     def find_one_by_trigger_id(self, trigger_id):
         """
         Lazy-loads a single :class:`Trigger` by ID
@@ -1051,6 +1661,7 @@ class AccountWebHookCollection(BaseApiModel):
         """
         return emma.model.webhook.WebHook(self.account, raw)
 
+    @traced
     def fetch_all(self):
         """
         Lazy-loads the full set of :class:`WebHook` objects
@@ -1064,14 +1675,29 @@ class AccountWebHookCollection(BaseApiModel):
             >>> acct.webhooks.fetch_all()
             {123: <WebHook>, 321: <WebHook>, ...}
         """
-        webhook = emma.model.webhook
-        path = '/webhooks'
         if not self._dict:
-            self._dict = dict(
-                (x['webhook_id'], webhook.WebHook(self.account, x))
-                    for x in self.account.adapter.paginated_get(path))
+            self._dict = dict((x['webhook_id'], x) for x in self.iter_all())
         return self._dict
 
+    def iter_all(self):
+        """
+        Streams the full set of :class:`WebHook` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`WebHook` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for whk in acct.webhooks.iter_all():
+            ...     print(whk['url'])
+        """
+        webhook = emma.model.webhook
+        path = '/webhooks'
+        return (webhook.WebHook(self.account, x)
+                for x in self.account.adapter.iter_paginated(path))
+
     def find_one_by_webhook_id(self, webhook_id):
         """
         Lazy-loads a single :class:`WebHook` by ID
@@ -1168,6 +1794,7 @@ class AccountWorkflowCollect(BaseApiModel):
         """
         return emma.model.automation.Workflow(self.account, raw)
 
+    @traced
     def fetch_all(self):
         """
         Lazy-loads the full set of :class:`Workflow` objects
@@ -1181,14 +1808,29 @@ class AccountWorkflowCollect(BaseApiModel):
             >>> acct.workflows.fetch_all()
             {'adfasdfasdf123123': <Workflow>, 'afadf23324': <Workflow>, ...}
         """
-        automation = emma.model.automation
-        path = '/automation/workflows'
         if not self._dict:
-            self._dict = dict(
-                (x['workflow_id'], automation.Workflow(self.account, x))
-                for x in self.account.adapter.paginated_get(path))
+            self._dict = dict((x['workflow_id'], x) for x in self.iter_all())
         return self._dict
 
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Workflow` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Workflow` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> for wkflw in acct.workflows.iter_all():
+            ...     print(wkflw['workflow_id'])
+        """
+        automation = emma.model.automation
+        path = '/automation/workflows'
+        return (automation.Workflow(self.account, x)
+                for x in self.account.adapter.iter_paginated(path))
+
     def find_one_by_workflow_id(self, workflow_id):
         """
         Lazy-loads a single :class:`WorkFlow` by ID
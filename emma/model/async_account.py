@@ -0,0 +1,161 @@
+"""
+Awaitable views of the aggregate root (Account) and its collections (Python
+3.7+ only, so never imported by the rest of the package)
+"""
+
+import asyncio
+import functools
+import itertools
+from emma.adapter.async_adapter import AsyncAdapter
+from emma.model import BaseApiModel
+from emma.model.account import Account
+
+
+class AsyncAccount(object):
+    """
+    Aggregate root for the API context, for use from :mod:`asyncio` code.
+    Every collection method of :class:`Account` is available as a coroutine,
+    and every `iter_*` method as an asynchronous iterator.
+
+    :param account_id: Your account identifier
+    :type account_id: :class:`int` or :class:`str`
+    :param public_key: Your public key
+    :type public_key: :class:`str`
+    :param private_key: Your private key
+    :type private_key: :class:`str`
+    :param max_workers: The number of requests allowed in flight at once
+    :type max_workers: :class:`int`
+
+    Usage::
+
+        >>> from emma.model.async_account import AsyncAccount
+        >>> acct = AsyncAccount(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> await acct.members.fetch_all()
+        {123: <AsyncModel<Member{...}>>, 321: <AsyncModel<Member{...}>>, ...}
+        >>> grp = await acct.groups.find_one_by_group_id(1024)
+        >>> await grp.members.add_by_id([123, 321])
+        None
+        >>> async for mbr in acct.members.iter_all():
+        ...     print(mbr['email'])
+    """
+    default_adapter = AsyncAdapter
+
+    def __init__(self, account_id, public_key, private_key, max_workers=None):
+        self.account = Account(account_id, public_key, private_key)
+        self.adapter = self.__class__.default_adapter(
+            self.account.adapter, max_workers)
+        for name in ('fields', 'groups', 'imports', 'mailings', 'members',
+                     'searches', 'triggers', 'webhooks', 'workflows'):
+            setattr(self, name, AsyncModel(getattr(self.account, name), self.adapter))
+
+    def close(self):
+        """Stops the worker pool and closes the underlying adapter"""
+        self.adapter.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Waiting for the workers to finish would stall the event loop
+        await asyncio.get_event_loop().run_in_executor(None, self.close)
+
+
+class AsyncModel(object):
+    """
+    Awaitable view of a model or collection. Methods become coroutines which
+    run on the adapter's worker pool; models they produce are wrapped in turn.
+    Dictionary access only reads values which are already loaded.
+
+    Calls run concurrently, even on the same collection: lookups store what
+    they load with atomic dictionary writes, and the first member stored
+    for an identifier is the one every caller gets.
+
+    :param model: The model or collection to wrap
+    :type model: :class:`BaseApiModel`
+    :param adapter: The adapter whose worker pool runs the calls
+    :type adapter: :class:`AsyncAdapter`
+    """
+    ITER_BATCH_SIZE = 500
+
+    def __init__(self, model, adapter):
+        self.model = model
+        self.adapter = adapter
+
+    def __getattr__(self, name):
+        attr = getattr(self.model, name)
+        if isinstance(attr, BaseApiModel):
+            return AsyncModel(attr, self.adapter)
+        if not callable(attr):
+            return attr
+        if name.startswith('iter_'):
+            return functools.wraps(attr)(
+                lambda *args, **kwargs: AsyncModelIterator(
+                    attr(*args, **kwargs), self.adapter))
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return wrap(await self.adapter.run(attr, *args, **kwargs),
+                        self.adapter)
+        return call
+
+    def __len__(self):
+        return len(self.model._dict)
+
+    def __getitem__(self, key):
+        return wrap(BaseApiModel.__getitem__(self.model, key), self.adapter)
+
+    def __setitem__(self, key, value):
+        self.model[key] = value.model if isinstance(value, AsyncModel) else value
+
+    def __iter__(self):
+        return iter(self.model._dict)
+
+    def __contains__(self, key):
+        return key in self.model._dict
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __repr__(self):
+        return "".join(['<', self.__class__.__name__, repr(self.model), '>'])
+
+
+class AsyncModelIterator(object):
+    """
+    Asynchronous iterator over a blocking iterator, advanced on the adapter's
+    worker pool a batch at a time
+
+    :param iterator: The blocking iterator
+    :type iterator: iterator
+    :param adapter: The adapter whose worker pool advances the iterator
+    :type adapter: :class:`AsyncAdapter`
+    """
+    def __init__(self, iterator, adapter):
+        self.iterator = iterator
+        self.adapter = adapter
+        self.batch = iter(())
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        for item in self.batch:
+            return wrap(item, self.adapter)
+
+        batch = await self.adapter.run(
+            lambda: list(itertools.islice(
+                self.iterator, AsyncModel.ITER_BATCH_SIZE)))
+        if not batch:
+            raise StopAsyncIteration
+        self.batch = iter(batch)
+        return wrap(next(self.batch), self.adapter)
+
+
+def wrap(value, adapter):
+    """Wraps models (and dictionaries of models) in :class:`AsyncModel`"""
+    if isinstance(value, BaseApiModel):
+        return AsyncModel(value, adapter)
+    if isinstance(value, dict) and any(
+            isinstance(x, BaseApiModel) for x in value.values()):
+        return dict((k, wrap(v, adapter)) for k, v in value.items())
+    return value
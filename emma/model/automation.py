@@ -1,6 +1,6 @@
 """Automation models"""
 
-from emma.model import BaseApiModel, str_fields_to_datetime_alt
+from emma.model import BaseApiModel, parse_datetime_alt
 
 
 class Workflow(BaseApiModel):
@@ -28,9 +28,5 @@ class Workflow(BaseApiModel):
     #     return '<Workflow: {}>'.format(self.workflow_id)
 
     def _parse_raw(self, raw):
-        raw.update(
-            str_fields_to_datetime_alt(
-                ['created_at', 'updated_at'], raw
-            )
-        )
-        return raw
+        return self._parse_datetimes(
+            ['created_at', 'updated_at'], raw, parse_datetime_alt)
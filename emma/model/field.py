@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from emma import exceptions as ex
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel
 
 
 class Field(BaseApiModel):
@@ -27,8 +27,7 @@ class Field(BaseApiModel):
         super(Field, self).__init__(raw)
 
     def _parse_raw(self, raw):
-        raw.update(str_fields_to_datetime(['deleted_at'], raw))
-        return raw
+        return self._parse_datetimes(['deleted_at'], raw)
 
     def is_deleted(self):
         """
@@ -73,6 +72,7 @@ class Field(BaseApiModel):
             self._dict['deleted_at'] = datetime.now()
         if self._dict['field_id'] in self.account.fields:
             del(self.account.fields._dict[self._dict['field_id']])
+        self.account.fields.invalidate_shortcuts()
 
     def extract(self):
         """
@@ -99,12 +99,14 @@ class Field(BaseApiModel):
         data = self.extract()
         self._dict['field_id'] = self.account.adapter.post(path, data)
         self.account.fields._dict[self._dict['field_id']] = self
+        self.account.fields.invalidate_shortcuts()
 
     def _update(self):
         """Update a single field"""
         path = '/fields/%s' % self._dict['field_id']
         data = self.extract()
         self.account.adapter.put(path, data)
+        self.account.fields.invalidate_shortcuts()
 
     def save(self):
         """
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from emma import exceptions as ex
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel, lazy_property
 import emma.model.member
 
 
@@ -25,12 +25,15 @@ class Group(BaseApiModel):
     """
     def __init__(self, account, raw=None):
         self.account = account
-        self.members = GroupMemberCollection(self)
         super(Group, self).__init__(raw)
 
+    @lazy_property
+    def members(self):
+        """The :class:`GroupMemberCollection`, created on first use"""
+        return GroupMemberCollection(self)
+
     def _parse_raw(self, raw):
-        raw.update(str_fields_to_datetime(['deleted_at'], raw))
-        return raw
+        return self._parse_datetimes(['deleted_at'], raw)
 
     def is_deleted(self):
         """
@@ -163,17 +166,36 @@ class GroupMemberCollection(BaseApiModel):
             >>> grp.members.fetch_all()
             {200: <Member>, 201: <Member>, ...}
         """
+        if not self._dict:
+            self._dict = dict((x['member_id'], x) for x in self.iter_all(deleted))
+        return self._dict
+
+    def iter_all(self, deleted=False):
+        """
+        Streams the set of :class:`Member` objects page by page, so a group
+        of any size can be exported in constant memory.
+        *Does not lazy-load*
+
+        :param deleted: Include deleted members
+        :type deleted: :class:`bool`
+        :rtype: generator of :class:`Member` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> grp = acct.groups[1024]
+            >>> for mbr in grp.members.iter_all():
+            ...     print(mbr['email'])
+        """
         if not 'member_group_id' in self.group:
             raise ex.NoGroupIdError()
 
         member = emma.model.member
         path = '/groups/%s/members' % self.group['member_group_id']
         params = {'deleted': True} if deleted else {}
-        if not self._dict:
-            self._dict = dict(
-                (x['member_id'], member.Member(self.group.account, x))
-                    for x in self.group.account.adapter.paginated_get(path, params))
-        return self._dict
+        return (member.Member(self.group.account, x)
+                for x in self.group.account.adapter.iter_paginated(path, params))
 
     def add_by_id(self, member_ids=None):
         """
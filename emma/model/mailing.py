@@ -3,7 +3,7 @@
 from datetime import datetime
 from emma import exceptions as ex
 from emma.enumerations import MailingStatus
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel, lazy_property
 import emma.model.group
 import emma.model.member
 import emma.model.search
@@ -30,18 +30,33 @@ class Mailing(BaseApiModel):
     def __init__(self, account, raw=None):
         self.account = account
         super(Mailing, self).__init__(raw)
-        self.groups = MailingGroupCollection(self)
-        self.members = MailingMemberCollection(self)
-        self.messages = MailingMessageCollection(self)
-        self.searches = MailingSearchCollection(self)
+
+    @lazy_property
+    def groups(self):
+        """The :class:`MailingGroupCollection`, created on first use"""
+        return MailingGroupCollection(self)
+
+    @lazy_property
+    def members(self):
+        """The :class:`MailingMemberCollection`, created on first use"""
+        return MailingMemberCollection(self)
+
+    @lazy_property
+    def messages(self):
+        """The :class:`MailingMessageCollection`, created on first use"""
+        return MailingMessageCollection(self)
+
+    @lazy_property
+    def searches(self):
+        """The :class:`MailingSearchCollection`, created on first use"""
+        return MailingSearchCollection(self)
 
     def _parse_raw(self, raw):
-        raw.update(str_fields_to_datetime(
+        return self._parse_datetimes(
             ['clicked', 'opened', 'delivery_ts', 'forwarded', 'shared', 'sent',
              'send_finished', 'send_at', 'archived_ts', 'send_started',
              'started_or_finished'],
-            raw))
-        return raw
+            raw)
 
     def update_status(self, status):
         """
@@ -254,15 +269,31 @@ class MailingGroupCollection(BaseApiModel):
             {123: <Group>, 321: <Group>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict((x['group_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Group` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Group` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mlng = acct.mailings[123]
+            >>> for grp in mlng.groups.iter_all():
+            ...     print(grp['group_name'])
+        """
         if 'mailing_id' not in self.mailing:
             raise ex.NoMailingIdError()
         group = emma.model.group
         path = '/mailings/%s/groups' % self.mailing['mailing_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['group_id'], group.Group(self.mailing.account, x))
-                    for x in self.mailing.account.adapter.paginated_get(path))
-        return self._dict
+        return (group.Group(self.mailing.account, x)
+                for x in self.mailing.account.adapter.iter_paginated(path))
 
 
 class MailingMemberCollection(BaseApiModel):
@@ -292,15 +323,31 @@ class MailingMemberCollection(BaseApiModel):
             {123: <Member>, 321: <Member>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict((x['member_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Member` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Member` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mlng = acct.mailings[123]
+            >>> for mbr in mlng.members.iter_all():
+            ...     print(mbr['email'])
+        """
         if 'mailing_id' not in self.mailing:
             raise ex.NoMailingIdError()
         member = emma.model.member
         path = '/mailings/%s/members' % self.mailing['mailing_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['member_id'], member.Member(self.mailing.account, x))
-                    for x in self.mailing.account.adapter.paginated_get(path))
-        return self._dict
+        return (member.Member(self.mailing.account, x)
+                for x in self.mailing.account.adapter.iter_paginated(path))
 
 
 class MailingSearchCollection(BaseApiModel):
@@ -330,15 +377,31 @@ class MailingSearchCollection(BaseApiModel):
             {123: <Search>, 321: <Search>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict((x['search_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Search` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Search` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mlng = acct.mailings[123]
+            >>> for srch in mlng.searches.iter_all():
+            ...     print(srch['name'])
+        """
         if 'mailing_id' not in self.mailing:
             raise ex.NoMailingIdError()
         search = emma.model.search
         path = '/mailings/%s/searches' % self.mailing['mailing_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['search_id'], search.Search(self.mailing.account, x))
-                    for x in self.mailing.account.adapter.paginated_get(path))
-        return self._dict
+        return (search.Search(self.mailing.account, x)
+                for x in self.mailing.account.adapter.iter_paginated(path))
 
 
 class MailingMessageCollection(BaseApiModel):
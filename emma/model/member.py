@@ -1,9 +1,10 @@
 """Audience member models"""
 
+import collections
 from datetime import datetime
 from emma import exceptions as ex
 from emma.enumerations import MemberStatus
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel, lazy_property, parse_datetime
 import emma.model.group
 import emma.model.mailing
 
@@ -31,18 +32,30 @@ class Member(BaseApiModel):
     """
     def __init__(self, account, raw=None):
         self.account = account
-        self.groups = MemberGroupCollection(self)
-        self.mailings = MemberMailingCollection(self)
         super(Member, self).__init__(raw)
 
+    @lazy_property
+    def groups(self):
+        """The :class:`MemberGroupCollection`, created on first use"""
+        return MemberGroupCollection(self)
+
+    @lazy_property
+    def mailings(self):
+        """The :class:`MemberMailingCollection`, created on first use"""
+        return MemberMailingCollection(self)
+
+    def __setitem__(self, key, value):
+        if key == 'email' and value:
+            self.account.members._reindex_email(self, value)
+        super(Member, self).__setitem__(key, value)
+
     def _parse_raw(self, raw):
         if 'fields' in raw:
             raw.update(raw['fields'])
             del(raw['fields'])
-        raw.update(str_fields_to_datetime(
+        return self._parse_datetimes(
             ['last_modified_at', 'member_since', 'deleted_at'],
-            raw))
-        return raw
+            raw)
 
     def opt_out(self):
         """
@@ -108,10 +121,15 @@ class Member(BaseApiModel):
             raise ex.NoMemberStatusError()
         return self._dict['member_status_id'] == MemberStatus.OptOut
 
-    def extract(self):
+    def extract(self, changes_only=False):
         """
         Extracts data from the model in a format suitable for using with the API
 
+        :param changes_only: Whether to limit the fields of an existing member
+                             held by the account's member collection to those
+                             modified since it was loaded or saved (other
+                             members are always extracted in full)
+        :type changes_only: :class:`bool`
         :rtype: :class:`dict`
 
         Usage::
@@ -121,14 +139,19 @@ class Member(BaseApiModel):
             >>> mbr = acct.members[123]
             >>> mbr.extract()
             {'member_id':123, 'email':u"test@example.org", 'fields':{...}}
+            >>> mbr['first_name'] = u"Emma"
+            >>> mbr.extract(changes_only=True)
+            {'member_id':123, 'email':u"test@example.org", 'fields':{'first_name':u"Emma"}}
         """
         if 'email' not in self._dict:
             raise ex.NoMemberEmailError
 
+        shortcuts = self.account.fields.shortcut_names()
+        if changes_only and self._is_loaded():
+            shortcuts = shortcuts & self._dirty
         extracted = dict(x for x in list(self._dict.items())
-            if x[0] in ['member_id', 'email'])
-        fields = dict(x for x in list(self._dict.items())
-            if x[0] in self.account.fields.export_shortcuts())
+            if x[0] in ('member_id', 'email'))
+        fields = dict(x for x in list(self._dict.items()) if x[0] in shortcuts)
         if fields:
             extracted['fields'] = fields
 
@@ -144,23 +167,40 @@ class Member(BaseApiModel):
             data['signup_form_id'] = signup_form_id
 
         outcome = self.account.adapter.post(path, data)
-        self['member_status_id'] = outcome['status']
+        self._dict['member_status_id'] = outcome['status']
         if 'member_id' in outcome:
             self['member_id'] = outcome['member_id']
+        self._mark_clean()
+
+    def _is_loaded(self):
+        """
+        Whether this is the member held by the account's member collection,
+        so its modifications since loading are known
+        """
+        return 'member_id' in self._dict and \
+            self.account.members._dict.get(self._dict['member_id']) is self
 
     def _update(self):
-        """Update a single member"""
+        """Update the modified fields of a single member"""
+        loaded = self._is_loaded()
+        if loaded and not self._dirty:
+            return None
+
         path = "/members/%s" % self._dict['member_id']
-        data = self.extract()
-        if self._dict['member_status_id'] in (
+        data = self.extract(changes_only=True)
+        status = self._dict.get('member_status_id')
+        if (not loaded or 'member_status_id' in self._dirty) and status in (
             MemberStatus.Active, MemberStatus.Error, MemberStatus.OptOut):
-            data['status_to'] = self._dict['member_status_id']
+            data['status_to'] = status
         if not self.account.adapter.put(path, data):
             raise ex.MemberUpdateError()
+        self._mark_clean()
 
     def save(self, signup_form_id=None, group_ids=None):
         """
-        Add or update this :class:`Member`
+        Add this :class:`Member`, or update an existing :class:`Member`: in
+        full, or when it was loaded by the account's member collection, only
+        the fields modified since it was loaded or saved
 
         :rtype: :class:`None`
 
@@ -263,6 +303,107 @@ class Member(BaseApiModel):
         return self.groups.delete(group_ids)
 
 
+class MemberRecord(object):
+    """
+    Compact, read-only view of a member for bulk reads. Records with the same
+    keys share one key layout, so each record holds only a tuple of values
+    and has no child collections. Use :meth:`to_member` to edit or save.
+
+    Records are registered as a :class:`collections.Mapping` rather than
+    inheriting from it, as its bases declare no `__slots__` on Python 2.
+
+    :param account: The Account which owns this member
+    :type account: :class:`Account`
+    :param raw: The raw values of the member
+    :type raw: :class:`dict`
+
+    Usage::
+
+        >>> from emma.model.account import Account
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> records = list(acct.members.iter_records())
+        >>> records[0]
+        <MemberRecord{'member_id': 123, 'email': u"test@example.com", ...}>
+        >>> mbr = records[0].to_member()
+        >>> mbr['first_name'] = u"Emma"
+        >>> mbr.save()
+        None
+    """
+    __slots__ = ('account', '_layout', '_values')
+    MAX_LAYOUTS = 1024
+    _layouts = {}
+
+    def __init__(self, account, raw):
+        if 'fields' in raw:
+            raw.update(raw['fields'])
+            del(raw['fields'])
+        for key in ('last_modified_at', 'member_since', 'deleted_at'):
+            if raw.get(key) is not None:
+                raw[key] = parse_datetime(raw[key])
+
+        keys = tuple(raw)
+        layout = self._layouts.get(keys)
+        if layout is None:
+            layout = dict((x[1], x[0]) for x in enumerate(keys))
+            if len(self._layouts) < self.__class__.MAX_LAYOUTS:
+                self._layouts[keys] = layout
+        self.account = account
+        self._layout = layout
+        self._values = tuple(raw[x] for x in keys)
+
+    def __getitem__(self, key):
+        return self._values[self._layout[key]]
+
+    def __iter__(self):
+        return iter(self._layout)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._layout
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "".join(['<', self.__class__.__name__, repr(dict(self)), '>'])
+
+    def get(self, key, default=None):
+        index = self._layout.get(key)
+        return default if index is None else self._values[index]
+
+    def keys(self):
+        return list(self._layout)
+
+    def values(self):
+        return [self._values[self._layout[x]] for x in self._layout]
+
+    def items(self):
+        return [(x, self._values[self._layout[x]]) for x in self._layout]
+
+    def to_member(self):
+        """
+        Copies this record into a full :class:`Member`
+
+        :rtype: :class:`Member`
+        """
+        member = Member(self.account)
+        member._dict = dict(self)
+        return member
+
+
+collections.Mapping.register(MemberRecord)
+
+
 class MemberMailingCollection(BaseApiModel):
     """
     Encapsulates operations for the set of :class:`Mailing` objects of a
@@ -290,15 +431,31 @@ class MemberMailingCollection(BaseApiModel):
             {123: <Mailing>, 321: <Mailing>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict((x['mailing_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Mailing` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Mailing` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mbr = acct.members[123]
+            >>> for mlng in mbr.mailings.iter_all():
+            ...     print(mlng['mailing_id'])
+        """
         if 'member_id' not in self.member:
             raise ex.NoMemberIdError()
         mailing = emma.model.mailing
         path = '/members/%s/mailings' % self.member['member_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['mailing_id'], mailing.Mailing(self.member.account, x))
-                    for x in self.member.account.adapter.paginated_get(path))
-        return self._dict
+        return (mailing.Mailing(self.member.account, x)
+                for x in self.member.account.adapter.iter_paginated(path))
 
 
 class MemberGroupCollection(BaseApiModel):
@@ -349,15 +506,31 @@ class MemberGroupCollection(BaseApiModel):
             {123: <Group>, 321: <Group>, ...}
 
         """
+        if not self._dict:
+            self._dict = dict((x['member_group_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Group` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Group` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mbr = acct.members[123]
+            >>> for grp in mbr.groups.iter_all():
+            ...     print(grp['group_name'])
+        """
         if 'member_id' not in self.member:
             raise ex.NoMemberIdError()
         group = emma.model.group
         path = '/members/%s/groups' % self.member['member_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['member_group_id'], group.Group(self.member.account, x))
-                    for x in self.member.account.adapter.paginated_get(path))
-        return self._dict
+        return (group.Group(self.member.account, x)
+                for x in self.member.account.adapter.iter_paginated(path))
 
     def save(self, groups=None):
         """
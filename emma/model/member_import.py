@@ -1,7 +1,8 @@
 """Audience import models"""
 
 from emma import exceptions as ex
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.enumerations import ImportStatus
+from emma.model import BaseApiModel, lazy_property
 from emma.model.member import Member
 
 
@@ -25,12 +26,31 @@ class MemberImport(BaseApiModel):
     def __init__(self, account, raw=None):
         self.account = account
         super(MemberImport, self).__init__(raw)
-        self.members = ImportMemberCollection(self)
+
+    @lazy_property
+    def members(self):
+        """The :class:`ImportMemberCollection`, created on first use"""
+        return ImportMemberCollection(self)
 
     def _parse_raw(self, raw):
-        raw.update(
-            str_fields_to_datetime(['import_started', 'import_finished'], raw))
-        return raw
+        return self._parse_datetimes(['import_started', 'import_finished'], raw)
+
+    def is_finished(self):
+        """
+        Whether this import has finished (successfully or not)
+
+        :rtype: :class:`bool`
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> mprt = acct.imports[123]
+            >>> mprt.is_finished()
+            True
+        """
+        return (bool(self._dict.get('import_finished'))
+                or self._dict.get('status') == ImportStatus.Error)
 
 
 class ImportMemberCollection(BaseApiModel):
@@ -59,12 +79,29 @@ class ImportMemberCollection(BaseApiModel):
             >>> imprt.members.fetch_all()
             {200: <Member>, 201: <Member>, ...}
         """
+        if not self._dict:
+            self._dict = dict((x['member_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Member` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Member` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> imprt = acct.imports[1024]
+            >>> for mbr in imprt.members.iter_all():
+            ...     print(mbr['email'])
+        """
         if not 'import_id' in self.member_import:
             raise ex.NoImportIdError()
 
         path = '/members/imports/%s/members' % self.member_import['import_id']
-        if not self._dict:
-            self._dict = dict(
-                (x['member_id'], Member(self.member_import.account, x))
-                    for x in self.member_import.account.adapter.paginated_get(path))
-        return self._dict
+        account = self.member_import.account
+        return (Member(account, x)
+                for x in account.adapter.iter_paginated(path))
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from emma import exceptions as ex
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel, lazy_property
 import emma.model.member
 
 
@@ -26,11 +26,14 @@ class Search(BaseApiModel):
     def __init__(self, account, raw=None):
         self.account = account
         super(Search, self).__init__(raw)
-        self.members = SearchMemberCollection(self)
+
+    @lazy_property
+    def members(self):
+        """The :class:`SearchMemberCollection`, created on first use"""
+        return SearchMemberCollection(self)
 
     def _parse_raw(self, raw):
-        raw.update(str_fields_to_datetime(['deleted_at', 'last_run_at'], raw))
-        return raw
+        return self._parse_datetimes(['deleted_at', 'last_run_at'], raw)
 
     def is_deleted(self):
         """
@@ -162,13 +165,29 @@ class SearchMemberCollection(BaseApiModel):
             >>> srch.members.fetch_all()
             {200: <Member>, 201: <Member>, ...}
         """
+        if not self._dict:
+            self._dict = dict((x['member_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Member` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Member` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> srch = acct.searches[1024]
+            >>> for mbr in srch.members.iter_all():
+            ...     print(mbr['email'])
+        """
         if not 'search_id' in self.search:
             raise ex.NoSearchIdError()
 
         path = '/searches/%s/members' % self.search['search_id']
-        if not self._dict:
-            member = emma.model.member
-            self._dict = dict(
-                (x['member_id'], member.Member(self.search.account, x))
-                    for x in self.search.account.adapter.paginated_get(path))
-        return self._dict
+        member = emma.model.member
+        return (member.Member(self.search.account, x)
+                for x in self.search.account.adapter.iter_paginated(path))
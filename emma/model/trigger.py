@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from emma import exceptions as ex
-from emma.model import BaseApiModel, str_fields_to_datetime
+from emma.model import BaseApiModel, lazy_property
 import emma.model.mailing
 
 
@@ -25,10 +25,14 @@ class Trigger(BaseApiModel):
     def __init__(self, account, raw=None):
         self.account = account
         super(Trigger, self).__init__(raw)
-        self.mailings = TriggerMailingCollection(self)
+
+    @lazy_property
+    def mailings(self):
+        """The :class:`TriggerMailingCollection`, created on first use"""
+        return TriggerMailingCollection(self)
 
     def _parse_raw(self, raw):
-        raw.update(str_fields_to_datetime(['deleted_at', 'start_ts'], raw))
+        self._parse_datetimes(['deleted_at', 'start_ts'], raw)
         if 'parent_mailing' in raw:
             mailing = emma.model.mailing
             raw['parent_mailing'] = mailing.Mailing(
@@ -170,13 +174,29 @@ class TriggerMailingCollection(BaseApiModel):
             >>> trggr.mailings.fetch_all()
             {200: <Mailing>, 201: <Mailing>, ...}
         """
+        if not self._dict:
+            self._dict = dict((x['mailing_id'], x) for x in self.iter_all())
+        return self._dict
+
+    def iter_all(self):
+        """
+        Streams the full set of :class:`Mailing` objects page by page.
+        *Does not lazy-load*
+
+        :rtype: generator of :class:`Mailing` objects
+
+        Usage::
+
+            >>> from emma.model.account import Account
+            >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+            >>> trggr = acct.triggers[1024]
+            >>> for mlng in trggr.mailings.iter_all():
+            ...     print(mlng['mailing_id'])
+        """
         if not 'trigger_id' in self.trigger:
             raise ex.NoSearchIdError()
 
         path = '/triggers/%s/mailings' % self.trigger['trigger_id']
-        if not self._dict:
-            mailing = emma.model.mailing
-            self._dict = dict(
-                (x['mailing_id'], mailing.Mailing(self.trigger.account, x))
-                    for x in self.trigger.account.adapter.paginated_get(path))
-        return self._dict
+        mailing = emma.model.mailing
+        return (mailing.Mailing(self.trigger.account, x)
+                for x in self.trigger.account.adapter.iter_paginated(path))
@@ -0,0 +1,286 @@
+"""Evaluates search queries locally, against members already in memory"""
+
+import calendar
+from datetime import date, datetime, timedelta
+import fnmatch
+import re
+from emma.model import parse_datetime
+from emma.query.optimizer import optimize
+
+
+FIELD_PREFIX = "member_field:"
+DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+TEXT_TYPES = (str, type(u""))
+
+
+def as_datetime(value):
+    """
+    Reads a date from a member or query value, whether a :class:`datetime`,
+    a :class:`date`, a serialized Emma date (`@D:...`) or an ISO string
+
+    :param value: The value
+    :type value: :class:`datetime`, :class:`date` or :class:`str`
+    :rtype: :class:`datetime` or :class:`None`
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if not isinstance(value, TEXT_TYPES):
+        return None
+    if value.startswith("@D:"):
+        try:
+            return parse_datetime(value)
+        except ValueError:
+            return None
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def shift(moment, interval, sign=1):
+    """
+    Moves a moment by an Emma interval such as `{"month": 1, "day": 4}`
+
+    :param moment: The moment to move
+    :type moment: :class:`datetime`
+    :param interval: The interval, by year, month, week, day, hour or minute
+    :type interval: :class:`dict`
+    :param sign: `1` to move forward or `-1` to move back
+    :type sign: :class:`int`
+    :rtype: :class:`datetime`
+    """
+    months = sign * (12 * interval.get('year', 0) + interval.get('month', 0))
+    if months:
+        month = moment.month - 1 + months
+        year = moment.year + month // 12
+        month = month % 12 + 1
+        moment = moment.replace(
+            year=year, month=month,
+            day=min(moment.day, calendar.monthrange(year, month)[1]))
+    return moment + sign * timedelta(
+        weeks=interval.get('week', 0),
+        days=interval.get('day', 0),
+        hours=interval.get('hour', 0),
+        minutes=interval.get('minute', 0))
+
+
+def _getter(field):
+    """Reads a field, custom or not, from a member"""
+    name = field[len(FIELD_PREFIX):] if field.startswith(FIELD_PREFIX) else field
+
+    def get(member):
+        return member.get(name)
+    return get
+
+
+def _comparison(field, value, compare):
+    """A comparison with a query value, made between dates when it is one"""
+    get = _getter(field)
+    moment = as_datetime(value)
+    if moment is not None:
+        def matches(member):
+            found = as_datetime(get(member))
+            return found is not None and compare(found, moment)
+        return matches
+
+    def matches(member):
+        found = get(member)
+        if found is None:
+            return False
+        try:
+            return compare(found, value)
+        except TypeError:
+            return False
+    return matches
+
+
+def _eq(field, value):
+    return _comparison(field, value, lambda x, y: x == y)
+
+
+def _lt(field, value):
+    return _comparison(field, value, lambda x, y: x < y)
+
+
+def _gt(field, value):
+    return _comparison(field, value, lambda x, y: x > y)
+
+
+def _between(field, low, high):
+    above = _comparison(field, low, lambda x, y: x >= y)
+    below = _comparison(field, high, lambda x, y: x <= y)
+    return lambda member: above(member) and below(member)
+
+
+def _contains(field, pattern):
+    get = _getter(field)
+    match = re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+
+    def matches(member):
+        found = get(member)
+        return found is not None and match("%s" % found) is not None
+    return matches
+
+
+def _any(field, value):
+    get = _getter(field)
+
+    def matches(member):
+        found = get(member)
+        return isinstance(found, (list, tuple, set, frozenset)) and value in found
+    return matches
+
+
+def _in(field, *values):
+    """Membership among query values, made between dates for those that are"""
+    get = _getter(field)
+    moments = frozenset(x for x in (as_datetime(y) for y in values)
+                        if x is not None)
+    values = [x for x in values if as_datetime(x) is None]
+    try:
+        values = frozenset(values)
+    except TypeError:
+        pass
+
+    def matches(member):
+        found = get(member)
+        if moments and as_datetime(found) in moments:
+            return True
+        try:
+            return found in values
+        except TypeError:
+            return False
+    return matches
+
+
+def _in_range(field, low, high):
+    """Dates within a window, fixed when the query is compiled"""
+    get = _getter(field)
+
+    def matches(member):
+        found = as_datetime(get(member))
+        return found is not None and low <= found <= high
+    return matches
+
+
+def _datematch(field, parts):
+    get = _getter(field)
+    parts = list(parts.items())
+
+    def matches(member):
+        found = as_datetime(get(member))
+        return found is not None and all(
+            getattr(found, x[0]) == x[1] for x in parts)
+    return matches
+
+
+class Evaluator(object):
+    """
+    Compiles a search query (or its :meth:`to_tuple` form) once into a
+    predicate over members, so a cached audience can be segmented without
+    creating a search. Members may be :class:`Member` or
+    :class:`MemberRecord` objects, or any dictionary with custom fields at
+    the top level (such as the members of a :class:`Mirror`).
+
+    Queries are optimized first, so alternatives on one field are tested
+    with a single set lookup. Relative dates (`in last` and `in next`) are
+    fixed to `now` when the query is compiled. Zip code radius queries need
+    the API's geography and are rejected.
+
+    :param query: The query
+    :type query: :class:`CompositeQuery` or :class:`tuple`
+    :param now: The moment relative dates are measured from (defaults to the
+                current UTC time, as the API's timestamps are in UTC)
+    :type now: :class:`datetime`
+
+    Usage::
+
+        >>> from emma.model.account import Account
+        >>> from emma.query.evaluator import Evaluator
+        >>> from emma.query.factory import QueryFactory as qf
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> members = acct.members.fetch_all().values()
+        >>> query = qf.contains('email', '*@example.com') & ~qf.in_last(
+        ...     'member_since', {"month": 1})
+        >>> [x['member_id'] for x in Evaluator(query).filter(members)]
+        [123, 321]
+    """
+    def __init__(self, query, now=None):
+        self.now = now or datetime.utcnow()
+        self.predicate = self._compile(optimize(query))
+
+    def __call__(self, member):
+        return self.predicate(member)
+
+    def filter(self, members):
+        """
+        Streams the members which match
+
+        :param members: The members to test
+        :type members: iterable of :class:`Member` objects (or dictionaries)
+        :rtype: generator
+        """
+        predicate = self.predicate
+        return (x for x in members if predicate(x))
+
+    def _compile(self, query):
+        """Build the predicate of a query tuple"""
+        if query[0] == "and":
+            parts = [self._compile(x) for x in query[1:]]
+            return lambda member: all(x(member) for x in parts)
+        if query[0] == "or":
+            parts = [self._compile(x) for x in query[1:]]
+            return lambda member: any(x(member) for x in parts)
+        if query[0] == "not":
+            part = self._compile(query[1])
+            return lambda member: not part(member)
+
+        field, operator, args = query[0], query[1], query[2:]
+        if operator == "in last":
+            return _in_range(field, shift(self.now, args[0], -1), self.now)
+        if operator == "in next":
+            return _in_range(field, self.now, shift(self.now, args[0]))
+        build = {
+            "eq": _eq,
+            "lt": _lt,
+            "gt": _gt,
+            "between": _between,
+            "contains": _contains,
+            "any": _any,
+            "in": _in,
+            "datematch": _datematch
+        }.get(operator)
+        if build is None:
+            raise ValueError(
+                "The %r operator cannot be evaluated locally" % operator)
+        return build(field, *args)
+
+
+def evaluate(query, members, now=None):
+    """
+    Lists the members which match a query
+
+    :param query: The query
+    :type query: :class:`CompositeQuery` or :class:`tuple`
+    :param members: The members to test
+    :type members: iterable of :class:`Member` objects (or dictionaries)
+    :param now: The moment relative dates are measured from (defaults to the
+                current UTC time)
+    :type now: :class:`datetime`
+    :rtype: :class:`list`
+
+    Usage::
+
+        >>> from emma.model.account import Account
+        >>> from emma.query.evaluator import evaluate
+        >>> from emma.query.factory import QueryFactory as qf
+        >>> acct = Account(1234, "08192a3b4c5d6e7f", "f7e6d5c4b3a29180")
+        >>> evaluate(qf.eq('member_field:first_name', "Emma"),
+        ...          acct.members.fetch_all().values())
+        [<Member>]
+    """
+    return list(Evaluator(query, now).filter(members))
@@ -0,0 +1,204 @@
+"""Normalizes search queries into smaller, flatter equivalents"""
+
+import collections
+
+
+LOGICAL_OPERATORS = ("and", "or", "not")
+DUAL = {"and": "or", "or": "and"}
+
+
+class _Node(object):
+    """A logical operator whose operands may still be spliced into its parent"""
+    __slots__ = ('operator', 'operands')
+
+    def __init__(self, operator, operands):
+        self.operator = operator
+        self.operands = operands
+
+
+def _key(query):
+    """A key which identifies equal queries"""
+    try:
+        hash(query)
+        return query
+    except TypeError:
+        return repr(query)
+
+
+def _dedupe(operands):
+    """Drop repeated operands, keeping the first of each"""
+    seen = set()
+    unique = []
+    for operand in operands:
+        key = _key(operand)
+        if key not in seen:
+            seen.add(key)
+            unique.append(operand)
+    return unique
+
+
+def _is_leaf(query, operator):
+    return query[0] not in LOGICAL_OPERATORS and query[1] == operator
+
+
+def _merge_equalities(operands):
+    """Merge `eq` and `in` alternatives on one field into a single `in`"""
+    values = collections.OrderedDict()
+    for operand in operands:
+        if _is_leaf(operand, "eq") or _is_leaf(operand, "in"):
+            values.setdefault(operand[0], []).append(operand)
+    merged = {}
+    for field, queries in values.items():
+        if len(queries) < 2:
+            continue
+        merged[field] = (field, "in") + tuple(_dedupe(
+            [y for x in queries for y in x[2:]]))
+
+    result = []
+    for operand in operands:
+        if operand[0] in merged and (
+                _is_leaf(operand, "eq") or _is_leaf(operand, "in")):
+            if merged[operand[0]] is not None:
+                result.append(merged[operand[0]])
+                merged[operand[0]] = None
+        else:
+            result.append(operand)
+    return result
+
+
+def _bound_keys(bounds):
+    """
+    Comparable keys for the bounds of a field's ranges: numbers as they are,
+    and dates (in any format the evaluator reads) as :class:`datetime`.
+    `None` when the bounds are not all of one kind.
+    """
+    # Imported here, as the evaluator optimizes the queries it compiles
+    from emma.query.evaluator import as_datetime
+
+    values = [y for x in bounds for y in x]
+    if all(isinstance(x, (int, float)) and not isinstance(x, bool)
+           for x in values):
+        return bounds
+    moments = [as_datetime(x) for x in values]
+    if any(x is None for x in moments):
+        return None
+    return [tuple(moments[x:x + 2]) for x in range(0, len(moments), 2)]
+
+
+def _merge_ranges(operator, operands):
+    """
+    Collapse `between` ranges on one field: intersect them under `and`, and
+    join those which overlap under `or`. Bounds are compared as numbers or
+    dates; ranges whose bounds are neither, or which do not intersect, are
+    left as they are.
+    """
+    ranges = collections.OrderedDict()
+    for operand in operands:
+        if _is_leaf(operand, "between"):
+            ranges.setdefault(operand[0], []).append(tuple(operand[2:4]))
+
+    merged = {}
+    for field, bounds in ranges.items():
+        keys = _bound_keys(bounds) if len(bounds) > 1 else None
+        if keys is None:
+            continue
+        # Each bound alongside its key, so the original values are kept
+        pairs = [((x[0][0], x[1][0]), (x[0][1], x[1][1]))
+                 for x in zip(keys, bounds)]
+        if operator == "and":
+            low = max((x[0] for x in pairs), key=lambda x: x[0])
+            high = min((x[1] for x in pairs), key=lambda x: x[0])
+            if low[0] > high[0]:
+                continue
+            merged[field] = [(low[1], high[1])]
+        else:
+            joined = []
+            for low, high in sorted(pairs, key=lambda x: (x[0][0], x[1][0])):
+                if joined and low[0] <= joined[-1][1][0]:
+                    joined[-1] = (joined[-1][0],
+                                  max(high, joined[-1][1], key=lambda x: x[0]))
+                else:
+                    joined.append((low, high))
+            merged[field] = [(x[0][1], x[1][1]) for x in joined]
+
+    result = []
+    for operand in operands:
+        if operand[0] in merged and _is_leaf(operand, "between"):
+            if merged[operand[0]] is not None:
+                result.extend((operand[0], "between") + x
+                              for x in merged[operand[0]])
+                merged[operand[0]] = None
+        else:
+            result.append(operand)
+    return result
+
+
+def _finish(query):
+    """Simplify a node which will not be spliced any further"""
+    if not isinstance(query, _Node):
+        return query
+    operands = _merge_ranges(query.operator, _dedupe(query.operands))
+    if query.operator == "or":
+        operands = _merge_equalities(operands)
+    operands = _dedupe(operands)
+    if len(operands) == 1:
+        return operands[0]
+    return (query.operator,) + tuple(operands)
+
+
+def _combine(operator, operands):
+    """Splice operands which share the operator, finishing the others"""
+    spliced = None
+    for operand in operands:
+        if isinstance(operand, _Node) and operand.operator == operator:
+            if spliced is None:
+                spliced = operand.operands
+            else:
+                spliced.extend(operand.operands)
+        else:
+            if spliced is None:
+                spliced = []
+            spliced.append(_finish(operand))
+    return _Node(operator, spliced)
+
+
+def optimize(query):
+    """
+    Rewrites a query into a smaller equivalent for `/searches`: nested
+    `and`/`or` are flattened into n-ary operators, negations are pushed down
+    to single conditions, `eq` alternatives on a field become one `in`,
+    overlapping `between` ranges on a field are collapsed and repeated
+    conditions are dropped. Queries of any depth are handled without
+    recursion.
+
+    :param query: The query
+    :type query: :class:`CompositeQuery` or :class:`tuple`
+    :rtype: :class:`tuple`
+
+    Usage::
+
+        >>> from emma.query.factory import QueryFactory as qf
+        >>> from emma.query.optimizer import optimize
+        >>> query = ~(~qf.eq('member_field:color', "red")
+        ...           & ~qf.eq('member_field:color', "blue"))
+        >>> optimize(query)
+        ("member_field:color", "in", "red", "blue")
+    """
+    query = query.to_tuple() if hasattr(query, 'to_tuple') else query
+    results = []
+    stack = [(query, False, None)]
+    while stack:
+        query, negated, count = stack.pop()
+        if count is not None:
+            start = len(results) - count
+            results[start:] = [_combine(query, results[start:])]
+        elif query[0] == "not":
+            stack.append((query[1], not negated, None))
+        elif query[0] in ("and", "or"):
+            operator = DUAL[query[0]] if negated else query[0]
+            operands = query[1:]
+            stack.append((operator, negated, len(operands)))
+            stack.extend((x, negated, None) for x in reversed(operands))
+        else:
+            results.append(("not", query) if negated else query)
+    return _finish(results[0])
@@ -21,30 +21,62 @@ class CompositeQuery(object):
         return self.negate()
 
 
-class ConjunctionQuery(CompositeQuery):
+class LogicalQuery(CompositeQuery):
+    """
+    Base class for queries over other queries, which name their `operator`
+    and list the queries they combine with `operands()`. These serialize
+    without recursion, so trees of any depth can be sent.
+    """
+    operator = None
+
+    def to_tuple(self):
+        results = []
+        stack = [(self, False)]
+        while stack:
+            query, visited = stack.pop()
+            if not isinstance(query, LogicalQuery):
+                results.append(query.to_tuple())
+                continue
+            operands = query.operands()
+            if visited:
+                start = len(results) - len(operands)
+                results[start:] = [(query.operator,) + tuple(results[start:])]
+            else:
+                stack.append((query, True))
+                stack.extend((x, False) for x in reversed(operands))
+        return results[0]
+
+
+class ConjunctionQuery(LogicalQuery):
     """Represents a logical conjunction (AND)"""
+    operator = "and"
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
 
-    def to_tuple(self):
-        return "and", self.left.to_tuple(), self.right.to_tuple()
+    def operands(self):
+        return self.left, self.right
 
 
-class DisjunctionQuery(CompositeQuery):
+class DisjunctionQuery(LogicalQuery):
     """Represents a logical disjunction (OR)"""
+    operator = "or"
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
 
-    def to_tuple(self):
-        return "or", self.left.to_tuple(), self.right.to_tuple()
+    def operands(self):
+        return self.left, self.right
 
 
-class NegationQuery(CompositeQuery):
+class NegationQuery(LogicalQuery):
     """Represents a logical negation (NOT)"""
+    operator = "not"
+
     def __init__(self, query):
         self.query = query
 
-    def to_tuple(self):
-        return "not", self.query.to_tuple()
\ No newline at end of file
+    def operands(self):
+        return self.query,
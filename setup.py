@@ -6,5 +6,6 @@ setup(
     packages=['emma',],
     license='MIT',
     long_description=open('README.md').read(),
-    install_requires=['requests==2.22.0'], 
+    install_requires=['requests==2.22.0',
+                      'futures; python_version < "3"'],
 )
\ No newline at end of file
@@ -0,0 +1,216 @@
+import itertools
+import threading
+import time
+import unittest
+from emma.adapter import AbstractAdapter
+
+
+class PagingAdapter(AbstractAdapter):
+    """Serves a listing of `total` rows, honoring start/end/count"""
+    total = 0
+    delay = 0
+
+    def __init__(self, *args, **kwargs):
+        super(PagingAdapter, self).__init__(*args, **kwargs)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        params = dict(params or {})
+        with self.lock:
+            self.calls.append(params)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.__class__.delay)
+        with self.lock:
+            self.active -= 1
+        if params.get('count'):
+            return self.__class__.total
+        start = params.get('start', 0)
+        end = min(params.get('end', self.MAX_PAGE_SIZE), self.__class__.total)
+        return [{'member_id': x} for x in range(start, end)]
+
+
+class AbstractAdapterMapTest(unittest.TestCase):
+    def test_map_preserves_order(self):
+        adapter = AbstractAdapter(max_workers=4)
+        self.assertEqual(
+            [x * 2 for x in range(20)],
+            adapter.map(lambda x: x * 2, range(20)))
+
+    def test_map_is_sequential_by_default(self):
+        adapter = AbstractAdapter()
+        self.assertEqual(1, adapter.max_workers)
+        threads = set()
+        adapter.map(lambda x: threads.add(threading.current_thread()), range(5))
+        self.assertEqual(set([threading.current_thread()]), threads)
+
+    def test_map_of_nothing(self):
+        self.assertEqual([], AbstractAdapter(max_workers=4).map(str, []))
+
+
+class PaginatedGetTest(unittest.TestCase):
+    def test_sequential_pagination_stops_at_short_page(self):
+        PagingAdapter.total = 1200
+        PagingAdapter.delay = 0
+        adapter = PagingAdapter()
+        items = adapter.paginated_get('/members', {})
+        self.assertEqual(list(range(1200)), [x['member_id'] for x in items])
+        self.assertEqual(3, len(adapter.calls))
+        self.assertFalse(any('count' in x for x in adapter.calls))
+
+    def test_parallel_pagination_reassembles_in_order(self):
+        PagingAdapter.total = 2250
+        PagingAdapter.delay = 0.01
+        adapter = PagingAdapter(max_workers=4)
+        items = adapter.paginated_get('/members', {'deleted': True})
+        self.assertEqual(list(range(2250)), [x['member_id'] for x in items])
+        self.assertEqual({'deleted': True, 'count': True}, adapter.calls[0])
+        self.assertEqual(
+            [(0, 500), (500, 1000), (1000, 1500), (1500, 2000), (2000, 2500)],
+            sorted((x.get('start', 0), x.get('end', 500))
+                   for x in adapter.calls[1:]))
+        self.assertTrue(all(x['deleted'] for x in adapter.calls))
+        self.assertTrue(1 < adapter.peak <= 4)
+
+    def test_parallel_pagination_can_be_requested_per_call(self):
+        PagingAdapter.total = 1000
+        PagingAdapter.delay = 0
+        adapter = PagingAdapter()
+        items = adapter.paginated_get('/members', {}, max_workers=2)
+        self.assertEqual(1000, len(items))
+        self.assertEqual(3, len(adapter.calls))
+
+    def test_parallel_pagination_of_an_empty_listing(self):
+        PagingAdapter.total = 0
+        PagingAdapter.delay = 0
+        adapter = PagingAdapter(max_workers=4)
+        self.assertEqual([], adapter.paginated_get('/members'))
+        self.assertEqual([{'count': True}], adapter.calls)
+
+    def test_parallel_pagination_leaves_params_untouched(self):
+        PagingAdapter.total = 10
+        PagingAdapter.delay = 0
+        params = {'deleted': True}
+        PagingAdapter(max_workers=4).paginated_get('/members', params)
+        self.assertEqual({'deleted': True}, params)
+
+
+class IterPaginatedTest(unittest.TestCase):
+    def test_pages_are_fetched_as_they_are_consumed(self):
+        PagingAdapter.total = 1200
+        PagingAdapter.delay = 0
+        adapter = PagingAdapter()
+        items = adapter.iter_paginated('/members')
+        self.assertEqual(0, len(adapter.calls))
+        self.assertEqual({'member_id': 0}, next(items))
+        self.assertEqual(1, len(adapter.calls))
+        self.assertEqual(499, len(list(itertools.islice(items, 499))))
+        self.assertEqual(1, len(adapter.calls))
+        next(items)
+        self.assertEqual(2, len(adapter.calls))
+        self.assertEqual(list(range(501, 1200)), [x['member_id'] for x in items])
+
+    def test_concurrent_pages_are_yielded_in_order(self):
+        PagingAdapter.total = 3333
+        PagingAdapter.delay = 0.01
+        adapter = PagingAdapter(max_workers=3)
+        self.assertEqual(
+            list(range(3333)),
+            [x['member_id'] for x in adapter.iter_paginated('/members')])
+        self.assertTrue(adapter.peak <= 3)
+
+
+class PaginationContextTest(unittest.TestCase):
+    def test_pagination_add_ons_are_per_call(self):
+        self.assertEqual({}, AbstractAdapter.pagination_add_ons())
+        self.assertEqual({}, AbstractAdapter.pagination_add_ons(0, 500))
+        self.assertEqual(
+            {'start': 500, 'end': 1000},
+            AbstractAdapter.pagination_add_ons(500, 1000))
+        self.assertEqual(
+            {'count': True},
+            AbstractAdapter.pagination_add_ons(500, 1000, count_only=True))
+
+    def test_count_does_not_touch_params(self):
+        PagingAdapter.total = 42
+        PagingAdapter.delay = 0
+        params = {'deleted': True}
+        self.assertEqual(42, PagingAdapter().count('/members', params))
+        self.assertEqual({'deleted': True}, params)
+
+    def test_interleaved_listings_do_not_share_windows(self):
+        PagingAdapter.total = 1500
+        PagingAdapter.delay = 0
+        adapter = PagingAdapter()
+        first = adapter.iter_paginated('/members')
+        second = adapter.iter_paginated('/groups/1/members')
+        pairs = list(zip(first, second))
+        self.assertEqual(1500, len(pairs))
+        self.assertTrue(all(x == y for x, y in pairs))
+
+    def test_one_adapter_can_serve_many_threads(self):
+        PagingAdapter.total = 2000
+        PagingAdapter.delay = 0.001
+        adapter = PagingAdapter()
+        results = {}
+
+        def fetch(n):
+            results[n] = adapter.paginated_get('/members')
+
+        threads = [threading.Thread(target=fetch, args=(x,)) for x in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(6, len(results))
+        for items in results.values():
+            self.assertEqual(list(range(2000)), [x['member_id'] for x in items])
+
+
+class InstrumentedAdapter(AbstractAdapter):
+    def get(self, path, params=None):
+        return self.instrument('GET', path, lambda event: path)
+
+
+class AbstractAdapterSpanTest(unittest.TestCase):
+    def test_spans_nest_and_count_requests(self):
+        adapter = InstrumentedAdapter()
+        finished = []
+        events = []
+        adapter.after_span.append(finished.append)
+        adapter.after_request.append(events.append)
+
+        with adapter.span("outer") as outer:
+            adapter.get('/members')
+            with adapter.span("inner") as inner:
+                adapter.get('/members/123')
+
+        self.assertEqual([inner, outer], finished)
+        self.assertEqual(2, outer.requests)
+        self.assertEqual(1, inner.requests)
+        self.assertEqual(("outer", "inner"), events[1].spans)
+        self.assertEqual('/members/{id}', events[1].template)
+        self.assertIsNone(adapter.current_span())
+
+    def test_spans_record_errors(self):
+        adapter = AbstractAdapter()
+        with self.assertRaises(KeyError):
+            with adapter.span("failing") as span:
+                raise KeyError()
+        self.assertIsInstance(span.error, KeyError)
+        self.assertIsNotNone(span.duration)
+
+    def test_spans_are_carried_into_workers(self):
+        adapter = InstrumentedAdapter(max_workers=4)
+        events = []
+        adapter.after_request.append(events.append)
+
+        with adapter.span("batch") as span:
+            adapter.map(lambda x: adapter.get('/members/%s' % x), range(8))
+
+        self.assertEqual(8, span.requests)
+        self.assertEqual(set([("batch",)]), set(x.spans for x in events))
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from emma.adapter.async_adapter import AsyncAdapter
+from tests.adapter.adapter_test import PagingAdapter
+from tests.model import MockAdapter
+
+
+class AsyncAdapterTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = AsyncAdapter(MockAdapter(), max_workers=4)
+
+    def tearDown(self):
+        self.adapter.close()
+
+    def test_verbs_are_awaitable(self):
+        MockAdapter.expected = {'member_id': 123}
+
+        async def run():
+            return [
+                await self.adapter.get('/members/123', {'deleted': True}),
+                await self.adapter.post('/members', {'members': []}),
+                await self.adapter.put('/members/123', {'email': "x@y.com"}),
+                await self.adapter.delete('/members/123')]
+
+        self.assertEqual(4 * [{'member_id': 123}], asyncio.run(run()))
+        self.assertEqual(4, self.adapter.adapter.called)
+        self.assertEqual(
+            ('DELETE', '/members/123', {}),
+            self.adapter.adapter.call)
+
+    def test_requests_can_be_fanned_out(self):
+        PagingAdapter.total = 1
+        PagingAdapter.delay = 0.02
+        adapter = AsyncAdapter(PagingAdapter(), max_workers=4)
+
+        async def run():
+            return await asyncio.gather(
+                *[adapter.get('/members') for _ in range(8)])
+
+        self.assertEqual(8, len(asyncio.run(run())))
+        self.assertTrue(1 < adapter.adapter.peak <= 4)
+        adapter.close()
+
+
+class AsyncPaginationTest(unittest.TestCase):
+    def test_sequential_pagination(self):
+        PagingAdapter.total = 1200
+        PagingAdapter.delay = 0
+        adapter = AsyncAdapter(PagingAdapter(), max_workers=1)
+        items = asyncio.run(adapter.paginated_get('/members', {'deleted': True}))
+        self.assertEqual(list(range(1200)), [x['member_id'] for x in items])
+        self.assertEqual(3, len(adapter.adapter.calls))
+        adapter.close()
+
+    def test_concurrent_pagination(self):
+        PagingAdapter.total = 2250
+        PagingAdapter.delay = 0.01
+        adapter = AsyncAdapter(PagingAdapter(), max_workers=3)
+        items = asyncio.run(adapter.paginated_get('/members'))
+        self.assertEqual(list(range(2250)), [x['member_id'] for x in items])
+        self.assertEqual({'count': True}, adapter.adapter.calls[0])
+        self.assertEqual(6, len(adapter.adapter.calls))
+        self.assertTrue(1 < adapter.adapter.peak <= 3)
+        adapter.close()
+
+    def test_iter_paginated(self):
+        PagingAdapter.total = 700
+        PagingAdapter.delay = 0
+        adapter = AsyncAdapter(PagingAdapter(), max_workers=2)
+
+        async def run():
+            return [x['member_id'] async for x in adapter.iter_paginated('/members')]
+
+        self.assertEqual(list(range(700)), asyncio.run(run()))
+        adapter.close()
@@ -0,0 +1,128 @@
+import unittest
+from emma.adapter import cache
+from emma.adapter.cache import ResponseCache
+
+
+class Loader(object):
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.time = cache.time.time
+        cache.time.time = lambda: self.now
+        self.cache = ResponseCache()
+
+    def tearDown(self):
+        cache.time.time = self.time
+
+    def test_uses_the_longest_matching_prefix_for_ttls(self):
+        self.assertEqual(3600, self.cache.ttl('/fields'))
+        self.assertEqual(3600, self.cache.ttl('/fields/200'))
+        self.assertEqual(30, self.cache.ttl('/members/200'))
+        self.assertEqual(5, self.cache.ttl('/members/imports/200'))
+        self.assertEqual(86400, self.cache.ttl('/webhooks/events'))
+        self.assertEqual(ResponseCache.DEFAULT_TTL, self.cache.ttl('/groups'))
+        self.assertEqual(ResponseCache.DEFAULT_TTL,
+                         self.cache.ttl('/fieldsets'))
+
+    def test_caches_by_path_and_params(self):
+        load = Loader([{'member_id': 200}])
+
+        self.cache.fetch('/members', {'deleted': True}, load)
+        self.cache.fetch('/members', {'deleted': True}, load)
+        self.cache.fetch('/members', {}, load)
+
+        self.assertEqual(2, load.calls)
+
+    def test_copies_responses(self):
+        load = Loader([{'member_id': 200}])
+
+        self.cache.fetch('/members', {}, load)[0]['member_id'] = 201
+
+        self.assertEqual([{'member_id': 200}],
+                         self.cache.fetch('/members', {}, load))
+
+    def test_expires_responses(self):
+        load = Loader([])
+
+        self.cache.fetch('/members', {}, load)
+        self.now += 31
+        self.cache.fetch('/members', {}, load)
+
+        self.assertEqual(2, load.calls)
+
+    def test_zero_ttl_disables_caching(self):
+        self.cache = ResponseCache({'/members': 0})
+        load = Loader([])
+
+        self.cache.fetch('/members', {}, load)
+        self.cache.fetch('/members', {}, load)
+
+        self.assertEqual(2, load.calls)
+        self.assertEqual(0, len(self.cache))
+
+    def test_evicts_the_least_recently_used(self):
+        self.cache = ResponseCache(max_entries=2)
+        self.cache.fetch('/groups/1', {}, Loader(1))
+        self.cache.fetch('/groups/2', {}, Loader(2))
+        self.cache.fetch('/groups/1', {}, Loader(None))
+        self.cache.fetch('/groups/3', {}, Loader(3))
+
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual(1, self.cache.fetch('/groups/1', {}, Loader(None)))
+        self.assertIsNone(self.cache.fetch('/groups/2', {}, Loader(None)))
+
+    def test_invalidates_the_resource_of_a_write(self):
+        self.cache.fetch('/members/200', {}, Loader(1))
+        self.cache.fetch('/members', {}, Loader(2))
+        self.cache.fetch('/mailings', {}, Loader(3))
+
+        self.cache.invalidate('/members/200/groups')
+
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(3, self.cache.fetch('/mailings', {}, Loader(None)))
+
+    def test_invalidates_memberships_from_either_side(self):
+        self.cache.fetch('/members/200/groups', {}, Loader(1))
+        self.cache.fetch('/fields', {}, Loader(2))
+
+        self.cache.invalidate('/groups/1024/members')
+
+        self.assertEqual(1, len(self.cache))
+        self.assertIsNone(
+            self.cache.fetch('/members/200/groups', {}, Loader(None)))
+
+        self.cache.fetch('/groups/1024/members', {}, Loader(3))
+        self.cache.invalidate('/members/200')
+
+        self.assertIsNone(
+            self.cache.fetch('/groups/1024/members', {}, Loader(None)))
+        self.assertEqual(2, self.cache.fetch('/fields', {}, Loader(None)))
+
+    def test_keeps_scopes_apart(self):
+        self.cache.fetch('/members', {}, Loader(1), scope="a")
+        self.cache.fetch('/members', {}, Loader(2), scope="b")
+
+        self.cache.invalidate('/members', scope="a")
+
+        self.assertIsNone(
+            self.cache.fetch('/members', {}, Loader(None), scope="a"))
+        self.assertEqual(
+            2, self.cache.fetch('/members', {}, Loader(None), scope="b"))
+
+    def test_does_not_store_a_response_overtaken_by_a_write(self):
+        def load():
+            self.cache.invalidate('/members/200')
+            return 1
+
+        self.cache.fetch('/members', {}, load)
+
+        self.assertEqual(0, len(self.cache))
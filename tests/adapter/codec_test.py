@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import unittest
+from emma.adapter import codec
+from emma.adapter.codec import JsonCodec, OrjsonCodec, default_codec
+
+
+class JsonCodecTest(unittest.TestCase):
+    def test_round_trips(self):
+        data = {'members': [{'email': "test@example.com", 'fields': {}}]}
+        self.assertEqual(data, JsonCodec.loads(JsonCodec.dumps(data)))
+        self.assertEqual([1], JsonCodec.loads(b"[1]"))
+
+
+@unittest.skipIf(codec.orjson is None, "orjson is not installed")
+class OrjsonCodecTest(unittest.TestCase):
+    def test_matches_the_standard_library(self):
+        data = {'members': [{'email': u"tést@example.com"}], 1: None}
+        self.assertEqual(
+            JsonCodec.loads(JsonCodec.dumps(data)),
+            OrjsonCodec.loads(OrjsonCodec.dumps(data)))
+        self.assertEqual({'1': None, 'members': []},
+                         OrjsonCodec.loads(b'{"1": null, "members": []}'))
+
+
+class DefaultCodecTest(unittest.TestCase):
+    def test_prefers_orjson(self):
+        self.assertEqual(
+            "json" if codec.orjson is None else "orjson", default_codec().name)
+
+    def test_falls_back_to_the_standard_library(self):
+        installed = codec.orjson
+        codec.orjson = None
+        try:
+            self.assertIsInstance(default_codec(), JsonCodec)
+        finally:
+            codec.orjson = installed
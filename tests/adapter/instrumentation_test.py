@@ -0,0 +1,114 @@
+import unittest
+from emma.adapter.instrumentation import (
+    Histogram, Metrics, RequestEvent, Span, StatsdSink, path_template)
+
+
+class FakeSocket(object):
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, address):
+        self.sent.append((data.decode('utf-8'), address))
+
+
+def finished_event(method, path, status, latency, **kwargs):
+    event = RequestEvent(method, path)
+    event.status = status
+    event.latency = latency
+    for key, value in kwargs.items():
+        setattr(event, key, value)
+    return event
+
+
+class PathTemplateTest(unittest.TestCase):
+    def test_replaces_identifiers(self):
+        self.assertEqual('/members', path_template('/members'))
+        self.assertEqual(
+            '/members/{id}/groups', path_template('/members/123/groups'))
+        self.assertEqual(
+            '/members/email/{email}',
+            path_template('/members/email/test@example.com'))
+
+
+class HistogramTest(unittest.TestCase):
+    def test_counts_cumulatively(self):
+        histogram = Histogram((1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+        self.assertEqual(
+            [(1, 2), (5, 3), (float('inf'), 4)], histogram.cumulative())
+        self.assertEqual(14.5, histogram.sum)
+        self.assertEqual(4, histogram.count)
+
+
+class MetricsTest(unittest.TestCase):
+    def test_exports_prometheus_text(self):
+        metrics = Metrics(buckets=(0.1, 1))
+        metrics.observe_request(finished_event(
+            'GET', '/members/123', 200, 0.05, bytes_in=120, attempts=3))
+        metrics.observe_request(finished_event(
+            'GET', '/members/321', 200, 0.5, bytes_in=80, attempts=1))
+        span = Span("AccountMemberCollection.fetch_all")
+        span.duration = 2.0
+        metrics.observe_span(span)
+
+        text = metrics.to_prometheus()
+
+        self.assertIn(
+            'emma_requests_total{method="GET",path="/members/{id}",'
+            'status="200"} 2\n', text)
+        self.assertIn(
+            'emma_request_duration_seconds_bucket{le="0.1",method="GET",'
+            'path="/members/{id}"} 1\n', text)
+        self.assertIn(
+            'emma_request_duration_seconds_bucket{le="+Inf",method="GET",'
+            'path="/members/{id}"} 2\n', text)
+        self.assertIn(
+            'emma_response_bytes_total{method="GET",path="/members/{id}"} 200\n',
+            text)
+        self.assertIn(
+            'emma_request_retries_total{method="GET",path="/members/{id}"} 2\n',
+            text)
+        self.assertIn(
+            'emma_span_duration_seconds_count'
+            '{span="AccountMemberCollection.fetch_all"} 1\n', text)
+
+    def test_counts_cached_responses(self):
+        metrics = Metrics()
+        metrics.observe_request(finished_event(
+            'GET', '/fields', None, 0.0, cached=True))
+        self.assertEqual({('GET', '/fields', 'cached'): 1}, metrics.requests)
+
+    def test_counts_coalesced_requests(self):
+        metrics = Metrics()
+        metrics.observe_request(finished_event(
+            'GET', '/fields', None, 0.0, coalesced=True))
+        metrics.observe_request(finished_event(
+            'GET', '/fields', None, 0.0, coalesced=True, error=ValueError()))
+        self.assertEqual({('GET', '/fields', 'coalesced'): 1,
+                          ('GET', '/fields', 'error'): 1}, metrics.requests)
+
+
+class StatsdSinkTest(unittest.TestCase):
+    def test_sends_requests_and_spans(self):
+        sink = StatsdSink(prefix="test")
+        sink.socket.close()
+        sink.socket = FakeSocket()
+
+        sink.send_request(finished_event(
+            'PUT', '/members/123', 200, 0.25, bytes_out=20))
+        span = Span("AccountMemberCollection.save")
+        span.duration = 1.5
+        sink.send_span(span)
+
+        request, span_line = [x[0] for x in sink.socket.sent]
+        self.assertEqual([
+            'test.request.put.members._id_:250|ms',
+            'test.request.put.members._id_.status.200:1|c',
+            'test.request.put.members._id_.bytes_out:20|c',
+            'test.request.put.members._id_.bytes_in:0|c',
+            'test.request.put.members._id_.retries:0|c'],
+            request.split('\n'))
+        self.assertEqual(
+            'test.span.AccountMemberCollection.save:1500|ms', span_line)
+        self.assertEqual(('localhost', 8125), sink.socket.sent[0][1])
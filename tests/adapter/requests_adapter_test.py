@@ -0,0 +1,341 @@
+import gzip
+import io
+import json
+import threading
+import unittest
+import requests.adapters
+from emma import exceptions as ex
+from emma.adapter.cache import ResponseCache
+from emma.adapter.codec import JsonCodec
+from emma.adapter.requests_adapter import RequestsAdapter
+from emma.adapter.scheduler import RequestScheduler
+
+
+class MockResponse(object):
+    def __init__(self, status_code=200, content=None):
+        self.status_code = status_code
+        self.content = json.dumps(content).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class MockSession(object):
+    response = MockResponse()
+
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.__class__.response
+
+    def close(self):
+        self.closed = True
+
+
+class SequenceSession(MockSession):
+    def __init__(self, *responses):
+        super(SequenceSession, self).__init__()
+        self.responses = list(responses)
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+class GatedSession(MockSession):
+    """Holds each request until released, so identical ones can pile up"""
+    def __init__(self):
+        super(GatedSession, self).__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        self.started.set()
+        self.release.wait(5)
+        return self.__class__.response
+
+
+class RequestsAdapterTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = RequestsAdapter({
+            "account_id": "100",
+            "public_key": "xxx",
+            "private_key": "yyy"})
+
+    def test_session_pools_connections_per_host(self):
+        pool = self.adapter.session.get_adapter('https://api.e2ma.net/100')
+        self.assertIsInstance(pool, requests.adapters.HTTPAdapter)
+        self.assertEqual(pool._pool_connections,
+                         RequestsAdapter.POOL_CONNECTIONS)
+        self.assertEqual(pool._pool_maxsize, RequestsAdapter.POOL_MAXSIZE)
+        self.assertFalse(pool._pool_block)
+
+    def test_pool_size_can_be_configured(self):
+        adapter = RequestsAdapter(
+            {"account_id": "100", "public_key": "xxx", "private_key": "yyy"},
+            pool_connections=2,
+            pool_maxsize=25,
+            pool_block=True)
+        pool = adapter.session.get_adapter('https://api.e2ma.net/100')
+        self.assertEqual(pool._pool_connections, 2)
+        self.assertEqual(pool._pool_maxsize, 25)
+        self.assertTrue(pool._pool_block)
+
+    def test_pool_keeps_a_connection_per_worker(self):
+        adapter = RequestsAdapter(
+            {"account_id": "100", "public_key": "xxx", "private_key": "yyy"},
+            max_workers=16)
+        pool = adapter.session.get_adapter('https://api.e2ma.net/100')
+        self.assertEqual(16, pool._pool_maxsize)
+
+        adapter.max_workers = 20
+        self.assertEqual(20, pool._pool_maxsize)
+        self.assertEqual(20, pool.poolmanager.connection_pool_kw['maxsize'])
+
+        adapter.max_workers = 4
+        self.assertEqual(20, pool._pool_maxsize)
+
+    def test_keep_alive_can_be_disabled(self):
+        self.assertNotEqual(
+            'close', self.adapter.session.headers.get('Connection'))
+        adapter = RequestsAdapter(
+            {"account_id": "100", "public_key": "xxx", "private_key": "yyy"},
+            keep_alive=False)
+        self.assertEqual('close', adapter.session.headers['Connection'])
+
+    def test_session_carries_credentials(self):
+        self.assertIs(self.adapter.session.auth, self.adapter.auth)
+
+    def test_requests_reuse_the_session(self):
+        self.adapter.session = MockSession()
+        self.adapter.codec = JsonCodec()
+        MockSession.response = MockResponse(200, [])
+        self.adapter.get('/members', {})
+        self.adapter.post('/members', {'members': []})
+        self.adapter.put('/members/1', {'email': "test@example.com"})
+        self.adapter.delete('/members/1')
+        self.assertEqual(
+            [(x[0], x[1]) for x in self.adapter.session.calls],
+            [('GET', 'https://api.e2ma.net/100/members'),
+             ('POST', 'https://api.e2ma.net/100/members'),
+             ('PUT', 'https://api.e2ma.net/100/members/1'),
+             ('DELETE', 'https://api.e2ma.net/100/members/1')])
+        self.assertEqual(
+            json.loads(self.adapter.session.calls[1][2]['data']),
+            {'members': []})
+
+    def test_get_leaves_params_untouched(self):
+        self.adapter.session = MockSession()
+        MockSession.response = MockResponse(200, [])
+        params = {'deleted': True}
+        self.adapter.get('/members', params)
+        self.assertEqual({'deleted': True}, params)
+        self.assertEqual(
+            {'deleted': True},
+            self.adapter.session.calls[0][2]['params'])
+
+    def test_close_closes_the_session(self):
+        self.adapter.session = MockSession()
+        self.adapter.close()
+        self.assertTrue(self.adapter.session.closed)
+
+    def test_can_be_used_as_a_context_manager(self):
+        self.adapter.session = MockSession()
+        with self.adapter as adptr:
+            self.assertIs(adptr, self.adapter)
+        self.assertTrue(self.adapter.session.closed)
+
+    def test_404_produces_none(self):
+        self.adapter.session = MockSession()
+        MockSession.response = MockResponse(404)
+        self.assertIsNone(self.adapter.get('/members/1'))
+
+    def test_400_raises(self):
+        self.adapter.session = MockSession()
+        MockSession.response = MockResponse(400)
+        with self.assertRaises(ex.ApiRequest400):
+            self.adapter.get('/members/1')
+
+    def test_gets_through_the_cache(self):
+        self.adapter.session = MockSession()
+        self.adapter.cache = ResponseCache()
+        MockSession.response = MockResponse(200, [{'member_id': 200}])
+
+        self.adapter.get('/members', {'deleted': True})
+        result = self.adapter.get('/members', {'deleted': True})
+
+        self.assertEqual([{'member_id': 200}], result)
+        self.assertEqual(1, len(self.adapter.session.calls))
+
+    def test_writes_invalidate_the_cache(self):
+        self.adapter.session = MockSession()
+        self.adapter.cache = ResponseCache()
+        MockSession.response = MockResponse(200, True)
+
+        self.adapter.get('/members/1')
+        self.adapter.put('/members/1', {'email': "test@example.com"})
+        self.adapter.get('/members/1')
+
+        self.assertEqual(
+            ['GET', 'PUT', 'GET'],
+            [x[0] for x in self.adapter.session.calls])
+
+    def test_cache_defaults_to_the_shared_cache(self):
+        self.assertIsNone(self.adapter.cache)
+        shared = ResponseCache()
+        RequestsAdapter.CACHE = shared
+        try:
+            adapter = RequestsAdapter(
+                {"account_id": "100", "public_key": "xxx",
+                 "private_key": "yyy"})
+        finally:
+            RequestsAdapter.CACHE = None
+        self.assertIs(shared, adapter.cache)
+
+    def test_retries_transient_failures(self):
+        self.adapter.session = SequenceSession(
+            MockResponse(503), MockResponse(200, {'member_id': 1}))
+        self.adapter.scheduler = RequestScheduler(rate=0, backoff=0)
+
+        self.assertEqual({'member_id': 1}, self.adapter.get('/members/1'))
+        self.assertEqual(2, len(self.adapter.session.calls))
+
+    def test_persistent_throttling_raises(self):
+        self.adapter.session = SequenceSession(*[MockResponse(429)] * 3)
+        self.adapter.scheduler = RequestScheduler(
+            rate=0, backoff=0, max_retries=2)
+
+        with self.assertRaises(ex.ApiRequest429):
+            self.adapter.post('/members', {'members': []})
+        self.assertEqual(3, len(self.adapter.session.calls))
+
+    def test_scheduler_defaults_to_the_shared_scheduler(self):
+        self.assertIsInstance(self.adapter.scheduler, RequestScheduler)
+        shared = RequestScheduler()
+        RequestsAdapter.SCHEDULER = shared
+        try:
+            adapter = RequestsAdapter(
+                {"account_id": "100", "public_key": "xxx",
+                 "private_key": "yyy"})
+        finally:
+            RequestsAdapter.SCHEDULER = None
+        self.assertIs(shared, adapter.scheduler)
+
+    def test_hooks_observe_each_request(self):
+        self.adapter.session = SequenceSession(
+            MockResponse(503), MockResponse(200, {'member_id': 1}))
+        self.adapter.scheduler = RequestScheduler(rate=0, backoff=0)
+        self.adapter.codec = JsonCodec()
+        before = []
+        after = []
+        self.adapter.before_request.append(lambda x: before.append(x.status))
+        self.adapter.after_request.append(after.append)
+
+        with self.adapter.span("lookup"):
+            self.adapter.put('/members/1', {'email': "test@example.com"})
+
+        self.assertEqual([None], before)
+        event = after[0]
+        self.assertEqual(('PUT', '/members/{id}', 200),
+                         (event.method, event.template, event.status))
+        self.assertEqual(1, event.retries)
+        self.assertEqual(len(json.dumps({'email': "test@example.com"})),
+                         event.bytes_out)
+        self.assertEqual(len(json.dumps({'member_id': 1})), event.bytes_in)
+        self.assertEqual(("lookup",), event.spans)
+        self.assertTrue(event.latency >= 0)
+
+    def test_bodies_go_through_the_codec(self):
+        self.adapter.session = MockSession()
+        MockSession.response = MockResponse(200, {'import_id': 1})
+        self.adapter.codec = JsonCodec()
+
+        result = self.adapter.post('/members', {'members': [], 1: True})
+
+        self.assertEqual({'import_id': 1}, result)
+        self.assertEqual(
+            {"members": [], "1": True},
+            json.loads(self.adapter.session.calls[0][2]['data']))
+
+    def test_negotiates_compressed_responses(self):
+        self.assertIn("gzip", self.adapter.session.headers['Accept-Encoding'])
+
+    def test_compresses_large_bodies(self):
+        self.adapter.session = MockSession()
+        MockSession.response = MockResponse(200, True)
+        self.adapter.codec = JsonCodec()
+        self.adapter.compress_threshold = 64
+        members = [{'email': "test%s@example.com" % x} for x in range(20)]
+
+        self.adapter.put('/members/1', {'email': "test@example.com"})
+        self.adapter.post('/members', {'members': members})
+
+        small, large = [x[2] for x in self.adapter.session.calls]
+        self.assertNotIn('headers', small)
+        self.assertEqual({'Content-Encoding': "gzip"}, large['headers'])
+        self.assertEqual(
+            {'members': members},
+            json.loads(gzip.GzipFile(
+                fileobj=io.BytesIO(large['data'])).read().decode('utf-8')))
+
+    def concurrently(self, count, func):
+        """Runs `func` in threads once the first request is held"""
+        self.adapter.session = GatedSession()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(func()))
+                   for _ in range(count)]
+        threads[0].start()
+        self.assertTrue(self.adapter.session.started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        for _ in range(500):
+            if sum(x.waiters for x in self.adapter.flights._flights.values()) \
+                    == count - 1 or len(self.adapter.session.calls) == count:
+                break
+            threading.Event().wait(0.01)
+        self.adapter.session.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_coalesces_identical_concurrent_gets(self):
+        MockSession.response = MockResponse(200, {'member_id': 200})
+        after = []
+        self.adapter.after_request.append(after.append)
+
+        results = self.concurrently(
+            4, lambda: self.adapter.get('/members/200', {'deleted': True}))
+
+        self.assertEqual([{'member_id': 200}] * 4, results)
+        self.assertEqual(1, len(self.adapter.session.calls))
+        self.assertEqual(
+            [200, 'coalesced', 'coalesced', 'coalesced'],
+            sorted([x.outcome for x in after], key=str))
+
+    def test_coalescing_can_be_disabled(self):
+        MockSession.response = MockResponse(200, {'member_id': 200})
+        self.adapter.coalesce = False
+
+        self.concurrently(3, lambda: self.adapter.get('/members/200'))
+
+        self.assertEqual(3, len(self.adapter.session.calls))
+
+    def test_gets_with_other_params_are_not_coalesced(self):
+        MockSession.response = MockResponse(200, {'member_id': 200})
+        params = iter([{}, {'deleted': True}])
+
+        self.concurrently(2, lambda: self.adapter.get('/members/200', next(params)))
+
+        self.assertEqual(2, len(self.adapter.session.calls))
+
+    def test_writes_are_not_coalesced(self):
+        MockSession.response = MockResponse(200, True)
+
+        self.concurrently(
+            2, lambda: self.adapter.put('/members/1', {'status': "active"}))
+
+        self.assertEqual(2, len(self.adapter.session.calls))
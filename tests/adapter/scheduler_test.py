@@ -0,0 +1,125 @@
+import unittest
+from emma.adapter import scheduler
+from emma.adapter.scheduler import RequestScheduler, TokenBucket
+
+
+class Response(object):
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class Requests(object):
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class ClockTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.slept = []
+        self.clock = scheduler.clock
+        self.sleep = scheduler.time.sleep
+        scheduler.clock = lambda: self.now
+        scheduler.time.sleep = self.fake_sleep
+
+    def tearDown(self):
+        scheduler.clock = self.clock
+        scheduler.time.sleep = self.sleep
+
+    def fake_sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(ClockTest):
+    def test_allows_bursts_then_waits(self):
+        bucket = TokenBucket(2, 3)
+
+        waits = [bucket.acquire() for x in range(5)]
+
+        self.assertEqual([0.0, 0.0, 0.0, 0.5, 0.5], waits)
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(2, 3)
+        [bucket.acquire() for x in range(3)]
+        self.now += 1.0
+
+        self.assertEqual(0.0, bucket.acquire())
+        self.assertEqual(0.0, bucket.acquire())
+        self.assertEqual(0.5, bucket.acquire())
+
+    def test_can_pause(self):
+        bucket = TokenBucket(2, 3)
+        bucket.pause(2)
+
+        self.assertEqual(2.5, bucket.acquire())
+
+
+class RequestSchedulerTest(ClockTest):
+    def setUp(self):
+        super(RequestSchedulerTest, self).setUp()
+        self.scheduler = RequestScheduler(rate=0, backoff=1, max_retries=3)
+
+    def test_retries_idempotent_requests(self):
+        request = Requests(Response(503), IOError(), Response(200))
+
+        response = self.scheduler.send('GET', request, (IOError,))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, request.calls)
+        self.assertEqual(2, len(self.slept))
+        self.assertTrue(0 <= self.slept[0] <= 1)
+        self.assertTrue(0 <= self.slept[1] <= 2)
+
+    def test_retries_only_throttled_posts(self):
+        request = Requests(Response(429), Response(503))
+
+        response = self.scheduler.send('POST', request, (IOError,))
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(2, request.calls)
+
+    def test_does_not_resend_posts_after_connection_errors(self):
+        request = Requests(IOError())
+
+        with self.assertRaises(IOError):
+            self.scheduler.send('POST', request, (IOError,))
+
+    def test_gives_up_after_max_retries(self):
+        request = Requests(*[Response(503)] * 5)
+
+        response = self.scheduler.send('DELETE', request)
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(4, request.calls)
+
+    def test_honors_retry_after(self):
+        request = Requests(
+            Response(429, {'Retry-After': "7"}), Response(200))
+
+        self.scheduler.send('PUT', request)
+
+        self.assertEqual([7.0], self.slept)
+
+    def test_reads_retry_after_dates(self):
+        self.assertEqual(0.0, self.scheduler.retry_after(
+            Response(429, {'Retry-After': "Wed, 21 Oct 2015 07:28:00 GMT"})))
+        self.assertIsNone(self.scheduler.retry_after(
+            Response(429, {'Retry-After': "soon"})))
+        time = scheduler.time.time
+        scheduler.time.time = lambda: 1445412470.0
+        try:
+            self.assertEqual(10.0, self.scheduler.retry_after(
+                Response(429, {'Retry-After': "Wed, 21 Oct 2015 07:28:00 GMT"})))
+        finally:
+            scheduler.time.time = time
+        self.assertIsNone(self.scheduler.retry_after(Response(429)))
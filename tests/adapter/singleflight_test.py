@@ -0,0 +1,107 @@
+import threading
+import unittest
+from emma.adapter.singleflight import SingleFlight
+
+
+class GatedCall(object):
+    """A call which holds until released, so others can join it"""
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def in_threads(count, func):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(index):
+        try:
+            results[index] = func()
+        except Exception as exception:
+            errors[index] = exception
+
+    threads = [threading.Thread(target=run, args=(x,)) for x in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.flights = SingleFlight()
+
+    def wait_for_waiters(self, key, count):
+        for _ in range(500):
+            if self.flights.joined(key) == count:
+                return
+            threading.Event().wait(0.01)
+        self.fail("waiters never joined")
+
+    def test_concurrent_callers_share_one_call(self):
+        call = GatedCall({'member_id': 200, 'fields': {'first_name': "Emma"}})
+        key = ('/members/200', '{}')
+
+        threads, results, errors = in_threads(
+            5, lambda: self.flights.do(key, call))
+        self.assertTrue(call.started.wait(5))
+        self.wait_for_waiters(key, 4)
+        call.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(1, call.calls)
+        self.assertEqual([None] * 5, errors)
+        self.assertEqual([call.value] * 5, results)
+        # Each caller may mutate what it was given
+        self.assertEqual(5, len(set(id(x) for x in results)))
+        self.assertEqual(5, len(set(id(x['fields']) for x in results)))
+        self.assertEqual(0, len(self.flights))
+
+    def test_errors_reach_every_caller(self):
+        call = GatedCall(error=ValueError("boom"))
+        key = ('/fields', '{}')
+
+        threads, results, errors = in_threads(
+            3, lambda: self.flights.do(key, call))
+        self.assertTrue(call.started.wait(5))
+        self.wait_for_waiters(key, 2)
+        call.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(1, call.calls)
+        self.assertEqual(3, len([x for x in errors if isinstance(x, ValueError)]))
+        self.assertEqual(0, len(self.flights))
+
+    def test_later_calls_are_made_afresh(self):
+        calls = []
+        self.flights.do('key', lambda: calls.append(1))
+        self.flights.do('key', lambda: calls.append(2))
+        self.assertEqual([1, 2], calls)
+
+    def test_a_lone_caller_gets_the_value_itself(self):
+        value = {'member_id': 200}
+        self.assertIs(value, self.flights.do('key', lambda: value))
+
+    def test_forgotten_flights_are_not_joined(self):
+        first = GatedCall({'version': 1})
+        threads, results, _ = in_threads(1, lambda: self.flights.do('key', first))
+        self.assertTrue(first.started.wait(5))
+
+        self.flights.forget()
+        self.assertEqual({'version': 2},
+                         self.flights.do('key', lambda: {'version': 2}))
+        first.release.set()
+        threads[0].join(5)
+        self.assertEqual([{'version': 1}], results)
@@ -0,0 +1,60 @@
+import json
+import sys
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest("the benchmarks require Python 3.7+")
+
+from benchmarks.run import account_for
+from benchmarks.server import FakeEmmaServer
+from emma import get_report
+from emma.enumerations import Report
+
+
+class FakeEmmaServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeEmmaServer(members=1200, groups=4).start()
+        self.account = account_for(self.server)
+
+    def tearDown(self):
+        self.account.adapter.close()
+        self.server.stop()
+
+    def test_pages_members(self):
+        members = self.account.members.fetch_all()
+        self.assertEqual(1200, len(members))
+        self.assertEqual("member1200@example.com", members[1200]['email'])
+        self.assertEqual("First1", members[1]['first_name'])
+        self.assertEqual(3, self.server.requests)
+
+    def test_counts_and_pages_group_members(self):
+        self.assertEqual(300, self.account.adapter.count('/groups/2/members'))
+        self.assertEqual(
+            [2, 6, 10],
+            [x['member_id'] for x in
+             self.account.adapter.paginated_get('/groups/2/members')][:3])
+        self.assertIsNone(self.account.adapter.get('/groups/9/members'))
+
+    def test_serves_reports(self):
+        self.assertEqual(1200, len(get_report(self.account, Report.SentList, 1)))
+        self.assertEqual(400, len(get_report(self.account, Report.DeliveredList, 1)))
+        self.assertEqual(1200, get_report(self.account, Report.MailingSummary, 1)['sent'])
+
+    def test_accepts_imports(self):
+        self.account.members.save([
+            self.account.members.factory({'email': "new@example.com"})])
+        self.assertEqual([1], self.server.imports)
+
+    def test_exchanges_gzipped_bodies(self):
+        events = []
+        self.account.adapter.after_request.append(events.append)
+        self.account.adapter.compress_threshold = 100
+
+        self.account.adapter.paginated_get('/members')
+        self.account.members.save([
+            self.account.members.factory({'email': "new%s@example.com" % x})
+            for x in range(50)])
+
+        self.assertEqual([50], self.server.imports)
+        self.assertTrue(events[0].bytes_in < len(json.dumps(
+            self.server.members[:500])) / 4)
@@ -0,0 +1,120 @@
+import array
+from datetime import datetime
+import json
+import math
+import unittest
+from emma import columnar
+from emma.columnar import INT64, NAT, Columns, export_members, export_report
+from emma.enumerations import Report
+from emma.model.account import Account
+from tests.model import MockAdapter
+
+
+class ColumnsTest(unittest.TestCase):
+    def test_keeps_typed_buffers(self):
+        cols = Columns().extend([
+            {'member_id': 200, 'score': 1.5, 'active': True},
+            {'member_id': 201, 'score': 2, 'active': False}
+        ]).to_arrays()
+
+        self.assertEqual(array.array(INT64, [200, 201]), cols['member_id'])
+        self.assertEqual(array.array('d', [1.5, 2.0]), cols['score'])
+        self.assertEqual(array.array('b', [1, 0]), cols['active'])
+
+    def test_stores_datetimes_as_epoch_seconds(self):
+        cols = Columns().extend([
+            {'member_since': "@D:2013-01-01T00:00:00"},
+            {'member_since': None}
+        ]).to_arrays()
+
+        self.assertEqual(array.array(INT64, [1356998400, NAT]),
+                         cols['member_since'])
+
+    def test_reads_decoded_json(self):
+        cols = Columns().extend(json.loads(
+            '[{"member_id": 200, "member_since": "@D:2013-01-01T00:00:00"},'
+            ' {"member_id": 201, "member_since": null}]')).to_arrays()
+
+        self.assertEqual(array.array(INT64, [200, 201]), cols['member_id'])
+        self.assertEqual(array.array(INT64, [1356998400, NAT]),
+                         cols['member_since'])
+
+    def test_back_fills_missing_fields(self):
+        cols = Columns().extend([
+            {'member_id': 200},
+            {'member_id': 201, 'first_name': "Emma", 'member_since': None},
+            {'member_id': 202, 'member_since': "@D:2013-01-01T00:00:00"}
+        ]).to_arrays()
+
+        self.assertEqual([None, "Emma", None], cols['first_name'])
+        self.assertEqual(array.array(INT64, [NAT, NAT, 1356998400]),
+                         cols['member_since'])
+
+    def test_widens_columns(self):
+        cols = Columns().extend([
+            {'count': 1, 'flag': True, 'when': "@D:2013-01-01T00:00:00"},
+            {'count': None, 'flag': "yes", 'when': "soon"}
+        ]).to_arrays()
+
+        self.assertEqual('d', cols['count'].typecode)
+        self.assertEqual(1.0, cols['count'][0])
+        self.assertTrue(math.isnan(cols['count'][1]))
+        self.assertEqual([True, "yes"], cols['flag'])
+        self.assertEqual([datetime(2013, 1, 1), "soon"], cols['when'])
+
+    @unittest.skipIf(columnar.numpy is None, "NumPy is not installed")
+    def test_can_convert_to_numpy(self):
+        cols = Columns().extend([
+            {'member_id': 200, 'email': "test@example.com"}
+        ]).to_numpy()
+
+        self.assertEqual('int64', str(cols['member_id'].dtype))
+        self.assertEqual('object', str(cols['email'].dtype))
+
+
+class ColumnarExportTest(unittest.TestCase):
+    def setUp(self):
+        self.default_adapter = Account.default_adapter
+        Account.default_adapter = MockAdapter
+        self.account = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy")
+
+    def tearDown(self):
+        Account.default_adapter = self.default_adapter
+
+    def test_can_export_members(self):
+        MockAdapter.expected = [
+            {'member_id': 200, 'email': "test01@example.org",
+             'fields': {'first_name': "Emma"}},
+            {'member_id': 201, 'email': "test02@example.org",
+             'fields': {}}
+        ]
+
+        cols = export_members(self.account, deleted=True)
+
+        self.assertEqual(self.account.adapter.called, 1)
+        self.assertEqual(
+            self.account.adapter.call,
+            ('GET', '/members', {'deleted': True}))
+        self.assertEqual(array.array(INT64, [200, 201]), cols['member_id'])
+        self.assertEqual(["Emma", None], cols['first_name'])
+        self.assertNotIn('fields', cols)
+
+    def test_can_export_a_list_report(self):
+        MockAdapter.expected = [
+            {'member_id': 200, 'timestamp': "@D:2013-01-01T00:00:00"}
+        ]
+
+        cols = export_report(self.account, Report.OpenList, 123)
+
+        self.assertEqual(
+            self.account.adapter.call,
+            ('GET', '/response/123/opens', {}))
+        self.assertEqual(array.array(INT64, [1356998400]), cols['timestamp'])
+
+    def test_cannot_export_a_summary_report(self):
+        with self.assertRaises(ValueError):
+            export_report(self.account, Report.MailingSummary, 123)
+        self.assertEqual(self.account.adapter.called, 0)
@@ -0,0 +1,152 @@
+from datetime import datetime
+import unittest
+from emma.mirror import Mirror
+from emma.model.account import Account
+from emma.query.factory import QueryFactory as q
+from tests.model import RecordingAdapter
+
+
+class MirrorAdapter(RecordingAdapter):
+    responses = {}
+
+    def get(self, path, params=None):
+        super(MirrorAdapter, self).get(path, params)
+        rows = self.__class__.responses.get(path, [])
+        if (params or {}).get('count'):
+            return len(rows)
+        return [dict(x) for x in rows]
+
+    def post(self, path, data=None):
+        super(MirrorAdapter, self).post(path, data)
+        return 1024
+
+    def delete(self, path, params=None):
+        super(MirrorAdapter, self).delete(path, params)
+        return True
+
+
+class MirrorTest(unittest.TestCase):
+    def setUp(self):
+        self.default_adapter = Account.default_adapter
+        Account.default_adapter = MirrorAdapter
+        MirrorAdapter.responses = {
+            '/fields': [
+                {'field_id': 1, 'shortcut_name': "first_name"}],
+            '/members': [
+                {'member_id': 200, 'email': "Test1@example.com",
+                 'member_status_id': "a",
+                 'last_modified_at': "@D:2013-01-01T10:00:00",
+                 'fields': {'first_name': "Emma"}},
+                {'member_id': 201, 'email': "test2@example.com",
+                 'member_status_id': "a",
+                 'last_modified_at': "@D:2013-01-01T11:00:00",
+                 'fields': {'first_name': u"Bob"}}],
+            '/groups': [
+                {'member_group_id': 300, 'group_name': "Test Group"}],
+            '/groups/300/members': [{'member_id': 201}],
+            '/mailings': [{'mailing_id': 400, 'name': "Test Mailing"}],
+            '/searches': [{'search_id': 500, 'name': "Test Search"}]
+        }
+        self.account = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy")
+        self.mirror = Mirror(self.account)
+
+    def tearDown(self):
+        self.mirror.close()
+        Account.default_adapter = self.default_adapter
+
+    def test_can_sync_every_collection(self):
+        self.mirror.sync()
+
+        self.assertEqual(
+            "Test1@example.com",
+            self.mirror.member_by_email("test1@example.com")['email'])
+        self.assertEqual(
+            "2013-01-01T11:00:00",
+            self.mirror.member(201)['last_modified_at'])
+        self.assertEqual([201], self.mirror.members_of_group(300))
+        self.assertEqual([300], self.mirror.groups_of_member(201))
+        self.assertEqual([200], self.mirror.members_with_field('first_name', "Emma"))
+        self.assertEqual("Bob", self.mirror.field_value(201, 'first_name'))
+        self.assertEqual(
+            [(400, "Test Mailing")],
+            self.mirror.query("SELECT mailing_id, name FROM mailings"))
+        self.assertEqual(
+            [(500, "Test Search")],
+            self.mirror.query("SELECT search_id, name FROM searches"))
+
+    def test_later_syncs_fetch_only_modified_members(self):
+        self.mirror.sync_members()
+        MirrorAdapter.responses['/searches/1024/members'] = [
+            {'member_id': 201, 'email': "test2@example.com",
+             'member_status_id': "a",
+             'last_modified_at': "@D:2013-01-01T12:00:00",
+             'fields': {'first_name': "Robert"}}]
+        adapter = self.account.adapter
+        adapter.calls = []
+
+        count = self.mirror.sync_members()
+
+        self.assertEqual(1, count)
+        self.assertNotIn(('GET', '/members', {}), adapter.calls)
+        self.assertEqual('POST', adapter.calls[0][0])
+        self.assertIn(('DELETE', '/searches/1024', {}), adapter.calls)
+        self.assertEqual(('GET', '/members', {'count': True}), adapter.calls[-1])
+        self.assertEqual("Robert", self.mirror.field_value(201, 'first_name'))
+        self.assertEqual("Emma", self.mirror.field_value(200, 'first_name'))
+        self.assertEqual(
+            datetime(2013, 1, 1, 12), self.mirror._watermark('members'))
+
+    def test_later_syncs_drop_deleted_members(self):
+        self.mirror.sync()
+        MirrorAdapter.responses['/members'] = \
+            MirrorAdapter.responses['/members'][:1]
+        MirrorAdapter.responses['/searches/1024/members'] = []
+
+        self.mirror.sync_members()
+
+        self.assertIsNotNone(self.mirror.member(200))
+        self.assertIsNone(self.mirror.member(201))
+        self.assertIsNone(self.mirror.field_value(201, 'first_name'))
+        self.assertEqual([], self.mirror.members_of_group(300))
+
+    def test_full_resyncs_replace_groups_and_memberships(self):
+        self.mirror.sync_groups()
+        MirrorAdapter.responses['/groups/300/members'] = [{'member_id': 200}]
+
+        self.mirror.sync_groups(full=True)
+
+        self.assertEqual([200], self.mirror.members_of_group(300))
+        self.assertEqual([], self.mirror.groups_of_member(201))
+
+    def test_later_syncs_refresh_only_modified_memberships(self):
+        self.mirror.sync()
+        MirrorAdapter.responses['/searches/1024/members'] = [
+            {'member_id': 200, 'email': "test1@example.com",
+             'member_status_id': "a",
+             'last_modified_at': "@D:2013-01-01T12:00:00"}]
+        MirrorAdapter.responses['/members/200/groups'] = [
+            {'member_group_id': 300}]
+        adapter = self.account.adapter
+        adapter.calls = []
+
+        self.mirror.sync()
+
+        self.assertNotIn('/groups/300/members', [x[1] for x in adapter.calls])
+        self.assertIn('/members/200/groups', [x[1] for x in adapter.calls])
+        self.assertEqual([200, 201], self.mirror.members_of_group(300))
+
+    def test_missing_rows_are_none(self):
+        self.assertIsNone(self.mirror.member(999))
+        self.assertIsNone(self.mirror.member_by_email("nobody@example.com"))
+        self.assertIsNone(self.mirror.field_value(999, 'first_name'))
+
+    def test_can_find_members_matching_a_query(self):
+        self.mirror.sync_members()
+
+        self.assertEqual([201], self.mirror.find(
+            q.eq('member_field:first_name', "Bob")))
+        self.assertEqual([200], self.mirror.find(
+            q.lt('last_modified_at', "2013-01-01T10:30:00")))
@@ -35,4 +35,14 @@ class MockAdapter(AbstractAdapter):
         self._capture('DELETE', path, params if params else {})
         if self.__class__.raised:
             raise self.__class__.raised
-        return self.__class__.expected
\ No newline at end of file
+        return self.__class__.expected
+
+
+class RecordingAdapter(MockAdapter):
+    def __init__(self, *args, **kwargs):
+        super(RecordingAdapter, self).__init__(*args, **kwargs)
+        self.calls = []
+
+    def _capture(self, method, path, params):
+        super(RecordingAdapter, self)._capture(method, path, params)
+        self.calls.append(self.call)
@@ -1,7 +1,10 @@
+from datetime import datetime, timedelta
+import threading
 import unittest
 from emma.adapter.requests_adapter import RequestsAdapter
 from emma import exceptions as ex
-from emma.enumerations import GroupType, MemberStatus, MailingStatus, MailingType
+from emma.enumerations import (GroupType, ImportStatus, MemberStatus,
+                               MailingStatus, MailingType)
 from emma.model.account import (Account, AccountFieldCollection,
                                   AccountImportCollection,
                                   AccountGroupCollection,
@@ -14,12 +17,12 @@ from emma.model.field import Field
 from emma.model.group import Group
 from emma.model.mailing import Mailing
 from emma.model.member_import import MemberImport
-from emma.model.member import Member
+from emma.model.member import Member, MemberRecord
 from emma.model.search import Search
 from emma.model.trigger import Trigger
 from emma.model.webhook import WebHook
 from emma.model.automation import Workflow
-from tests.model import MockAdapter
+from tests.model import MockAdapter, RecordingAdapter
 
 
 class AccountDefaultAdapterTest(unittest.TestCase):
@@ -61,6 +64,14 @@ class AccountFieldCollectionTest(unittest.TestCase):
         MockAdapter.expected = [{'field_id': 201}]
         self.assertIsInstance(self.fields.fetch_all(), dict)
         self.assertEqual(self.fields.account.adapter.called, 1)
+
+    def test_fetch_all_runs_in_a_span(self):
+        MockAdapter.expected = [{'field_id': 201}]
+        spans = []
+        self.fields.account.adapter.after_span.append(spans.append)
+        self.fields.fetch_all()
+        self.assertEqual(
+            ["AccountFieldCollection.fetch_all"], [x.name for x in spans])
         self.assertEqual(
             self.fields.account.adapter.call,
             ('GET', '/fields', {}))
@@ -179,6 +190,70 @@ class AccountFieldCollectionTest(unittest.TestCase):
             ["first_name", "last_name", "work_phone"]
         )
 
+    def test_field_collection_caches_shortcut_names(self):
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"},
+            {'field_id': 201, 'shortcut_name': "last_name"}]
+        shortcuts = self.fields.shortcut_names()
+        self.assertEqual(frozenset(["first_name", "last_name"]), shortcuts)
+        self.assertIs(shortcuts, self.fields.shortcut_names())
+        self.assertEqual(self.fields.account.adapter.called, 1)
+
+    def test_shortcut_names_are_not_cached_when_empty(self):
+        MockAdapter.expected = []
+        self.assertEqual(frozenset(), self.fields.shortcut_names())
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"}]
+
+        self.assertEqual(frozenset(["first_name"]), self.fields.shortcut_names())
+        self.assertEqual(self.fields.account.adapter.called, 2)
+
+    def test_shortcut_names_refresh_when_fields_are_reloaded(self):
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"}]
+        self.fields.shortcut_names()
+        MockAdapter.expected = [
+            {'field_id': 201, 'shortcut_name': "last_name"}]
+        self.fields._dict = {}
+
+        self.fields.fetch_all()
+
+        self.assertEqual(frozenset(["last_name"]), self.fields.shortcut_names())
+
+    def test_shortcut_names_refresh_when_a_field_is_added(self):
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"}]
+        self.fields.shortcut_names()
+        MockAdapter.expected = 201
+
+        self.fields.factory({'shortcut_name': "last_name"}).save()
+
+        self.assertEqual(
+            frozenset(["first_name", "last_name"]),
+            self.fields.shortcut_names())
+
+    def test_shortcut_names_refresh_when_a_field_is_deleted(self):
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"},
+            {'field_id': 201, 'shortcut_name': "last_name"}]
+        self.fields.shortcut_names()
+        MockAdapter.expected = True
+
+        del(self.fields[201])
+
+        self.assertEqual(frozenset(["first_name"]), self.fields.shortcut_names())
+
+    def test_shortcut_names_refresh_when_a_field_is_renamed(self):
+        MockAdapter.expected = [
+            {'field_id': 200, 'shortcut_name': "first_name"}]
+        self.fields.shortcut_names()
+        MockAdapter.expected = True
+
+        self.fields[200]['shortcut_name'] = "given_name"
+        self.fields[200].save()
+
+        self.assertEqual(frozenset(["given_name"]), self.fields.shortcut_names())
+
     def test_can_delete_a_single_group_with_del(self):
         # Setup
         MockAdapter.expected = True
@@ -535,6 +610,49 @@ class AccountMemberCollectionTest(unittest.TestCase):
 
         self.assertEqual(self.members.account.adapter.called, 1)
 
+    def test_iter_all_streams_members(self):
+        # Setup
+        MockAdapter.expected = [{'member_id': 201}, {'member_id': 204}]
+
+        members = self.members.iter_all(deleted=True)
+        self.assertEqual(self.members.account.adapter.called, 0)
+
+        members = list(members)
+        self.assertEqual(2, len(members))
+        self.assertIsInstance(members[0], Member)
+        self.assertEqual(self.members.account.adapter.called, 1)
+        self.assertEqual(
+            self.members.account.adapter.call,
+            ('GET', '/members', {"deleted":True}))
+
+    def test_iter_all_does_not_populate_collection(self):
+        # Setup
+        MockAdapter.expected = [{'member_id': 201}]
+
+        list(self.members.iter_all())
+
+        self.assertEqual(0, len(self.members))
+
+    def test_iter_records_streams_compact_records(self):
+        # Setup
+        MockAdapter.expected = [
+            {'member_id': 201, 'email': "test01@example.org",
+             'fields': {'first_name': "Emma"}},
+            {'member_id': 204, 'email': "test02@example.org",
+             'fields': {'first_name': "Myers"}}]
+
+        records = list(self.members.iter_records())
+
+        self.assertEqual(self.members.account.adapter.called, 1)
+        self.assertEqual(
+            self.members.account.adapter.call,
+            ('GET', '/members', {}))
+        self.assertEqual(2, len(records))
+        self.assertIsInstance(records[0], MemberRecord)
+        self.assertEqual("Myers", records[1]['first_name'])
+        self.assertIs(records[0]._layout, records[1]._layout)
+        self.assertEqual(0, len(self.members))
+
     def test_members_collection_object_can_be_accessed_like_a_dictionary(self):
         # Setup
         MockAdapter.expected = [{'member_id': 201}]
@@ -756,6 +874,59 @@ class AccountMemberCollectionTest(unittest.TestCase):
 
         self.assertEqual(self.members.account.adapter.called, 1)
 
+    def test_fetch_one_by_email_uses_fetched_members(self):
+        # Setup
+        MockAdapter.expected = [
+            {'member_id': 200, 'email': "test01@example.com"},
+            {'member_id': 201, 'email': "Test02@Example.com"}]
+        self.members.fetch_all()
+
+        member = self.members.find_one_by_email("test02@example.COM")
+
+        self.assertEqual(member['member_id'], 201)
+        self.assertIs(member, self.members._dict[201])
+        self.assertEqual(self.members.account.adapter.called, 1)
+
+    def test_email_index_follows_item_assignment(self):
+        self.members[300] = Member(
+            self.members.account,
+            {'member_id': 300, 'email': "test@example.com"})
+
+        self.assertEqual(
+            300, self.members.find_one_by_email("TEST@example.com")['member_id'])
+        self.assertEqual(self.members.account.adapter.called, 0)
+
+    def test_email_index_follows_email_changes(self):
+        self.members[300] = Member(
+            self.members.account,
+            {'member_id': 300, 'email': "old@example.com"})
+
+        self.members[300]['email'] = "new@example.com"
+
+        self.assertEqual(
+            300, self.members.find_one_by_email("new@example.com")['member_id'])
+        self.assertEqual(self.members.account.adapter.called, 0)
+        MockAdapter.expected = None
+        self.assertIsNone(self.members.find_one_by_email("old@example.com"))
+        self.assertEqual(self.members.account.adapter.called, 1)
+
+    def test_email_index_follows_deletes(self):
+        # Setup
+        MockAdapter.expected = [
+            {'member_id': 200, 'email': "test01@example.com"},
+            {'member_id': 201, 'email': "test02@example.com"}]
+        self.members.fetch_all()
+        MockAdapter.expected = True
+        self.members.delete([201])
+        MockAdapter.expected = None
+
+        self.assertIsNone(self.members.find_one_by_email("test02@example.com"))
+        self.assertEqual(self.members.account.adapter.call,
+            ('GET', '/members/email/test02@example.com', {}))
+        self.assertIsNotNone(
+            self.members.find_one_by_email("test01@example.com"))
+        self.assertEqual(self.members.account.adapter.called, 3)
+
     def test_dictionary_access_lazy_loads_by_email(self):
         # Setup
         MockAdapter.expected = {'member_id': 201, 'email': "test@example.com"}
@@ -888,10 +1059,16 @@ class AccountMemberCollectionTest(unittest.TestCase):
             }),
             201: Member(self.members.account, {
                 'member_id': 201,
-                'email': "test2@example.com",
-                'first_name': "Emma"
+                'email': "test2@example.com"
+            }),
+            202: Member(self.members.account, {
+                'member_id': 202,
+                'email': "test3@example.com",
+                'first_name': "Unchanged"
             })
         }
+        self.members[200]['does_not_exist'] = "Still does not exist"
+        self.members[201]['first_name'] = "Emma"
 
         # Perform update
         import_id = self.members.save()
@@ -931,6 +1108,8 @@ class AccountMemberCollectionTest(unittest.TestCase):
             })
         }
 
+        self.members[200]['does_not_exist'] = "Still does not exist"
+
         # Perform add & update
         import_id = self.members.save([
             self.members.factory({
@@ -959,6 +1138,62 @@ class AccountMemberCollectionTest(unittest.TestCase):
             }
         ))
 
+    def test_can_add_members_in_bulk_skips_unmodified_members(self):
+        MockAdapter.expected = {'import_id': 1024}
+        self.members._dict = {
+            200: Member(self.members.account, {
+                'member_id': 200,
+                'email': "test1@example.com"
+            })
+        }
+
+        import_id = self.members.save()
+
+        self.assertIsNone(import_id)
+        self.assertEqual(self.members.account.adapter.called, 0)
+
+    def test_can_add_members_in_bulk_sends_given_members_in_full(self):
+        MockAdapter.expected = {'import_id': 1024}
+        self.members.account.fields._dict = {
+            2000: {'shortcut_name': "first_name"}
+        }
+
+        import_id = self.members.save([
+            self.members.factory({
+                'member_id': 5,
+                'email': "a@b.com",
+                'first_name': "X"
+            })
+        ])
+
+        self.assertEqual({'import_id': 1024}, import_id)
+        self.assertEqual(self.members.account.adapter.call, (
+            'POST',
+            '/members',
+            {'members': [{'member_id': 5, 'email': "a@b.com",
+                          'fields': {'first_name': "X"}}]}
+        ))
+
+    def test_can_add_members_in_bulk_marks_members_clean(self):
+        MockAdapter.expected = {'import_id': 1024}
+        self.members.account.fields._dict = {
+            2000: {'shortcut_name': "first_name"}
+        }
+        self.members._dict = {
+            200: Member(self.members.account, {
+                'member_id': 200,
+                'email': "test1@example.com"
+            })
+        }
+        self.members[200]['first_name'] = "Emma"
+
+        self.members.save()
+        import_id = self.members.save()
+
+        self.assertIsNone(import_id)
+        self.assertEqual(self.members.account.adapter.called, 1)
+        self.assertFalse(self.members[200].is_dirty())
+
     def test_can_add_members_in_bulk6(self):
         # Setup
         MockAdapter.expected = {'import_id': 1024}
@@ -1456,6 +1691,204 @@ class AccountMemberCollectionTest(unittest.TestCase):
         ))
 
 
+class AccountMemberCollectionBulkSaveTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = RecordingAdapter
+        self.members = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy").members
+        self.members.account.fields._dict = {
+            2000: {'shortcut_name': "first_name"}
+        }
+
+    def tearDown(self):
+        Account.default_adapter = MockAdapter
+
+    def test_bulk_save_with_nothing_to_save(self):
+        self.assertEqual([], self.members.bulk_save())
+        self.assertEqual(self.members.account.adapter.called, 0)
+
+    def test_bulk_save_splits_members_into_chunks(self):
+        MockAdapter.expected = {'import_id': 1024}
+        members = [self.members.factory({'email': "test%s@example.com" % x})
+                   for x in range(7)]
+
+        import_ids = self.members.bulk_save(
+            members, filename="bulk", group_ids=[1025], chunk_size=3,
+            max_workers=2)
+
+        self.assertEqual([1024, 1024, 1024], import_ids)
+        calls = self.members.account.adapter.calls
+        self.assertEqual(3, len(calls))
+        self.assertTrue(all(x[:2] == ('POST', '/members') for x in calls))
+        self.assertEqual(
+            [x.extract() for x in members],
+            [y for x in calls for y in x[2]['members']])
+        self.assertEqual([3, 3, 1], [len(x[2]['members']) for x in calls])
+        self.assertTrue(all(x[2]['filename'] == "bulk" for x in calls))
+        self.assertTrue(all(x[2]['group_ids'] == [1025] for x in calls))
+
+    def test_bulk_save_includes_modified_cached_members(self):
+        MockAdapter.expected = {'import_id': 1024}
+        self.members._dict = {
+            200: Member(self.members.account,
+                        {'member_id': 200, 'email': "test@example.com"}),
+            201: Member(self.members.account,
+                        {'member_id': 201, 'email': "test2@example.com"})}
+        self.members[200]['first_name'] = "Emma"
+
+        import_ids = self.members.bulk_save(
+            [self.members.factory({'email': "new@example.com"})],
+            chunk_size=1)
+
+        self.assertEqual(2, len(import_ids))
+        self.assertEqual(
+            [[{'email': "new@example.com"}],
+             [{'member_id': 200, 'email': "test@example.com",
+               'fields': {'first_name': "Emma"}}]],
+            [x[2]['members'] for x in self.members.account.adapter.calls])
+
+    def test_bulk_save_can_wait_for_imports_to_finish(self):
+        MockAdapter.expected = {
+            'import_id': 1024,
+            'status': ImportStatus.Ok,
+            'import_finished': "@D:2013-01-01T12:00:00"}
+
+        import_ids = self.members.bulk_save(
+            [self.members.factory({'email': "test@example.com"})],
+            wait=True, poll_interval=0)
+
+        self.assertEqual([1024], import_ids)
+        self.assertEqual(
+            ('GET', '/members/imports/1024', {}),
+            self.members.account.adapter.calls[-1])
+        self.assertTrue(self.members.account.imports[1024].is_finished())
+
+    def test_bulk_save_stops_waiting_after_the_timeout(self):
+        MockAdapter.expected = {'import_id': 1024, 'status': ImportStatus.Ok}
+
+        with self.assertRaises(ex.ImportTimeoutError):
+            self.members.bulk_save(
+                [self.members.factory({'email': "test@example.com"})],
+                wait=True, poll_interval=0, timeout=0)
+        self.assertFalse(self.members.account.imports[1024].is_finished())
+
+    def test_bulk_save_reports_imports_not_accepted(self):
+        MockAdapter.expected = {'import_id': 1024}
+        adapter = self.members.account.adapter
+        post = adapter.post
+        adapter.post = lambda path, data=None: (
+            None if data['members'][0]['email'] == "bad@example.com"
+            else post(path, data))
+        members = [self.members.factory({'email': x}) for x in
+                   ("good@example.com", "bad@example.com")]
+        for member in members:
+            member['first_name'] = "Emma"
+
+        with self.assertRaises(ex.MemberImportError):
+            self.members.bulk_save(members, chunk_size=1)
+        self.assertEqual([False, True], [x.is_dirty() for x in members])
+
+
+class SyncAdapter(RecordingAdapter):
+    members = []
+
+    def get(self, path, params=None):
+        super(SyncAdapter, self).get(path, params)
+        return [dict(x) for x in self.__class__.members]
+
+    def post(self, path, data=None):
+        super(SyncAdapter, self).post(path, data)
+        return 1024
+
+    def delete(self, path, params=None):
+        super(SyncAdapter, self).delete(path, params)
+        return True
+
+
+class AccountMemberCollectionSyncTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = SyncAdapter
+        self.members = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy").members
+
+    def tearDown(self):
+        Account.default_adapter = MockAdapter
+
+    def test_first_sync_loads_every_member(self):
+        SyncAdapter.members = [
+            {'member_id': 200, 'email': "test1@example.com",
+             'last_modified_at': "@D:2013-01-01T10:00:00"},
+            {'member_id': 201, 'email': "test2@example.com",
+             'last_modified_at': "@D:2013-01-01T11:00:00"}]
+
+        fetched = self.members.sync()
+
+        self.assertEqual(set([200, 201]), set(fetched))
+        self.assertEqual(
+            [('GET', '/members', {})], self.members.account.adapter.calls)
+        self.assertEqual(2, len(self.members))
+        self.assertEqual(datetime(2013, 1, 1, 11), self.members.synced_at)
+
+    def test_later_syncs_fetch_only_modified_members(self):
+        self.members._dict = {
+            200: Member(self.members.account, {
+                'member_id': 200, 'email': "test1@example.com",
+                'last_modified_at': "@D:2013-01-01T10:00:00"}),
+            201: Member(self.members.account, {
+                'member_id': 201, 'email': "test2@example.com",
+                'last_modified_at': "@D:2013-01-01T11:00:00"})}
+        SyncAdapter.members = [
+            {'member_id': 200, 'email': "test1@example.com",
+             'last_modified_at': "@D:2013-01-01T09:00:00"},
+            {'member_id': 201, 'email': "changed@example.com",
+             'last_modified_at': "@D:2013-01-01T12:00:00"},
+            {'member_id': 202, 'email': "test3@example.com",
+             'last_modified_at': "@D:2013-01-01T12:30:00"}]
+
+        fetched = self.members.sync()
+
+        calls = self.members.account.adapter.calls
+        self.assertEqual(
+            [('POST', '/searches'), ('GET', '/searches/1024/members'),
+             ('DELETE', '/searches/1024')],
+            [x[:2] for x in calls])
+        self.assertEqual('last_modified_at', calls[0][2]['criteria'][0])
+        self.assertEqual('in last', calls[0][2]['criteria'][1])
+        self.assertEqual(set([201, 202]), set(fetched))
+        self.assertEqual(3, len(self.members))
+        self.assertIs(fetched[201], self.members.find_one_by_email(
+            "changed@example.com"))
+        self.assertEqual(datetime(2013, 1, 1, 12, 30), self.members.synced_at)
+        self.assertNotIn(1024, self.members.account.searches)
+
+    def test_fetch_modified_since_counts_days_in_utc(self):
+        SyncAdapter.members = []
+
+        self.members.fetch_modified_since(
+            datetime.utcnow() - timedelta(days=3, hours=1))
+
+        criteria = self.members.account.adapter.calls[0][2]['criteria']
+        self.assertEqual({'day': 5}, criteria[2])
+
+    def test_sync_keeps_members_with_unsaved_changes(self):
+        self.members._dict = {
+            200: Member(self.members.account, {
+                'member_id': 200, 'email': "test1@example.com"})}
+        self.members[200]['email'] = "local@example.com"
+        SyncAdapter.members = [
+            {'member_id': 200, 'email': "remote@example.com",
+             'last_modified_at': "@D:2013-01-01T12:00:00"}]
+
+        self.members.sync(since=datetime(2013, 1, 1))
+
+        self.assertEqual("local@example.com", self.members[200]['email'])
+        self.assertEqual(datetime(2013, 1, 1, 12), self.members.synced_at)
+
+
 class AccountMailingCollectionTest(unittest.TestCase):
     def setUp(self):
         Account.default_adapter = MockAdapter
@@ -2077,3 +2510,101 @@ class AccountWorkflowTest(unittest.TestCase):
         self.workflows.find_one_by_workflow_id(201)
         self.assertEqual(self.workflows.account.adapter.called, 1)
 
+
+
+class LookupAdapter(RecordingAdapter):
+    """Serves single items by path, recording each lookup"""
+    responses = {}
+
+    def __init__(self, *args, **kwargs):
+        super(LookupAdapter, self).__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        with self.lock:
+            super(LookupAdapter, self).get(path, params)
+        raw = self.__class__.responses.get(path)
+        return dict(raw) if raw is not None else None
+
+
+class AccountFindManyTest(unittest.TestCase):
+    def setUp(self):
+        self.default_adapter = Account.default_adapter
+        Account.default_adapter = LookupAdapter
+        LookupAdapter.responses = {
+            '/members/200': {'member_id': 200, 'email': "test1@example.com"},
+            '/members/201': {'member_id': 201, 'email': "test2@example.com"},
+            '/members/email/test1@example.com':
+                {'member_id': 200, 'email': "test1@example.com"},
+            '/groups/300': {'member_group_id': 300, 'group_name': "Test"},
+            '/mailings/400': {'mailing_id': 400, 'name': "Test"},
+            '/searches/500': {'search_id': 500, 'name': "Test"}}
+        self.account = Account(
+            account_id="100", public_key="xxx", private_key="yyy")
+        self.adapter = self.account.adapter
+
+    def tearDown(self):
+        Account.default_adapter = self.default_adapter
+
+    def test_finds_members_by_id_with_explicit_misses(self):
+        found = self.account.members.find_many_by_member_ids(
+            [200, "201", 202, 200], max_workers=4)
+
+        self.assertEqual([200, 201, 202], list(found))
+        self.assertIsInstance(found[200], Member)
+        self.assertEqual("test2@example.com", found[201]['email'])
+        self.assertIsNone(found[202])
+        self.assertEqual(
+            ['/members/200', '/members/201', '/members/202'],
+            sorted(x[1] for x in self.adapter.calls))
+        self.assertIs(found[200], self.account.members[200])
+
+    def test_serves_loaded_members_without_requests(self):
+        self.account.members.find_one_by_member_id(200)
+        self.adapter.calls = []
+
+        found = self.account.members.find_many_by_member_ids(
+            [200, 201], deleted=True)
+
+        self.assertEqual(
+            [('GET', '/members/201', {'deleted': True})], self.adapter.calls)
+        self.assertEqual(200, found[200]['member_id'])
+
+    def test_finds_members_by_email(self):
+        self.account.members.find_one_by_member_id(201)
+        self.adapter.calls = []
+
+        found = self.account.members.find_many_by_emails(
+            ["test1@example.com", "TEST2@example.com", "null@example.com",
+             "test1@example.com"])
+
+        self.assertEqual(200, found["test1@example.com"]['member_id'])
+        self.assertEqual(201, found["TEST2@example.com"]['member_id'])
+        self.assertIsNone(found["null@example.com"])
+        self.assertEqual(
+            ['/members/email/null@example.com',
+             '/members/email/test1@example.com'],
+            sorted(x[1] for x in self.adapter.calls))
+
+    def test_finds_differently_cased_emails_once(self):
+        found = self.account.members.find_many_by_emails(
+            ["test1@example.com", "TEST1@example.com"], max_workers=2)
+
+        self.assertEqual(["test1@example.com", "TEST1@example.com"], list(found))
+        self.assertIs(found["test1@example.com"], found["TEST1@example.com"])
+        self.assertEqual(1, len(self.adapter.calls))
+
+    def test_finds_groups_mailings_and_searches(self):
+        groups = self.account.groups.find_many_by_group_ids([300, 301])
+        mailings = self.account.mailings.find_many_by_mailing_ids(["400"])
+        searches = self.account.searches.find_many_by_search_ids([500, 501])
+
+        self.assertIsInstance(groups[300], Group)
+        self.assertIsNone(groups[301])
+        self.assertIsInstance(mailings[400], Mailing)
+        self.assertIsInstance(searches[500], Search)
+        self.assertIsNone(searches[501])
+
+    def test_nothing_to_find(self):
+        self.assertEqual({}, self.account.members.find_many_by_member_ids([]))
+        self.assertEqual([], self.adapter.calls)
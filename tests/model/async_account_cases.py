@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+import unittest
+from emma.adapter.async_adapter import AsyncAdapter
+from emma.model.account import Account, AccountMemberCollection
+from emma.model.async_account import AsyncAccount, AsyncModel
+from emma.model.group import Group
+from emma.model.member import Member
+from tests.model import MockAdapter
+
+
+class SlowAdapter(MockAdapter):
+    """
+    Records how many requests were in flight at once, optionally holding
+    each until a number of them are
+    """
+    def __init__(self, *args, **kwargs):
+        super(SlowAdapter, self).__init__(*args, **kwargs)
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.barrier = None
+
+    def get(self, path, params=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return {'member_id': int(path.split('/')[-1])}
+
+
+class AsyncAccountTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = MockAdapter
+        self.account = AsyncAccount(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy")
+
+    def tearDown(self):
+        self.account.close()
+
+    def test_adapter_wraps_the_account_adapter(self):
+        self.assertIsInstance(self.account.adapter, AsyncAdapter)
+        self.assertIs(self.account.adapter.adapter, self.account.account.adapter)
+
+    def test_collections_are_wrapped(self):
+        self.assertIsInstance(self.account.members, AsyncModel)
+        self.assertIsInstance(
+            self.account.members.model, AccountMemberCollection)
+
+    def test_can_fetch_all_members(self):
+        MockAdapter.expected = [{'member_id': 201}, {'member_id': 204}]
+        members = asyncio.run(self.account.members.fetch_all())
+        self.assertEqual([201, 204], sorted(members))
+        self.assertIsInstance(members[201], AsyncModel)
+        self.assertIsInstance(members[201].model, Member)
+        self.assertEqual(2, len(self.account.members))
+        self.assertEqual(
+            self.account.adapter.adapter.call,
+            ('GET', '/members', {}))
+
+    def test_can_add_group_members_by_id(self):
+        MockAdapter.expected = {'member_group_id': 1024}
+
+        async def run():
+            grp = await self.account.groups.find_one_by_group_id(1024)
+            self.assertIsInstance(grp.model, Group)
+            MockAdapter.expected = True
+            return await grp.members.add_by_id([200, 201])
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertEqual(
+            self.account.adapter.adapter.call,
+            ('PUT', '/groups/1024/members', {'member_ids': [200, 201]}))
+
+    def test_can_iterate_all_members(self):
+        MockAdapter.expected = [{'member_id': x} for x in range(3)]
+
+        async def run():
+            return [x['member_id'] async for x in self.account.members.iter_all()]
+
+        self.assertEqual([0, 1, 2], asyncio.run(run()))
+        self.assertEqual(0, len(self.account.members))
+
+    def test_item_access_does_not_fetch(self):
+        with self.assertRaises(KeyError):
+            self.account.members[123]
+        self.assertEqual(0, self.account.adapter.adapter.called)
+
+    def test_closes_without_blocking_the_loop(self):
+        async def run():
+            async with self.account as account:
+                return account
+
+        asyncio.run(run())
+        self.assertTrue(self.account.adapter.executor._shutdown)
+
+
+class AsyncAccountConcurrencyTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = SlowAdapter
+        self.account = AsyncAccount(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy",
+            max_workers=4)
+
+    def tearDown(self):
+        Account.default_adapter = MockAdapter
+        self.account.close()
+
+    def test_lookups_on_one_collection_overlap(self):
+        # Raises BrokenBarrierError unless all four are in flight at once
+        self.account.adapter.adapter.barrier = threading.Barrier(4, timeout=5)
+
+        async def run():
+            return await asyncio.gather(*[
+                self.account.members.find_one_by_member_id(x)
+                for x in range(1, 5)])
+
+        members = asyncio.run(run())
+        self.assertEqual([1, 2, 3, 4], [x['member_id'] for x in members])
+        self.assertEqual(4, self.account.adapter.adapter.peak)
+        self.assertEqual(4, len(self.account.members))
+
+    def test_calls_on_different_models_run_concurrently(self):
+        async def run():
+            return await asyncio.gather(
+                self.account.members.find_one_by_member_id(1),
+                self.account.groups.find_one_by_group_id(2))
+
+        asyncio.run(run())
+        self.assertEqual(2, self.account.adapter.adapter.peak)
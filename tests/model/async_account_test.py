@@ -0,0 +1,9 @@
+import sys
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest("asyncio support requires Python 3.7+")
+
+# Kept apart, as async syntax does not compile on older interpreters
+from tests.model.async_account_cases import (
+    AsyncAccountConcurrencyTest, AsyncAccountTest)
@@ -164,6 +164,30 @@ class GroupMemberCollectionTest(unittest.TestCase):
         self.assertIsInstance(self.members[204], Member)
         self.assertEqual(self.members[204]['email'], "test04@example.org")
 
+    def test_can_iterate_all_members(self):
+        del(self.members.group['member_group_id'])
+        with self.assertRaises(ex.NoGroupIdError):
+            self.members.iter_all()
+        self.assertEqual(self.members.group.account.adapter.called, 0)
+
+    def test_can_iterate_all_members2(self):
+        # Setup
+        MockAdapter.expected = [
+            {'member_id': 200, 'email': "test01@example.org"},
+            {'member_id': 201, 'email': "test02@example.org"}
+        ]
+
+        members = list(self.members.iter_all())
+
+        self.assertEqual(self.members.group.account.adapter.called, 1)
+        self.assertEqual(
+            self.members.group.account.adapter.call,
+            ('GET', '/groups/200/members', {}))
+        self.assertEqual(2, len(members))
+        self.assertIsInstance(members[0], Member)
+        self.assertEqual(members[1]['email'], "test02@example.org")
+        self.assertEqual(0, len(self.members))
+
     def test_can_add_members_by_status(self):
         del(self.members.group['member_group_id'])
         with self.assertRaises(ex.NoGroupIdError):
@@ -28,6 +28,13 @@ class MemberImportTest(unittest.TestCase):
         self.assertIsInstance(self.emma_import['import_started'], datetime)
         self.assertIsInstance(self.emma_import['import_finished'], datetime)
 
+    def test_can_tell_when_an_import_is_finished(self):
+        self.assertTrue(self.emma_import.is_finished())
+        del(self.emma_import['import_finished'])
+        self.assertFalse(self.emma_import.is_finished())
+        self.emma_import['status'] = ImportStatus.Error
+        self.assertTrue(self.emma_import.is_finished())
+
     def test_can_access_member_collection(self):
         self.assertIsInstance(self.emma_import.members, ImportMemberCollection)
 
@@ -1,3 +1,4 @@
+import collections
 from datetime import datetime
 import unittest
 from emma import exceptions as ex
@@ -5,7 +6,7 @@ from emma.enumerations import DeliveryType, MemberStatus, MemberChangeType
 from emma.model import SERIALIZED_DATETIME_FORMAT
 from emma.model.account import Account
 from emma.model.member import (Member, MemberGroupCollection,
-                                 MemberMailingCollection)
+                                 MemberMailingCollection, MemberRecord)
 from emma.model.group import Group
 from emma.model.mailing import Mailing
 from tests.model import MockAdapter
@@ -37,6 +38,17 @@ class MemberTest(unittest.TestCase):
         self.assertIsInstance(self.member['member_since'], datetime)
         self.assertIsNone(self.member.get('deleted_at'))
 
+    def test_creates_child_collections_on_first_use(self):
+        self.assertNotIn('groups', self.member.__dict__)
+        self.assertNotIn('mailings', self.member.__dict__)
+
+        groups = self.member.groups
+
+        self.assertIsInstance(groups, MemberGroupCollection)
+        self.assertIs(groups, self.member.groups)
+        self.assertIs(self.member, groups.member)
+        self.assertNotIn('mailings', self.member.__dict__)
+
     def test_can_represent_a_member(self):
         self.assertEqual(
             "<Member" + repr(self.member._dict) + ">",
@@ -190,6 +202,8 @@ class MemberTest(unittest.TestCase):
                 'first_name':"Emma",
                 'member_status_id': MemberStatus.Active
             })
+        mbr['first_name'] = "Emma"
+        mbr['member_status_id'] = MemberStatus.Active
         MockAdapter.expected = False
 
         with self.assertRaises(ex.MemberUpdateError):
@@ -216,6 +230,8 @@ class MemberTest(unittest.TestCase):
                 'fields': {'first_name':"Emma"},
                 'member_status_id': MemberStatus.Active
             })
+        mbr['first_name'] = "Emma"
+        mbr['member_status_id'] = MemberStatus.Active
         MockAdapter.expected = True
         result = mbr.save()
         self.assertIsNone(result)
@@ -260,6 +276,77 @@ class MemberTest(unittest.TestCase):
                 }
             ))
 
+    def test_can_save_a_member7(self):
+        mbr = Member(
+            self.member.account,
+            {
+                'member_id': 200,
+                'email':"test@example.com",
+                'fields': {'first_name':"Emma", 'last_name':"Myers"},
+                'member_status_id': MemberStatus.Active
+            })
+        mbr.account.members._dict[200] = mbr
+        mbr['last_name'] = "Smith"
+        MockAdapter.expected = True
+
+        mbr.save()
+
+        self.assertEqual(mbr.account.adapter.called, 1)
+        self.assertEqual(mbr.account.adapter.call,
+            (
+                'PUT',
+                '/members/200',
+                {
+                    'member_id': 200,
+                    'email':"test@example.com",
+                    'fields': {'last_name': "Smith"}
+                }
+            ))
+        self.assertFalse(mbr.is_dirty())
+
+    def test_can_save_a_member8(self):
+        mbr = Member(
+            self.member.account,
+            {
+                'member_id': 200,
+                'email':"test@example.com",
+                'fields': {'first_name':"Emma"},
+                'member_status_id': MemberStatus.Active
+            })
+        mbr.account.members._dict[200] = mbr
+        MockAdapter.expected = True
+
+        mbr.save()
+
+        self.assertEqual(mbr.account.adapter.called, 0)
+
+    def test_can_save_a_member9(self):
+        # Not loaded by the collection, so its changes are unknown
+        mbr = Member(
+            self.member.account,
+            {
+                'member_id': 200,
+                'email':"test@example.com",
+                'fields': {'first_name':"Emma"},
+                'member_status_id': MemberStatus.Active
+            })
+        MockAdapter.expected = True
+
+        mbr.save()
+
+        self.assertEqual(mbr.account.adapter.called, 1)
+        self.assertEqual(mbr.account.adapter.call,
+            (
+                'PUT',
+                '/members/200',
+                {
+                    'member_id': 200,
+                    'email':"test@example.com",
+                    'fields': {'first_name': "Emma"},
+                    'status_to': MemberStatus.Active
+                }
+            ))
+
     def test_can_delete_a_member(self):
         mbr = Member(self.member.account, {'email':"test@example.com"})
 
@@ -304,6 +391,56 @@ class MemberTest(unittest.TestCase):
         self.assertTrue(mbr.is_deleted())
 
 
+class MemberRecordTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = MockAdapter
+        self.record = MemberRecord(
+            Account(account_id="100", public_key="xxx", private_key="yyy"),
+            {
+                'member_id': 1000,
+                'email': "test@example.com",
+                'member_since': "@D:2013-01-02T03:04:05",
+                'deleted_at': None,
+                'fields': {'first_name': "Emma"}
+            }
+        )
+
+    def test_can_read_values(self):
+        self.assertEqual(1000, self.record['member_id'])
+        self.assertEqual("Emma", self.record['first_name'])
+        self.assertEqual(datetime(2013, 1, 2, 3, 4, 5),
+                         self.record['member_since'])
+        self.assertIsNone(self.record.get('deleted_at'))
+        self.assertNotIn('fields', self.record)
+        self.assertEqual(5, len(self.record))
+        with self.assertRaises(KeyError):
+            self.record['last_name']
+
+    def test_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.record['first_name'] = "Changed"
+        with self.assertRaises(AttributeError):
+            self.record.extra = True
+
+    def test_is_a_mapping(self):
+        self.assertIsInstance(self.record, collections.Mapping)
+        self.assertEqual(
+            set(['member_id', 'email', 'member_since', 'deleted_at',
+                 'first_name']),
+            set(self.record.keys()))
+        self.assertIn(('first_name', "Emma"), self.record.items())
+        self.assertEqual(self.record, dict(self.record.items()))
+        self.assertNotEqual(self.record, {'member_id': 1000})
+        self.assertEqual("none", self.record.get('last_name', "none"))
+
+    def test_can_convert_to_a_member(self):
+        mbr = self.record.to_member()
+
+        self.assertIsInstance(mbr, Member)
+        self.assertEqual(dict(self.record), mbr._dict)
+        self.assertFalse(mbr.is_dirty())
+
+
 class MemberGroupCollectionTest(unittest.TestCase):
     def setUp(self):
         Account.default_adapter = MockAdapter
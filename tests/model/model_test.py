@@ -0,0 +1,78 @@
+from datetime import datetime
+import unittest
+from emma import model
+from emma.model import BaseApiModel, parse_datetime, parse_datetime_alt
+from emma.model.account import Account
+from emma.model.member import Member
+from tests.model import MockAdapter
+
+
+class ParseDatetimeTest(unittest.TestCase):
+    def test_parses_serialized_format(self):
+        self.assertEqual(
+            datetime(2013, 1, 2, 3, 4, 5),
+            parse_datetime("@D:2013-01-02T03:04:05"))
+
+    def test_parses_alt_format(self):
+        self.assertEqual(
+            datetime(2013, 1, 2, 3, 4, 5, 678000),
+            parse_datetime_alt("2013-01-02 03:04:05.678"))
+        self.assertEqual(
+            datetime(2013, 1, 2, 3, 4, 5, 678901),
+            parse_datetime_alt("2013-01-02 03:04:05.678901"))
+
+    def test_rejects_malformed_values(self):
+        for value in ("@D:2013-01-02 03:04:05", "@D:2013-13-02T03:04:05",
+                      "2013-01-02T03:04:05"):
+            with self.assertRaises(ValueError):
+                parse_datetime(value)
+        with self.assertRaises(ValueError):
+            parse_datetime_alt("2013-01-02 03:04:05")
+
+    def test_remembers_repeated_values(self):
+        first = parse_datetime("@D:2014-05-06T07:08:09")
+        self.assertIs(first, parse_datetime("@D:2014-05-06T07:08:09"))
+
+    def test_bounds_the_memo(self):
+        size = model.DATETIME_MEMO_SIZE
+        model.DATETIME_MEMO_SIZE = 2
+        try:
+            for second in range(5):
+                parse_datetime("@D:2015-01-01T00:00:%02d" % second)
+            self.assertTrue(len(parse_datetime.memo) <= 2)
+        finally:
+            model.DATETIME_MEMO_SIZE = size
+
+
+class LazyDatetimesTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = MockAdapter
+        BaseApiModel.lazy_datetimes = True
+        self.account = Account(
+            account_id="100", public_key="xxx", private_key="yyy")
+
+    def tearDown(self):
+        BaseApiModel.lazy_datetimes = False
+
+    def test_parses_on_first_access(self):
+        mbr = Member(self.account, {
+            'member_id': 200,
+            'member_since': "@D:2013-01-02T03:04:05",
+            'deleted_at': None})
+
+        self.assertEqual("@D:2013-01-02T03:04:05", mbr._dict['member_since'])
+        self.assertEqual(datetime(2013, 1, 2, 3, 4, 5), mbr['member_since'])
+        self.assertEqual(datetime(2013, 1, 2, 3, 4, 5),
+                         mbr._dict['member_since'])
+        self.assertIsNone(mbr['deleted_at'])
+        self.assertFalse(mbr.is_dirty())
+
+    def test_assignment_replaces_unparsed_value(self):
+        mbr = Member(self.account, {
+            'member_id': 200,
+            'member_since': "@D:2013-01-02T03:04:05"})
+        now = datetime.now()
+
+        mbr['member_since'] = now
+
+        self.assertEqual(now, mbr['member_since'])
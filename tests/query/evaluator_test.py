@@ -0,0 +1,114 @@
+from datetime import datetime
+import unittest
+from emma.model.account import Account
+from emma.model.member import Member
+from emma.query.evaluator import Evaluator, as_datetime, evaluate, shift
+from emma.query.factory import QueryFactory as q
+from tests.model import MockAdapter
+
+
+class EvaluatorTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = MockAdapter
+        self.account = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy")
+        self.members = [
+            Member(self.account, {
+                'member_id': 200, 'email': "emma@example.com",
+                'member_since': "@D:2013-01-01T10:00:00",
+                'fields': {'first_name': "Emma", 'age': 30,
+                           'colors': ["red", "blue"]}}),
+            Member(self.account, {
+                'member_id': 201, 'email': "bob@example.org",
+                'member_since': "@D:2013-03-15T10:00:00",
+                'fields': {'first_name': "Bob", 'age': 45}}),
+            {'member_id': 202, 'email': "ann@example.com",
+             'member_since': "2013-03-30T09:00:00", 'first_name': "Ann"}
+        ]
+        self.now = datetime(2013, 4, 1)
+
+    def matching(self, query):
+        return [x['member_id'] for x in
+                evaluate(query, self.members, self.now)]
+
+    def test_can_compare_values(self):
+        self.assertEqual([200], self.matching(
+            q.eq('member_field:first_name', "Emma")))
+        self.assertEqual([200], self.matching(q.lt('age', 40)))
+        self.assertEqual([201], self.matching(q.gt('age', 40)))
+        self.assertEqual([200, 201], self.matching(q.between('age', 30, 45)))
+        self.assertEqual([200, 202], self.matching(
+            q.is_in('first_name', ["Emma", "Ann"])))
+
+    def test_matches_alternative_dates_as_dates(self):
+        self.assertEqual([200], self.matching(
+            q.eq('member_since', "2013-01-01T10:00:00")))
+        self.assertEqual([200, 201], self.matching(
+            q.eq('member_since', "2013-01-01T10:00:00")
+            | q.eq('member_since', "@D:2013-03-15T10:00:00")))
+        self.assertEqual([200, 202], self.matching(
+            q.is_in('member_since', [datetime(2013, 1, 1, 10),
+                                     "2013-03-30 09:00:00"])))
+
+    def test_can_compare_dates(self):
+        self.assertEqual([200], self.matching(
+            q.lt('member_since', "2013-02-01")))
+        self.assertEqual([201, 202], self.matching(
+            q.between('member_since', "2013-03-01", "2013-04-01")))
+        self.assertEqual([201, 202], self.matching(
+            q.datematch('member_since', {'year': 2013, 'month': 3})))
+
+    def test_can_match_relative_dates(self):
+        self.assertEqual([201, 202], self.matching(
+            q.in_last('member_since', {'month': 1})))
+        self.assertEqual([202], self.matching(
+            q.in_last('member_since', {'day': 7})))
+        self.assertEqual([], self.matching(
+            q.in_next('member_since', {'year': 1})))
+
+    def test_measures_relative_dates_from_utc(self):
+        before = datetime.utcnow()
+        now = Evaluator(q.in_last('member_since', {'day': 1})).now
+        self.assertTrue(before <= now <= datetime.utcnow())
+
+    def test_can_match_wildcards_and_arrays(self):
+        self.assertEqual([200, 202], self.matching(
+            q.contains('email', "*@EXAMPLE.com")))
+        self.assertEqual([200], self.matching(q.any('colors', "blue")))
+
+    def test_can_combine_queries(self):
+        self.assertEqual([202], self.matching(
+            q.contains('email', "*.com") & ~q.eq('first_name', "Emma")))
+        self.assertEqual([200, 201], self.matching(
+            q.eq('first_name', "Emma") | q.gt('age', 40)))
+
+    def test_missing_fields_never_match(self):
+        self.assertEqual([], self.matching(q.eq('last_name', None)))
+        self.assertEqual([202], self.matching(~q.gt('age', 0)))
+
+    def test_can_evaluate_tuples(self):
+        evaluator = Evaluator(("first_name", "eq", "Bob"), self.now)
+        self.assertFalse(evaluator(self.members[0]))
+        self.assertTrue(evaluator(self.members[1]))
+
+    def test_rejects_zip_radius(self):
+        with self.assertRaises(ValueError):
+            Evaluator(q.zip_radius('member_field:zip', 10, "97202"))
+
+
+class ShiftTest(unittest.TestCase):
+    def test_clamps_to_the_end_of_a_month(self):
+        self.assertEqual(
+            datetime(2013, 2, 28), shift(datetime(2013, 3, 31), {'month': 1}, -1))
+        self.assertEqual(
+            datetime(2014, 1, 8), shift(datetime(2013, 12, 1), {'month': 1, 'week': 1}))
+
+    def test_reads_dates(self):
+        self.assertEqual(datetime(2013, 1, 2), as_datetime("2013-01-02"))
+        self.assertEqual(datetime(2013, 1, 2), as_datetime(u"2013-01-02"))
+        self.assertEqual(
+            datetime(2013, 1, 2, 3, 4, 5), as_datetime("@D:2013-01-02T03:04:05"))
+        self.assertIsNone(as_datetime("soon"))
+        self.assertIsNone(as_datetime(12))
@@ -0,0 +1,72 @@
+import unittest
+from emma.query.factory import QueryFactory as q
+from emma.query.optimizer import optimize
+
+
+class OptimizeTest(unittest.TestCase):
+    def test_flattens_nested_operators(self):
+        query = (q.eq('a', 1) & q.eq('b', 2)) & (q.eq('c', 3) & q.eq('d', 4))
+        self.assertTupleEqual(
+            ("and", ("a", "eq", 1), ("b", "eq", 2), ("c", "eq", 3),
+             ("d", "eq", 4)),
+            optimize(query))
+
+    def test_pushes_down_negations(self):
+        query = ~(q.eq('a', 1) | ~q.gt('b', 2))
+        self.assertTupleEqual(
+            ("and", ("not", ("a", "eq", 1)), ("b", "gt", 2)),
+            optimize(query))
+
+    def test_merges_equalities_into_in(self):
+        query = q.eq('a', 1) | q.gt('b', 2) | q.eq('a', 3) | q.is_in('a', [3, 4])
+        self.assertTupleEqual(
+            ("or", ("a", "in", 1, 3, 4), ("b", "gt", 2)),
+            optimize(query))
+
+    def test_keeps_equalities_under_and(self):
+        query = q.eq('a', 1) & q.eq('a', 3)
+        self.assertTupleEqual(
+            ("and", ("a", "eq", 1), ("a", "eq", 3)), optimize(query))
+
+    def test_collapses_ranges(self):
+        self.assertTupleEqual(
+            ("a", "between", 3, 8),
+            optimize(q.between('a', 1, 8) & q.between('a', 3, 10)))
+        self.assertTupleEqual(
+            ("or", ("a", "between", 1, 10), ("a", "between", 20, 30)),
+            optimize(q.between('a', 5, 10) | q.between('a', 20, 30)
+                     | q.between('a', 1, 6)))
+
+    def test_compares_range_dates_as_dates(self):
+        self.assertTupleEqual(
+            ("d", "between", "2013-05-01", "@D:2013-06-01T00:00:00"),
+            optimize(q.between('d', "@D:2013-03-01T00:00:00",
+                               "@D:2013-06-01T00:00:00")
+                     & q.between('d', "2013-05-01", "2013-12-31")))
+
+    def test_leaves_empty_or_mixed_ranges(self):
+        self.assertTupleEqual(
+            ("and", ("a", "between", 1, 3), ("a", "between", 5, 8)),
+            optimize(q.between('a', 1, 3) & q.between('a', 5, 8)))
+        self.assertTupleEqual(
+            ("and", ("a", "between", 1, 3), ("a", "between", "x", "y")),
+            optimize(q.between('a', 1, 3) & q.between('a', "x", "y")))
+
+    def test_drops_duplicates(self):
+        query = (q.in_last('a', {'day': 1}) & q.eq('b', 2)
+                 & q.in_last('a', {'day': 1}))
+        self.assertTupleEqual(
+            ("and", ("a", "in last", {'day': 1}), ("b", "eq", 2)),
+            optimize(query))
+        self.assertTupleEqual(("b", "eq", 2), optimize(q.eq('b', 2) | q.eq('b', 2)))
+
+    def test_handles_deep_queries(self):
+        query = q.eq('a', 0)
+        for i in range(1, 5000):
+            query = query | q.eq('a', i)
+        self.assertTupleEqual(
+            ("a", "in") + tuple(range(5000)), optimize(query))
+
+    def test_accepts_tuples(self):
+        self.assertTupleEqual(
+            ("a", "eq", 1), optimize(("not", ("not", ("a", "eq", 1)))))
@@ -73,3 +73,18 @@ class NegationQueryTest(unittest.TestCase):
         self.assertTupleEqual(
             ("not", ("first_name", "eq", "TestFirst")),
             query.to_tuple())
+
+
+class LogicalQueryTest(unittest.TestCase):
+    def test_can_serialize_deep_queries(self):
+        query = q.eq('first_name', 0)
+        for i in range(1, 5000):
+            query = query & q.eq('first_name', i)
+        serialized = query.to_tuple()
+        self.assertEqual("and", serialized[0])
+        self.assertTupleEqual(("first_name", "eq", 4999), serialized[2])
+        while serialized[1][0] == "and":
+            serialized = serialized[1]
+        self.assertTupleEqual(
+            ("and", ("first_name", "eq", 0), ("first_name", "eq", 1)),
+            serialized)
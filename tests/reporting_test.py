@@ -1,8 +1,8 @@
 import unittest
 from emma.model.account import Account
 from emma.enumerations import Report, DeliveryType
-from emma import get_report
-from tests.model import MockAdapter
+from emma import get_report, get_reports
+from tests.model import MockAdapter, RecordingAdapter
 
 
 class ReportingTest(unittest.TestCase):
@@ -200,4 +200,58 @@ class ReportingTest(unittest.TestCase):
         self.assertEqual(self.account.adapter.called, 1)
         self.assertEqual(
             self.account.adapter.call,
-            ('GET', '/response/123/shares/overview', {}))
\ No newline at end of file
+            ('GET', '/response/123/shares/overview', {}))
+
+
+class BatchReportingTest(unittest.TestCase):
+    def setUp(self):
+        Account.default_adapter = RecordingAdapter
+        self.account = Account(
+            account_id="100",
+            public_key="xxx",
+            private_key="yyy")
+
+    def tearDown(self):
+        Account.default_adapter = MockAdapter
+
+    def test_can_get_several_reports(self):
+        MockAdapter.expected = []
+        reports = get_reports(self.account, [
+            (Report.SentList, 123),
+            (Report.OpenList, 123),
+            (Report.OpenList, 124),
+            (Report.ClickList, 123, {'unique': True})
+        ], max_workers=3)
+
+        self.assertEqual(4 * [[]], reports)
+        self.assertEqual(self.account.adapter.called, 4)
+        self.assertEqual(
+            [('GET', '/response/123/clicks', {'unique': True}),
+             ('GET', '/response/123/opens', {}),
+             ('GET', '/response/123/sends', {}),
+             ('GET', '/response/124/opens', {})],
+            sorted(self.account.adapter.calls, key=lambda x: x[1]))
+
+    def test_can_get_a_single_report(self):
+        MockAdapter.expected = {'sent': 10}
+        reports = get_reports(self.account, [(Report.MailingSummary, 123)])
+
+        self.assertEqual([{'sent': 10}], reports)
+        self.assertEqual(
+            self.account.adapter.call,
+            ('GET', '/response/123', {}))
+
+    def test_can_get_overlapping_reports(self):
+        class Adapter(RecordingAdapter):
+            def get(self, path, params=None):
+                super(Adapter, self).get(path, params)
+                return [{'unique': bool((params or {}).get('unique'))}]
+
+        self.account.adapter = Adapter()
+        reports = get_reports(self.account, [
+            (Report.ClickList, 123),
+            (Report.ClickList, 123, {'unique': True})], max_workers=2)
+
+        self.assertEqual(
+            [[{'unique': False}], [{'unique': True}]], reports)
+        self.assertEqual(self.account.adapter.called, 2)